@@ -0,0 +1,41 @@
+"""add_production_list_indexes
+
+Revision ID: b5e1c7d2a904
+Revises: 3a3b0b8ac65a
+Create Date: 2026-10-19 10:12:31.418202
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c7d2a904'
+down_revision: Union[str, Sequence[str], None] = '3a3b0b8ac65a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PRODUCTION_INDEXES = {
+    'ix_productions_org_created_at': ['organization_id', 'created_at'],
+    'ix_productions_org_status': ['organization_id', 'status'],
+    'ix_productions_org_payment_status': ['organization_id', 'payment_status'],
+    'ix_productions_org_client': ['organization_id', 'client_id'],
+    'ix_productions_org_deadline': ['organization_id', 'deadline'],
+    'ix_productions_org_due_date': ['organization_id', 'due_date'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in PRODUCTION_INDEXES.items():
+        op.create_index(name, 'productions', columns, unique=False)
+    op.create_index('ix_production_crew_user_production', 'production_crew', ['user_id', 'production_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_production_crew_user_production', table_name='production_crew')
+    for name in reversed(list(PRODUCTION_INDEXES)):
+        op.drop_index(name, table_name='productions')
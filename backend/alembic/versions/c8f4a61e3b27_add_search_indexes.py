@@ -0,0 +1,52 @@
+"""add_search_indexes
+
+Revision ID: c8f4a61e3b27
+Revises: b5e1c7d2a904
+Create Date: 2026-10-19 11:02:47.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f4a61e3b27'
+down_revision: Union[str, Sequence[str], None] = 'b5e1c7d2a904'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# pg_trgm GIN indexes: ILIKE '%q%' and word similarity (%>) on short text columns
+TRIGRAM_INDEXES = {
+    'ix_productions_title_trgm': ('productions', 'title'),
+    'ix_clients_full_name_trgm': ('clients', 'full_name'),
+    'ix_clients_email_trgm': ('clients', 'email'),
+    'ix_clients_cnpj_trgm': ('clients', 'cnpj'),
+    'ix_services_name_trgm': ('services', 'name'),
+}
+
+# tsvector GIN indexes on long text columns; the expression must match
+# app.services.search_service._tsvector exactly
+TEXT_SEARCH_INDEXES = {
+    'ix_productions_notes_tsv': ('productions', 'notes'),
+    'ix_services_description_tsv': ('services', 'description'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)")
+    for name, (table, column) in TEXT_SEARCH_INDEXES.items():
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (to_tsvector('portuguese'::regconfig, coalesce({column}, '')))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in list(TEXT_SEARCH_INDEXES) + list(TRIGRAM_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,93 @@
+"""add_shooting_sessions
+
+Revision ID: d3a9e5f0b172
+Revises: c8f4a61e3b27
+Create Date: 2026-10-19 11:48:05.226930
+
+"""
+from datetime import date, datetime, time, timedelta
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a9e5f0b172'
+down_revision: Union[str, Sequence[str], None] = 'c8f4a61e3b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _session_rows(production_id, organization_id, sessions):
+    """Same rules as production_service.shooting_session_rows (kept local to the migration)."""
+    if isinstance(sessions, str):
+        sessions = json.loads(sessions)
+    rows = []
+    for position, session in enumerate(sessions if isinstance(sessions, list) else []):
+        if not isinstance(session, dict):
+            continue
+        value = session.get('date')
+        if not isinstance(value, str) or len(value) < 10:
+            continue
+        try:
+            day = date.fromisoformat(value[:10])
+        except ValueError:
+            continue
+        starts_at = datetime.combine(day, time.min)
+        rows.append({
+            'production_id': production_id,
+            'organization_id': organization_id,
+            'position': position,
+            'starts_at': starts_at,
+            'ends_at': starts_at + timedelta(days=1),
+            'location': session.get('location') or None,
+        })
+    return rows
+
+
+def upgrade() -> None:
+    """Upgrade schema: normalize productions.shooting_sessions into its own table and backfill it."""
+    shooting_sessions = op.create_table('shooting_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('production_id', sa.Integer(), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('ends_at', sa.DateTime(), nullable=False),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
+    sa.ForeignKeyConstraint(['production_id'], ['productions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_shooting_sessions_id'), 'shooting_sessions', ['id'], unique=False)
+    op.create_index('ix_shooting_sessions_org_starts_at', 'shooting_sessions', ['organization_id', 'starts_at', 'ends_at'], unique=False)
+    op.create_index('ix_shooting_sessions_production', 'shooting_sessions', ['production_id'], unique=False)
+
+    # Range index for calendar overlap queries (btree_gist for the organization_id equality)
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "CREATE INDEX ix_shooting_sessions_org_range ON shooting_sessions "
+        "USING gist (organization_id, tsrange(starts_at, ends_at))"
+    )
+
+    # Backfill from the JSON column
+    connection = op.get_bind()
+    productions = connection.execute(sa.text(
+        "SELECT id, organization_id, shooting_sessions FROM productions WHERE shooting_sessions IS NOT NULL"
+    ))
+    rows = []
+    for production_id, organization_id, sessions in productions:
+        rows.extend(_session_rows(production_id, organization_id, sessions))
+    if rows:
+        op.bulk_insert(shooting_sessions, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the normalized table (the JSON column still holds every session)."""
+    op.execute("DROP INDEX IF EXISTS ix_shooting_sessions_org_range")
+    op.drop_index('ix_shooting_sessions_production', table_name='shooting_sessions')
+    op.drop_index('ix_shooting_sessions_org_starts_at', table_name='shooting_sessions')
+    op.drop_index(op.f('ix_shooting_sessions_id'), table_name='shooting_sessions')
+    op.drop_table('shooting_sessions')
@@ -0,0 +1,41 @@
+"""add_production_tombstones
+
+Revision ID: e7b2c4d8f915
+Revises: d3a9e5f0b172
+Create Date: 2026-10-19 12:35:19.870412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c4d8f915'
+down_revision: Union[str, Sequence[str], None] = 'd3a9e5f0b172'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: delta sync index on productions and tombstones for deletions."""
+    op.create_index('ix_productions_org_updated_at', 'productions', ['organization_id', 'updated_at', 'id'], unique=False)
+    op.create_table('production_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('production_id', sa.Integer(), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_production_tombstones_id'), 'production_tombstones', ['id'], unique=False)
+    op.create_index('ix_production_tombstones_org_deleted_at', 'production_tombstones', ['organization_id', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_production_tombstones_org_deleted_at', table_name='production_tombstones')
+    op.drop_index(op.f('ix_production_tombstones_id'), table_name='production_tombstones')
+    op.drop_table('production_tombstones')
+    op.drop_index('ix_productions_org_updated_at', table_name='productions')
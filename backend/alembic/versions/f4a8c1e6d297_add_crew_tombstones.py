@@ -0,0 +1,36 @@
+"""add_crew_tombstones
+
+Revision ID: f4a8c1e6d297
+Revises: e7b2c4d8f915
+Create Date: 2026-10-19 15:02:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a8c1e6d297'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c4d8f915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: per-profile tombstones for crew members removed from a production."""
+    op.add_column('production_tombstones', sa.Column('profile_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'production_tombstones_profile_id_fkey', 'production_tombstones', 'profiles',
+        ['profile_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_index('ix_production_tombstones_profile_deleted_at', 'production_tombstones', ['profile_id', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_production_tombstones_profile_deleted_at', table_name='production_tombstones')
+    op.drop_constraint('production_tombstones_profile_id_fkey', 'production_tombstones', type_='foreignkey')
+    op.drop_column('production_tombstones', 'profile_id')
@@ -1,35 +1,26 @@
 import logging
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
+from app.core.admission import remember_tenant
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.models.user import User, Profile, Organization
 from app.services.billing_service import BillingService
 
 logger = logging.getLogger(__name__)
 
-# Import Supabase client for token validation
-try:
-    from supabase import create_client, Client
-    SUPABASE_AVAILABLE = True
-
-    def get_supabase_client() -> Client:
-        """Get Supabase client for token validation"""
-        return create_client(settings.supabase_url, settings.supabase_service_role_key)
-
-except ImportError:
-    SUPABASE_AVAILABLE = False
-    def get_supabase_client():
-        raise Exception("Supabase client not available - cannot validate JWT tokens")
+# Shared Supabase client for token validation (created at startup, see app.core.lifespan)
+from app.core.supabase_client import SUPABASE_AVAILABLE, get_supabase_client
 
 security = HTTPBearer()
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> Profile:
@@ -49,8 +40,8 @@ async def get_current_user(
 
     try:
         # Use Supabase client to validate the JWT token
-        supabase = get_supabase_client()
-        auth_response = supabase.auth.get_user(credentials.credentials)
+        supabase = await get_supabase_client()
+        auth_response = await supabase.auth.get_user(credentials.credentials)
 
         if auth_response.user is None:
             logger.error("❌ Supabase user validation failed - no user returned")
@@ -89,6 +80,10 @@ async def get_current_user(
             detail="User account is inactive"
         )
 
+    # Expose the profile to rate limiting and request logging
+    request.state.profile = user_profile
+    remember_tenant(credentials.credentials, user_profile.organization_id)
+
     return user_profile
 
 
@@ -107,6 +102,7 @@ async def get_current_active_admin(
 
 
 async def check_subscription(
+    request: Request,
     current_profile: Profile = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> Organization:
@@ -136,10 +132,14 @@ async def check_subscription(
             detail="Subscription required. Please update your payment method."
         )
 
+    # Expose the organization (plan) to rate limiting
+    request.state.organization = org
+
     return org
 
 
 async def get_current_supabase_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> Profile:
@@ -161,8 +161,8 @@ async def get_current_supabase_user(
 
     try:
         # Use Supabase client to validate the JWT token
-        supabase = get_supabase_client()
-        auth_response = supabase.auth.get_user(credentials.credentials)
+        supabase = await get_supabase_client()
+        auth_response = await supabase.auth.get_user(credentials.credentials)
 
         if auth_response.user is None:
             logger.error("❌ Supabase user validation failed - no user returned")
@@ -201,10 +201,30 @@ async def get_current_supabase_user(
             detail="User account is inactive"
         )
 
+    # Expose the profile to rate limiting and request logging
+    request.state.profile = user_profile
+    remember_tenant(credentials.credentials, user_profile.organization_id)
+
     return user_profile
 
 
+async def get_streaming_supabase_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Profile:
+    """
+    get_current_supabase_user for long-lived responses (Server-Sent Events).
+
+    get_db is a yield dependency, torn down only after the response ends, so a
+    stream would keep its pooled connection checked out for hours. This one
+    loads the profile in its own session, closed before the response starts.
+    """
+    async with AsyncSessionLocal() as db:
+        return await get_current_supabase_user(request, credentials, db)
+
+
 async def check_supabase_subscription(
+    request: Request,
     current_profile: Profile = Depends(get_current_supabase_user),
     db: AsyncSession = Depends(get_db)
 ) -> Organization:
@@ -235,4 +255,7 @@ async def check_supabase_subscription(
             detail="Subscription required. Please update your payment method."
         )
 
+    # Expose the organization (plan) to rate limiting
+    request.state.organization = org
+
     return org
@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
 import logging
 import uuid
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,24 +16,16 @@ from app.models.user import Organization, User, Profile
 from app.schemas.auth import Token, UserCreate, UserLogin, UserResponse
 from app.core.billing_config import SubscriptionStatus
 
-# Import Supabase client (lazy initialization)
-try:
-    from supabase import create_client, Client
-    SUPABASE_AVAILABLE = True
-
-    def get_supabase_client() -> Client:
-        """Get Supabase client with lazy initialization"""
-        return create_client(settings.supabase_url, settings.supabase_service_role_key)
-
-except ImportError:
-    SUPABASE_AVAILABLE = False
-    def get_supabase_client():
-        raise Exception("Supabase client not available")
-    logging.warning("Supabase client not available. Supabase auth features will be disabled.")
+# Shared async Supabase client (created at startup, see app.core.lifespan)
+from app.core import supabase_client
+from app.core.supabase_client import SUPABASE_AVAILABLE
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Logout works without a token (nothing to revoke)
+optional_bearer = HTTPBearer(auto_error=False)
+
 
 @router.post("/register-owner", response_model=UserResponse)
 async def register_owner(
@@ -239,14 +233,8 @@ async def login_supabase(
     logger.debug(f"Attempting Supabase login for user: {user_credentials.username}")
 
     try:
-        # Initialize Supabase client when needed
-        supabase = get_supabase_client()
-
-        # Authenticate with Supabase
-        auth_response = supabase.auth.sign_in_with_password({
-            "email": user_credentials.username,
-            "password": user_credentials.password,
-        })
+        # Authenticate with Supabase (pooled connection, doesn't block the loop)
+        auth_response = await supabase_client.sign_in(user_credentials.username, user_credentials.password)
 
         if auth_response.user is None or auth_response.session is None:
             raise HTTPException(
@@ -329,10 +317,12 @@ async def login_supabase(
 
 
 @router.post("/supabase/logout")
-async def logout_supabase():
+async def logout_supabase(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)
+):
     """
     Logout from Supabase Auth.
-    This invalidates the session on Supabase side.
+    This invalidates the session of the bearer token on Supabase side.
     """
     if not SUPABASE_AVAILABLE:
         raise HTTPException(
@@ -341,11 +331,9 @@ async def logout_supabase():
         )
 
     try:
-        # Initialize Supabase client when needed
-        supabase = get_supabase_client()
-
-        # Sign out from Supabase (this will invalidate the session)
-        supabase.auth.sign_out()
+        # Sign out from Supabase (revokes the session's refresh tokens)
+        if credentials is not None:
+            await supabase_client.sign_out(credentials.credentials)
         return {"message": "Successfully logged out"}
     except Exception as e:
         logger.error(f"Supabase logout failed: {e}")
@@ -0,0 +1,62 @@
+from datetime import date, datetime, time, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.api.deps import check_supabase_subscription, get_current_supabase_user
+from app.core import http_cache
+from app.core.deadlines import deadline
+from app.core.rate_limit import limiter
+from app.db.session import get_db
+from app.models.user import Organization, Profile
+from app.services.calendar_service import fetch_calendar_events
+
+router = APIRouter()
+
+# Largest range a single calendar request may cover
+MAX_CALENDAR_DAYS = 366
+
+
+@router.get("/", response_model=dict)
+@limiter.limit("200/minute")  # Read operations limit
+@deadline(10)  # Up to a year of sessions
+async def get_calendar(
+    request: Request,
+    response: Response,
+    from_date: date = Query(..., alias="from", description="First day (inclusive)"),
+    to_date: date = Query(..., alias="to", description="Last day (inclusive)"),
+    current_profile: Profile = Depends(get_current_supabase_user),
+    db: AsyncSession = Depends(get_db),
+    org: Organization = Depends(check_supabase_subscription)
+) -> dict:
+    """
+    Get shooting sessions, deadlines and due dates between two days.
+
+    Reads only the events in range (index-backed), so the calendar no longer
+    needs the full productions list. Crew members only see productions they
+    are assigned to.
+    """
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days >= MAX_CALENDAR_DAYS:
+        raise HTTPException(status_code=400, detail=f"Calendar range is limited to {MAX_CALENDAR_DAYS} days")
+
+    crew_profile_id = current_profile.id if current_profile.role != "admin" else None
+
+    # Conditional GET: skip the query when nothing changed
+    etag = await http_cache.resource_etag(
+        current_profile.organization_id, "calendar", crew_profile_id, from_date, to_date
+    )
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag)
+    http_cache.set_etag_headers(response, etag)
+
+    events = await fetch_calendar_events(
+        db,
+        current_profile.organization_id,
+        datetime.combine(from_date, time.min),
+        datetime.combine(to_date + timedelta(days=1), time.min),
+        crew_profile_id,
+    )
+
+    return {"from": from_date, "to": to_date, "events": events}
@@ -1,15 +1,19 @@
-from typing import List
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_supabase_user, check_supabase_subscription
+from app.core import http_cache
+from app.core.cache import cache
 from app.db.session import get_db
 from app.models.client import Client
 from app.models.user import Profile, Organization
 from app.schemas.client import ClientCreate
 from app.services.billing_service import BillingService
+from app.services import read_models
+from app.services.import_service import detect_import_format, import_records
 
 router = APIRouter()
 
@@ -40,6 +44,9 @@ async def create_client(
     await db.commit()
     await db.refresh(client)
 
+    # Invalidate cached reads (client data is embedded in productions/dashboard)
+    await cache.invalidate_org(current_profile.organization_id, "client", "created")
+
     return {
         "id": client.id,
         "full_name": client.full_name,
@@ -52,30 +59,66 @@ async def create_client(
     }
 
 
+@router.post("/import", response_model=dict)
+async def import_clients(
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "json"]] = None,
+    current_profile: Profile = Depends(get_current_supabase_user),
+    _org: Organization = Depends(check_supabase_subscription),
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Import clients from a CSV (header row) or JSON (array or NDJSON) upload.
+
+    Rows are validated like POST /clients and inserted in chunks. The plan
+    limit is checked once for the whole upload: rows beyond it are reported
+    as errors, as are invalid rows. Valid rows are committed together.
+    """
+
+    upload_format = detect_import_format(file, format)
+
+    # Check subscription limits once for the whole batch
+    remaining_slots = await BillingService.get_remaining_client_slots(current_profile.organization_id, db)
+
+    report = await import_records(
+        file,
+        upload_format,
+        ClientCreate,
+        Client,
+        current_profile.organization_id,
+        db,
+        capacity=remaining_slots,
+        capacity_error="Limite de clientes atingido para o plano atual."
+    )
+    await db.commit()
+
+    if report.created:
+        # Invalidate cached reads (client data is embedded in productions/dashboard)
+        await cache.invalidate_org(current_profile.organization_id, "client", "created")
+
+    return report.as_dict()
+
+
 @router.get("/", response_model=List[dict])
 async def get_clients(
+    request: Request,
+    response: Response,
     current_profile: Profile = Depends(get_current_supabase_user),
     db: AsyncSession = Depends(get_db),
     org: Organization = Depends(check_supabase_subscription)
 ) -> List[dict]:
     """Get all clients for the current user's organization."""
 
-    # Get only clients from current user's organization (data isolation)
-    result = await db.execute(
-        select(Client).where(Client.organization_id == current_profile.organization_id)
-    )
-    clients = result.scalars().all()
+    # Conditional GET: skip the query when nothing changed
+    etag = await http_cache.resource_etag(current_profile.organization_id, "clients")
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag)
+    http_cache.set_etag_headers(response, etag)
 
-    return [{
-        "id": client.id,
-        "full_name": client.full_name,
-        "email": client.email,
-        "cnpj": client.cnpj,
-        "address": client.address,
-        "phone": client.phone,
-        "organization_id": client.organization_id,
-        "created_at": client.created_at
-    } for client in clients]
+    # Get only clients from current user's organization (data isolation), as Core rows
+    clients = await read_models.fetch_clients(db, current_profile.organization_id)
+
+    return [client.to_dict() for client in clients]
 
 
 @router.put("/{client_id}", response_model=dict)
@@ -110,6 +153,9 @@ async def update_client(
     await db.commit()
     await db.refresh(client)
 
+    # Invalidate cached reads (client data is embedded in productions/dashboard)
+    await cache.invalidate_org(current_profile.organization_id, "client", "updated")
+
     return {
         "id": client.id,
         "full_name": client.full_name,
@@ -147,4 +193,7 @@ async def delete_client(
     await db.delete(client)
     await db.commit()
 
+    # Invalidate cached reads (client data is embedded in productions/dashboard)
+    await cache.invalidate_org(current_profile.organization_id, "client", "deleted")
+
     return {"message": "Client deleted successfully"}
@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_supabase_user
 from app.db.session import get_db
 from app.core.cache import cache, CacheKeys
+from app.core import http_cache
+from app.core.deadlines import deadline
 from app.models.production import Production
 from app.models.production_crew import ProductionCrew
 from app.models.user import Profile
@@ -14,12 +16,24 @@ from app.models.client import Client
 router = APIRouter()
 
 @router.get("/summary")
+@deadline(10)  # Aggregates over the whole organization
 async def get_dashboard_summary(
+    request: Request,
+    response: Response,
     current_profile: Profile = Depends(get_current_supabase_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get dashboard summary based on user role with Redis caching."""
 
+    # Conditional GET: skip the aggregates when nothing changed
+    etag = await http_cache.resource_etag(
+        current_profile.organization_id, "dashboard", current_profile.role,
+        current_profile.id if current_profile.role != "admin" else None
+    )
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag)
+    http_cache.set_etag_headers(response, etag)
+
     if current_profile.role == "admin":
         # Try cache first
         cache_key = CacheKeys.dashboard_summary(current_profile.organization_id)
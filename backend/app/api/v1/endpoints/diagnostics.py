@@ -0,0 +1,171 @@
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status  # type: ignore
+
+from app.core import slow_queries
+from app.core.admission import admission
+from app.core.config import settings
+from app.core.deadlines import deadline_stats
+from app.core.loop_monitor import loop_monitor
+from app.core.memory import GROUP_BY, NoBaseline, memory_stats, memory_tracer
+from app.core.profiler import profile_worker, worker_profile_running
+from app.core.security import verify_diagnostics_token
+
+logger = logging.getLogger(__name__)
+
+
+def require_operator(x_diagnostics_token: Optional[str] = Header(None)) -> None:
+    """
+    Diagnostics see every organization of the worker: operators only.
+
+    Tenant roles don't count (every organization owner is an "admin"); the
+    caller needs the DIAGNOSTICS_TOKEN in the X-Diagnostics-Token header.
+    """
+    if not verify_diagnostics_token(x_diagnostics_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Diagnostics need the operator token")
+
+
+router = APIRouter(dependencies=[Depends(require_operator)])
+
+
+@router.get("/stats")
+async def stats() -> dict:
+    """Admission queue and tenants, per-route timeouts, loop lag and memory of this worker."""
+    worker_stats = {
+        "admission": admission.stats(),
+        "deadlines": deadline_stats.snapshot(),
+        "event_loop": loop_monitor.stats(),
+    }
+    if settings.memory_diagnostics_enabled:
+        worker_stats["memory"] = memory_stats()
+    return worker_stats
+
+
+@router.post("/profile")
+async def profile(
+    seconds: float = Query(10, gt=0, description="How long to sample"),
+    interval_ms: float = Query(None, ge=1, le=100, description="Sampling interval (default PROFILE_INTERVAL_MS)")
+) -> Response:
+    """
+    Sample the event loop of the worker serving this request for `seconds`.
+
+    Returns a speedscope file (https://www.speedscope.app) covering every
+    request the worker handled meanwhile. Other workers are not sampled;
+    repeat the call to reach them. To profile a single request instead, send
+    it with the `X-Profile: 1` and `X-Diagnostics-Token` headers.
+    """
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {settings.profile_max_seconds}")
+    if worker_profile_running():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running on this worker")
+
+    logger.info(f"Worker profile started for {seconds:g} s")
+    document = await profile_worker(seconds, (interval_ms or settings.profile_interval_ms) / 1000)
+    return Response(
+        content=json.dumps(document),
+        media_type="application/json",
+        headers={"Content-Disposition": 'attachment; filename="worker.speedscope.json"'}
+    )
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000)
+) -> dict:
+    """
+    Statements slower than SLOW_QUERY_THRESHOLD_MS on the worker serving this
+    request, newest first, with their route, organization, bind parameter
+    types and (for a sample of SELECTs) their generic plan, without parameter values.
+    """
+    if not settings.slow_query_log_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="The slow query log is disabled")
+    return {
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "queries": slow_queries.recent(limit),
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries() -> Response:
+    """Empty this worker's slow query log."""
+    slow_queries.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _require_memory_diagnostics() -> None:
+    if not settings.memory_diagnostics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Memory diagnostics are disabled")
+
+
+def _check_group_by(group_by: str) -> None:
+    if group_by not in GROUP_BY:
+        raise HTTPException(status_code=400, detail=f"group_by must be one of {', '.join(GROUP_BY)}")
+
+
+@router.get("/memory")
+async def memory() -> dict:
+    """RSS, GC counters and pauses, tracemalloc totals and in-memory state sizes of this worker."""
+    _require_memory_diagnostics()
+    return memory_stats()
+
+
+@router.post("/memory/baseline")
+async def start_memory_tracing(
+    frames: int = Query(None, ge=1, le=100, description="Traceback depth per allocation (default TRACEMALLOC_FRAMES)")
+) -> dict:
+    """
+    Start tracemalloc on this worker (if needed) and take the baseline snapshot.
+
+    Then exercise the worker (e.g. call GET /api/v1/productions/ a few times)
+    and read GET /memory/diff. Tracing slows every allocation down: stop it
+    with DELETE /memory/baseline when done.
+    """
+    _require_memory_diagnostics()
+    await asyncio.to_thread(memory_tracer.start, frames or settings.tracemalloc_frames)
+    logger.info("Memory baseline taken")
+    return {"tracing": True, "baseline_at": memory_tracer.baseline_at}
+
+
+@router.get("/memory/diff")
+async def memory_diff(
+    group_by: str = Query("lineno", description="lineno, filename or traceback"),
+    limit: int = Query(25, ge=1, le=500)
+) -> dict:
+    """Allocation sites that grew the most since the baseline."""
+    _require_memory_diagnostics()
+    _check_group_by(group_by)
+    baseline_at = memory_tracer.baseline_at
+    try:
+        diff = await asyncio.to_thread(memory_tracer.diff, group_by, limit)
+    except NoBaseline:  # Also when DELETE /memory/baseline ran meanwhile
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="No baseline: POST /memory/baseline first")
+    return {"baseline_at": baseline_at, "stats": diff}
+
+
+@router.get("/memory/top")
+async def memory_top(
+    group_by: str = Query("lineno", description="lineno, filename or traceback"),
+    limit: int = Query(25, ge=1, le=500)
+) -> dict:
+    """Largest live allocation sites traced since tracing started."""
+    _require_memory_diagnostics()
+    _check_group_by(group_by)
+    if memory_tracer.baseline is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Tracing is off: POST /memory/baseline first")
+    try:
+        return {"stats": await asyncio.to_thread(memory_tracer.top, group_by, limit)}
+    except NoBaseline:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Tracing is off: POST /memory/baseline first")
+
+
+@router.delete("/memory/baseline", status_code=status.HTTP_204_NO_CONTENT)
+async def stop_memory_tracing() -> Response:
+    """Stop tracemalloc and drop the baseline."""
+    _require_memory_diagnostics()
+    memory_tracer.stop()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, Depends, Request  # type: ignore
+from fastapi.responses import StreamingResponse  # type: ignore
+
+from app.api.deps import get_streaming_supabase_user
+from app.core.events import event_hub
+from app.models.user import Profile
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Comment line sent when idle, so proxies keep the connection open
+HEARTBEAT_SECONDS = 15
+
+# Client reconnect delay advertised to EventSource (milliseconds)
+RETRY_MS = 5000
+
+
+def _format_event(event: dict, event_id: int) -> str:
+    """Server-Sent Events frame: event type, id and JSON data."""
+    return f"id: {event_id}\nevent: {event['resource']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/")
+async def stream_events(
+    request: Request,
+    current_profile: Profile = Depends(get_streaming_supabase_user)
+):
+    """
+    Stream the organization's change events (Server-Sent Events).
+
+    Each event names the resource that changed (production, item, expense,
+    crew, client, service, user), the action and the production id when there is
+    one; it carries no data, so clients refetch what they display
+    (GET /productions/changes for lists, the dashboard for totals). A
+    "resync" event means events were missed. After reconnecting, clients
+    should also resync, since events are not replayed.
+
+    Needs the Authorization header, so browsers must use a fetch-based SSE
+    client rather than EventSource.
+    """
+    org_id = current_profile.organization_id
+
+    async def event_stream():
+        async with event_hub.subscribe(org_id) as queue:
+            yield f"retry: {RETRY_MS}\n\n"
+            yield _format_event({"resource": "ready", "action": "ready", "production_id": None}, 0)
+            event_id = 0
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": heartbeat\n\n"
+                    continue
+                event_id += 1
+                yield _format_event(event, event_id)
+
+    logger.info(f"Event stream opened for org {org_id}")
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+            "Content-Encoding": "identity",  # Compression middleware would buffer events
+        }
+    )
@@ -1,14 +1,17 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_admin
+from app.core.cache import cache
 from app.db.session import get_db
 from app.models.expense import Expense
 from app.models.production import Production
 from app.models.user import User
-from app.schemas.expense import ExpenseCreate, ExpenseResponse
-from app.services.production_service import calculate_production_totals
+from app.schemas.expense import ExpenseBulkCreate, ExpenseCreate, ExpenseResponse
+from app.services.production_service import calculate_production_totals, production_in_organization
 
 router = APIRouter()
 
@@ -22,16 +25,8 @@ async def create_expense(
 ) -> ExpenseResponse:
     """Create a new expense for a production."""
 
-    # Verify production exists and belongs to user's organization
-    result = await db.execute(
-        select(Production).where(
-            Production.id == production_id,
-            Production.organization_id == current_user.organization_id
-        )
-    )
-    production = result.scalar_one_or_none()
-
-    if production is None:
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_user.organization_id, db):
         raise HTTPException(status_code=404, detail="Production not found")
 
     # Create expense
@@ -51,9 +46,52 @@ async def create_expense(
     await calculate_production_totals(production_id, db)
     await db.commit()  # Commit the calculated totals
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "expense", "created", production_id)
+
     return ExpenseResponse.from_orm(expense)
 
 
+@router.post("/productions/{production_id}/expenses/bulk", response_model=List[ExpenseResponse])
+async def create_expenses_bulk(
+    production_id: int,
+    bulk_data: ExpenseBulkCreate,
+    current_user: User = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_db)
+) -> List[ExpenseResponse]:
+    """
+    Create several expenses for a production in one request.
+
+    Ownership is validated once, expenses are inserted with a single
+    multi-row INSERT and production totals are recalculated and committed once.
+    """
+
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_user.organization_id, db):
+        raise HTTPException(status_code=404, detail="Production not found")
+
+    rows = [{
+        "production_id": production_id,
+        "name": expense_data.name,
+        "value": expense_data.value,
+        "category": expense_data.category,
+        "paid_by": expense_data.paid_by
+    } for expense_data in bulk_data.expenses]
+
+    # Single multi-row INSERT ... RETURNING, rows in payload order
+    result = await db.scalars(insert(Expense).returning(Expense, sort_by_parameter_order=True), rows)
+    expenses = result.all()
+
+    # Recalculate production totals once for the whole batch (including profit)
+    await calculate_production_totals(production_id, db)
+    await db.commit()
+
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "expense", "created", production_id)
+
+    return [ExpenseResponse.from_orm(expense) for expense in expenses]
+
+
 @router.delete("/productions/{production_id}/expenses/{expense_id}")
 async def delete_expense(
     production_id: int,
@@ -84,4 +122,7 @@ async def delete_expense(
     await calculate_production_totals(production_id, db)
     await db.commit()  # Commit the calculated totals
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "expense", "deleted", production_id)
+
     return {"message": "Expense deleted successfully"}
@@ -1,5 +1,4 @@
 from typing import List, Dict, Any
-import stripe
 from pydantic import BaseModel
 
 from fastapi import APIRouter, Depends, HTTPException  # type: ignore
@@ -10,6 +9,7 @@ from app.api.deps import get_current_active_admin, get_current_user
 from app.db.session import get_db
 from app.models.user import Organization, User
 from app.core.config import settings
+from app.core.stripe_client import get_stripe
 from app.core.billing_config import SubscriptionPlan
 
 router = APIRouter()
@@ -20,9 +20,6 @@ class CreateCheckoutSessionRequest(BaseModel):
     success_url: str
     cancel_url: str
 
-# Configure Stripe
-stripe.api_key = settings.stripe_secret_key
-
 
 @router.get("/settings")
 async def get_organization_settings(
@@ -129,6 +126,7 @@ async def create_checkout_session(
     else:
         raise HTTPException(status_code=400, detail="Invalid subscription plan selected.")
 
+    stripe = get_stripe()
     try:
         checkout_session = stripe.checkout.Session.create(
             customer_email=organization.email, # Or customer ID if already exists
@@ -160,6 +158,7 @@ async def get_payment_history(
     db: AsyncSession = Depends(get_db)
 ) -> List[Dict[str, Any]]:
     """Get payment history for the current user's organization."""
+    stripe = get_stripe()
     try:
         # Get organization
         result = await db.execute(select(Organization).where(Organization.id == current_user.organization_id))
@@ -169,7 +168,6 @@ async def get_payment_history(
             return []
 
         # Get invoices from Stripe
-        stripe.api_key = settings.stripe_secret_key
         invoices = stripe.Invoice.list(
             customer=organization.billing_id,
             limit=10
@@ -200,6 +198,7 @@ async def cancel_subscription(
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, str]:
     """Cancel the current user's subscription."""
+    stripe = get_stripe()
     try:
         # Get organization
         result = await db.execute(select(Organization).where(Organization.id == current_user.organization_id))
@@ -209,7 +208,6 @@ async def cancel_subscription(
             raise HTTPException(status_code=404, detail="No active subscription found")
 
         # Cancel subscription in Stripe
-        stripe.api_key = settings.stripe_secret_key
 
         # Find the subscription
         subscriptions = stripe.Subscription.list(customer=organization.billing_id)
@@ -243,6 +241,7 @@ async def create_portal_session(
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, str]:
     """Create a Stripe Customer Portal session for billing management."""
+    stripe = get_stripe()
     try:
         # Get organization
         result = await db.execute(select(Organization).where(Organization.id == current_user.organization_id))
@@ -252,7 +251,6 @@ async def create_portal_session(
             raise HTTPException(status_code=404, detail="No billing information found")
 
         # Create portal session
-        stripe.api_key = settings.stripe_secret_key
         portal_session = stripe.billing_portal.Session.create(
             customer=organization.billing_id,
             return_url=f"{settings.frontend_url}/dashboard/settings"
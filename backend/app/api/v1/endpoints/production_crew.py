@@ -1,18 +1,23 @@
 import logging
+import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_current_active_admin, get_current_user
+from app.core.cache import cache
 from app.db.session import get_db
-from app.models.production import Production
 from app.models.production_crew import ProductionCrew
 from app.models.user import Profile, User
-from app.schemas.production_crew import ProductionCrewCreate, ProductionCrewResponse
-from app.services.production_service import calculate_production_totals
+from app.schemas.production_crew import (
+    CrewConflictCheck, CrewConflictsResponse, ProductionCrewBulkCreate, ProductionCrewCreate, ProductionCrewResponse
+)
+from app.services.production_service import calculate_production_totals, production_in_organization
+from app.services.scheduling_service import ensure_no_crew_conflicts, find_crew_conflicts, session_intervals
+from app.services.sync_service import record_crew_removed
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -22,21 +27,14 @@ router = APIRouter()
 async def add_crew_member(
     production_id: int,
     crew_data: ProductionCrewCreate,
+    reject_conflicts: bool = Query(True, description="Answer 409 if the member is booked for overlapping sessions (false allows double-booking)"),
     current_profile: Profile = Depends(get_current_active_admin),
     db: AsyncSession = Depends(get_db)
 ) -> ProductionCrewResponse:
     """Add a crew member to a production."""
 
-    # Verify production exists and belongs to user's organization
-    result = await db.execute(
-        select(Production).where(
-            Production.id == production_id,
-            Production.organization_id == current_profile.organization_id
-        )
-    )
-    production = result.scalar_one_or_none()
-
-    if production is None:
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_profile.organization_id, db):
         raise HTTPException(status_code=404, detail="Production not found")
 
     # Verify user exists and belongs to the same organization
@@ -63,6 +61,13 @@ async def add_crew_member(
     if existing_assignment:
         raise HTTPException(status_code=400, detail="User is already assigned to this production")
 
+    if reject_conflicts:
+        try:
+            profile_id = uuid.UUID(str(crew_data.user_id))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="Invalid user_id")
+        await ensure_no_crew_conflicts(db, current_profile.organization_id, production_id, [profile_id])
+
     # Create crew assignment
     new_crew = ProductionCrew(
         production_id=production_id,
@@ -84,6 +89,9 @@ async def add_crew_member(
     await calculate_production_totals(production_id, db)
     await db.commit()  # Commit the calculated totals
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "crew", "created", production_id)
+
     # Return dict to avoid Pydantic validation issues with SQLAlchemy objects
     return {
         "id": refreshed_crew.id,
@@ -95,24 +103,141 @@ async def add_crew_member(
     }
 
 
-@router.get("/productions/{production_id}/crew", response_model=List[ProductionCrewResponse])
-async def get_production_crew(
+@router.post("/productions/{production_id}/crew/bulk", response_model=List[ProductionCrewResponse])
+async def add_crew_members_bulk(
     production_id: int,
-    current_profile: Profile = Depends(get_current_user),
+    bulk_data: ProductionCrewBulkCreate,
+    reject_conflicts: bool = Query(True, description="Answer 409 if any member is booked for overlapping sessions (false allows double-booking)"),
+    current_profile: Profile = Depends(get_current_active_admin),
     db: AsyncSession = Depends(get_db)
 ) -> List[ProductionCrewResponse]:
-    """Get all crew members for a production."""
+    """
+    Assign several crew members to a production in one request.
+
+    Ownership, profiles and existing assignments are each checked with one
+    query, assignments are inserted with a single multi-row INSERT and
+    production totals are recalculated and committed once.
+    """
+
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_profile.organization_id, db):
+        raise HTTPException(status_code=404, detail="Production not found")
 
-    # Verify production exists and belongs to user's organization
+    # Parse and de-duplicate user ids from the payload
+    user_ids = []
+    for index, crew_data in enumerate(bulk_data.crew):
+        try:
+            user_id = uuid.UUID(crew_data.user_id)
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid user_id (crew {index})")
+        if user_id in user_ids:
+            raise HTTPException(status_code=400, detail=f"User is assigned twice in this request (crew {index})")
+        user_ids.append(user_id)
+
+    # Verify every user exists and belongs to the same organization
     result = await db.execute(
-        select(Production).where(
-            Production.id == production_id,
-            Production.organization_id == current_profile.organization_id
+        select(Profile.id, Profile.full_name).where(
+            Profile.id.in_(user_ids),
+            Profile.organization_id == current_profile.organization_id
         )
     )
-    production = result.scalar_one_or_none()
+    full_names = {row.id: row.full_name for row in result}
+    for index, user_id in enumerate(user_ids):
+        if user_id not in full_names:
+            raise HTTPException(status_code=404, detail=f"User not found (crew {index})")
+
+    # Check if any user is already assigned to this production
+    result = await db.execute(
+        select(ProductionCrew.user_id).where(
+            ProductionCrew.production_id == production_id,
+            ProductionCrew.user_id.in_(user_ids)
+        )
+    )
+    already_assigned = set(result.scalars().all())
+    if already_assigned:
+        raise HTTPException(status_code=400, detail="User is already assigned to this production")
+
+    # One query for every member's overlapping bookings
+    if reject_conflicts:
+        await ensure_no_crew_conflicts(db, current_profile.organization_id, production_id, user_ids)
+
+    rows = [{
+        "production_id": production_id,
+        "user_id": user_id,
+        "role": crew_data.role,
+        "fee": crew_data.fee
+    } for user_id, crew_data in zip(user_ids, bulk_data.crew)]
+
+    # Single multi-row INSERT ... RETURNING, rows in payload order
+    result = await db.execute(
+        insert(ProductionCrew).returning(
+            ProductionCrew.id, ProductionCrew.production_id, ProductionCrew.user_id,
+            ProductionCrew.role, ProductionCrew.fee,
+            sort_by_parameter_order=True
+        ),
+        rows
+    )
+    created = result.all()
+
+    # Recalculate production totals once (crew fees affect total_cost)
+    await calculate_production_totals(production_id, db)
+    await db.commit()
 
-    if production is None:
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "crew", "created", production_id)
+
+    return [{
+        "id": row.id,
+        "production_id": row.production_id,
+        "user_id": str(row.user_id),
+        "role": row.role,
+        "fee": row.fee,
+        "full_name": full_names.get(row.user_id)
+    } for row in created]
+
+
+@router.post("/productions/{production_id}/crew/conflicts", response_model=CrewConflictsResponse)
+async def check_crew_conflicts(
+    production_id: int,
+    check: CrewConflictCheck,
+    current_profile: Profile = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_db)
+) -> CrewConflictsResponse:
+    """
+    Find bookings of crew members on other productions that overlap this
+    production's shooting sessions.
+
+    Checks any number of members with a single query. Pass shooting_sessions
+    to check unsaved sessions instead of the stored ones.
+    """
+
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_profile.organization_id, db):
+        raise HTTPException(status_code=404, detail="Production not found")
+
+    user_ids = []
+    for index, user_id in enumerate(check.user_ids):
+        try:
+            user_ids.append(uuid.UUID(user_id))
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid user_id (user {index})")
+
+    intervals = session_intervals(check.shooting_sessions) if check.shooting_sessions is not None else None
+    conflicts = await find_crew_conflicts(db, current_profile.organization_id, production_id, user_ids, intervals)
+
+    return {"conflicts": conflicts}
+
+
+@router.get("/productions/{production_id}/crew", response_model=List[ProductionCrewResponse])
+async def get_production_crew(
+    production_id: int,
+    current_profile: Profile = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> List[ProductionCrewResponse]:
+    """Get all crew members for a production."""
+
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_profile.organization_id, db):
         raise HTTPException(status_code=404, detail="Production not found")
 
     if current_profile.role == "admin":
@@ -148,16 +273,8 @@ async def remove_crew_member(
 ):
     """Remove a crew member from a production."""
 
-    # Verify production exists and belongs to user's organization
-    result = await db.execute(
-        select(Production).where(
-            Production.id == production_id,
-            Production.organization_id == current_profile.organization_id
-        )
-    )
-    production = result.scalar_one_or_none()
-
-    if production is None:
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_profile.organization_id, db):
         raise HTTPException(status_code=404, detail="Production not found")
 
     # Find the crew assignment
@@ -172,8 +289,10 @@ async def remove_crew_member(
     if crew_assignment is None:
         raise HTTPException(status_code=404, detail="Crew member not found in this production")
 
-    # Remove the assignment and flush to sync state
+    # Remove the assignment and flush to sync state; the member's delta sync
+    # gets the production as deleted
     await db.delete(crew_assignment)
+    await record_crew_removed(db, production_id, current_profile.organization_id, [crew_assignment.user_id])
     await db.flush()  # Synchronize state with database without closing transaction
 
     # Recalculate production totals with updated state (crew member removed)
@@ -182,4 +301,7 @@ async def remove_crew_member(
     # Only commit after successful recalculation
     await db.commit()
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "crew", "deleted", production_id)
+
     return {"message": "Crew member removed successfully"}
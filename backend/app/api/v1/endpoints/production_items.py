@@ -1,19 +1,43 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_admin
+from app.core.cache import cache
 from app.db.session import get_db
 from app.models.production import Production
 from app.models.production_item import ProductionItem
 from app.models.service import Service
 from app.models.user import User
-from app.schemas.production_item import ProductionItemCreate, ProductionItemResponse
-from app.services.production_service import calculate_production_totals
+from app.schemas.production_item import ProductionItemBulkCreate, ProductionItemCreate, ProductionItemResponse
+from app.services.production_service import calculate_production_totals, production_in_organization
 
 router = APIRouter()
 
 
+def _resolve_item_fields(item_data: ProductionItemCreate, service: Service | None) -> tuple[str, int]:
+    """
+    Resolve the name and unit price of an item.
+
+    Service data is used as default, but explicit overrides are kept.
+    Swagger defaults ("string", 0, None) are ignored.
+    """
+    if service is None:
+        return item_data.name, item_data.unit_price
+
+    item_name = service.name
+    if item_data.name and item_data.name.strip() and item_data.name.lower() != "string":
+        item_name = item_data.name
+
+    item_unit_price = service.default_price
+    if item_data.unit_price is not None and item_data.unit_price > 0:
+        item_unit_price = item_data.unit_price
+
+    return item_name, item_unit_price
+
+
 @router.post("/productions/{production_id}/items", response_model=ProductionItemResponse)
 async def create_production_item(
     production_id: int,
@@ -30,16 +54,8 @@ async def create_production_item(
     2. Create a custom item (name + unit_price) - manual entry
     """
 
-    # Verify production exists and belongs to user's organization
-    result = await db.execute(
-        select(Production).where(
-            Production.id == production_id,
-            Production.organization_id == current_user.organization_id
-        )
-    )
-    production = result.scalar_one_or_none()
-
-    if production is None:
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_user.organization_id, db):
         raise HTTPException(status_code=404, detail="Production not found")
 
     # Initialize variables
@@ -61,19 +77,11 @@ async def create_production_item(
             raise HTTPException(status_code=404, detail="Service not found")
 
         # Use service data as defaults, but allow explicit overrides
-        # Ignore Swagger defaults: "string", 0, None
-        item_name = service.name
-        if item_data.name and item_data.name.strip() and item_data.name.lower() != "string":
-            item_name = item_data.name
-
-        item_unit_price = service.default_price
-        if item_data.unit_price is not None and item_data.unit_price > 0:
-            item_unit_price = item_data.unit_price
+        item_name, item_unit_price = _resolve_item_fields(item_data, service)
 
     # Option 2: Manual entry (validation already done by model_validator)
     else:
-        item_name = item_data.name
-        item_unit_price = item_data.unit_price
+        item_name, item_unit_price = _resolve_item_fields(item_data, None)
 
     # Calculate total price
     total_price = int(item_data.quantity * item_unit_price)
@@ -96,9 +104,81 @@ async def create_production_item(
     await calculate_production_totals(production_id, db)
     await db.commit()  # Commit the calculated totals
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "item", "created", production_id)
+
     return ProductionItemResponse.from_orm(item)
 
 
+@router.post("/productions/{production_id}/items/bulk", response_model=List[ProductionItemResponse])
+async def create_production_items_bulk(
+    production_id: int,
+    bulk_data: ProductionItemBulkCreate,
+    current_user: User = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_db)
+) -> List[ProductionItemResponse]:
+    """
+    Create several items for a production in one request.
+
+    Ownership and services are validated once for the whole batch, items are
+    inserted with a single multi-row INSERT and production totals are
+    recalculated and committed once. The batch is all-or-nothing.
+    """
+
+    # Verify production exists and belongs to user's organization (single EXISTS, nothing loaded)
+    if not await production_in_organization(production_id, current_user.organization_id, db):
+        raise HTTPException(status_code=404, detail="Production not found")
+
+    # Load every referenced service in one query
+    service_ids = {item.service_id for item in bulk_data.items if item.service_id is not None}
+    services = {}
+    if service_ids:
+        service_result = await db.execute(
+            select(Service).where(
+                Service.id.in_(service_ids),
+                Service.organization_id == current_user.organization_id
+            )
+        )
+        services = {service.id: service for service in service_result.scalars().all()}
+
+    rows = []
+    for index, item_data in enumerate(bulk_data.items):
+        service = None
+        if item_data.service_id is not None:
+            service = services.get(item_data.service_id)
+            if service is None:
+                raise HTTPException(status_code=404, detail=f"Service not found (item {index})")
+
+        item_name, item_unit_price = _resolve_item_fields(item_data, service)
+        if not item_name or item_unit_price is None:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Item {index} needs a service_id or both name and unit_price"
+            )
+
+        rows.append({
+            "production_id": production_id,
+            "service_id": item_data.service_id,  # Historical reference
+            "name": item_name,
+            "quantity": item_data.quantity,
+            "unit_price": item_unit_price,
+            "total_price": int(item_data.quantity * item_unit_price)
+        })
+
+    # Single multi-row INSERT ... RETURNING, rows in payload order
+    result = await db.scalars(insert(ProductionItem).returning(ProductionItem, sort_by_parameter_order=True), rows)
+    items = result.all()
+
+    # Recalculate production totals once for the whole batch
+    await calculate_production_totals(production_id, db)
+    await db.commit()
+
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "item", "created", production_id)
+
+    return [ProductionItemResponse.from_orm(item) for item in items]
+
+
 @router.delete("/productions/{production_id}/items/{item_id}")
 async def delete_production_item(
     production_id: int,
@@ -129,4 +209,7 @@ async def delete_production_item(
     await calculate_production_totals(production_id, db)
     await db.commit()  # Commit the calculated totals
 
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_user.organization_id, "item", "deleted", production_id)
+
     return {"message": "Item deleted successfully"}
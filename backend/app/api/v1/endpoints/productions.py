@@ -1,8 +1,11 @@
 import logging
-from typing import List
+import uuid
+from datetime import date
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request  # type: ignore
-from sqlalchemy import select, func  # type: ignore
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response  # type: ignore
+from fastapi.responses import StreamingResponse  # type: ignore
+from sqlalchemy import delete, select  # type: ignore
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
 from sqlalchemy.orm import selectinload  # type: ignore
 
@@ -11,14 +14,21 @@ from app.core.rate_limit import limiter
 from app.api.deps import get_current_supabase_user, check_supabase_subscription
 from app.db.session import get_db
 from app.core.cache import cache, CacheKeys
+from app.core import http_cache
 from app.models.client import Client
 from app.models.expense import Expense
-from app.models.production import Production
+from app.models.production import Production, ProductionStatus
 from app.models.production_crew import ProductionCrew
 from app.models.production_item import ProductionItem
 from app.models.user import Profile, Organization
-from app.schemas.production import ProductionCreate, ProductionCrewResponse, ProductionResponse, ProductionUpdate
-from app.services.production_service import calculate_production_totals
+from app.schemas.production import (
+    PRODUCTION_SORT_FIELDS, ProductionCreate, ProductionCrewResponse, ProductionFilters, ProductionResponse, ProductionUpdate
+)
+from app.services.export_service import stream_productions_csv, stream_productions_ndjson
+from app.services import read_models
+from app.services.sync_service import ChangesToken, production_changes, record_crew_removed, record_production_deleted
+from app.services.production_service import calculate_production_totals, sync_shooting_sessions
+from app.services.scheduling_service import ensure_no_crew_conflicts, session_intervals
 
 logger = logging.getLogger(__name__)
 
@@ -62,28 +72,24 @@ async def create_production(
     )
 
     db.add(production)
+    await db.flush()
+
+    # Calendar rows mirror the JSON sessions (same transaction)
+    await sync_shooting_sessions(
+        production.id, production.organization_id, production.shooting_sessions, db
+    )
     await db.commit()
-    await db.refresh(production)
 
     # Calculate initial financial totals for the new production
     from app.services.production_service import calculate_production_totals
     await calculate_production_totals(production.id, db)
     await db.commit()  # Commit the calculated totals
 
-    # Reload production with relationships loaded for proper serialization
-    result = await db.execute(
-        select(Production).where(Production.id == production.id).options(
-            selectinload(Production.items),
-            selectinload(Production.expenses),
-            selectinload(Production.crew).selectinload(ProductionCrew.user),
-            selectinload(Production.client)
-        )
-    )
-    production = result.scalar_one()
+    # Reload server-generated columns; the response doesn't include relationships
+    await db.refresh(production)
 
-    # Invalidate cache for productions and dashboard
-    await cache.delete_pattern(f"productions:list:{current_profile.organization_id}:*")
-    await cache.delete(CacheKeys.dashboard_summary(current_profile.organization_id))
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "production", "created", production.id)
 
     return {
         "id": production.id,
@@ -111,25 +117,26 @@ async def delete_production(
 ):
     """Delete a production (only if it belongs to current user's organization)."""
 
-    # Get production to delete
+    # Tombstones for delta sync clients (GET /productions/changes), written
+    # first while the crew rows still exist; same transaction as the delete
+    await record_production_deleted(db, production_id, current_profile.organization_id)
+
+    # Delete in a single statement scoped to the organization; items, expenses
+    # and crew are removed by the database (ON DELETE CASCADE)
     result = await db.execute(
-        select(Production).where(
+        delete(Production).where(
             Production.id == production_id,
             Production.organization_id == current_profile.organization_id
-        )
+        ).returning(Production.id)
     )
-    production = result.scalar_one_or_none()
 
-    if production is None:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Production not found")
 
-    # Delete production (cascade will delete related items and expenses)
-    await db.delete(production)
     await db.commit()
 
-    # Invalidate cache for productions and dashboard
-    await cache.delete_pattern(f"productions:list:{current_profile.organization_id}:*")
-    await cache.delete(CacheKeys.dashboard_summary(current_profile.organization_id))
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "production", "deleted", production_id)
 
     return {"message": "Production deleted successfully"}
 
@@ -138,6 +145,7 @@ async def delete_production(
 async def update_production(
     production_id: int,
     production_data: ProductionUpdate,
+    reject_conflicts: bool = Query(True, description="Answer 409 if crew is booked for overlapping sessions (false allows double-booking)"),
     current_profile: Profile = Depends(get_current_supabase_user),
     db: AsyncSession = Depends(get_db),
     org: dict = Depends(check_supabase_subscription)
@@ -155,11 +163,15 @@ async def update_production(
     except Exception as e:
         logger.error(f"❌ Failed to serialize payload: {e}")
 
-    # Get production to update
+    # Get production to update, with the collections that are replaced below
     result = await db.execute(
         select(Production).where(
             Production.id == production_id,
             Production.organization_id == current_profile.organization_id
+        ).options(
+            selectinload(Production.items),
+            selectinload(Production.expenses),
+            selectinload(Production.crew)
         )
     )
     production = result.scalar_one_or_none()
@@ -175,6 +187,17 @@ async def update_production(
     crew_data = update_data.pop('crew', None)
     expenses_data = update_data.pop('expenses', None)
 
+    # Double-booking check for the submitted crew against the submitted (or stored) sessions
+    if reject_conflicts and crew_data:
+        crew_ids = []
+        for crew_dict in crew_data:
+            try:
+                crew_ids.append(uuid.UUID(str(crew_dict.get('user_id'))))
+            except ValueError:
+                continue
+        intervals = session_intervals(update_data['shooting_sessions']) if 'shooting_sessions' in update_data else None
+        await ensure_no_crew_conflicts(db, current_profile.organization_id, production_id, crew_ids, intervals)
+
     # Update simple fields only
     model_fields = ['title', 'client_id', 'status', 'deadline', 'priority', 'shooting_sessions',
                    'subtotal', 'total_cost', 'total_value', 'discount', 'tax_rate',
@@ -189,6 +212,12 @@ async def update_production(
     # BATCH SAVING: Replace relationships completely (delete all, recreate)
     # This is simpler than trying to diff existing vs new
 
+    # Crew members dropped by this update lose the production from their delta sync
+    kept_ids = {str(crew_dict.get('user_id')) for crew_dict in crew_data or []}
+    await record_crew_removed(db, production_id, production.organization_id, [
+        member.user_id for member in production.crew if str(member.user_id) not in kept_ids
+    ])
+
     # Clear existing relationships
     production.items.clear()
     production.crew.clear()
@@ -265,8 +294,14 @@ async def update_production(
     production.profit = production.total_value - production.total_cost - production.tax_amount
 
     db.add(production)
+
+    # Calendar rows mirror the JSON sessions (same transaction)
+    if "shooting_sessions" in update_data:
+        await sync_shooting_sessions(
+            production_id, production.organization_id, production.shooting_sessions, db
+        )
+
     await db.commit()
-    await db.refresh(production)
 
     # Recalculate totals if discount or tax_rate was updated (which affects tax calculation)
     if "discount" in update_data or "tax_rate" in update_data:
@@ -274,40 +309,65 @@ async def update_production(
         await calculate_production_totals(production_id, db)
         await db.commit()  # Commit the calculated totals
 
-    # Refresh and return updated production with items, expenses and crew
-    result = await db.execute(
-        select(Production).where(Production.id == production_id).options(
-            selectinload(Production.items),
-            selectinload(Production.expenses),
-            selectinload(Production.crew).selectinload(ProductionCrew.user),
-            selectinload(Production.client)
-        )
-    )
-    updated_production = result.scalar_one()
+    # Reload server-generated columns; the response doesn't include relationships
+    await db.refresh(production)
+
+    # Invalidate cached reads (productions, dashboard, ETags)
+    await cache.invalidate_org(current_profile.organization_id, "production", "updated", production_id)
 
     return {
-        "id": updated_production.id,
-        "title": updated_production.title,
-        "organization_id": updated_production.organization_id,
-        "client_id": updated_production.client_id,
-        "deadline": updated_production.deadline,
-        "shooting_sessions": updated_production.shooting_sessions,
-        "payment_method": updated_production.payment_method,
-        "due_date": updated_production.due_date,
-        "tax_rate": updated_production.tax_rate,
-        "status": updated_production.status,
-        "payment_status": updated_production.payment_status,
-        "created_at": updated_production.created_at,
-        "updated_at": updated_production.updated_at
+        "id": production.id,
+        "title": production.title,
+        "organization_id": production.organization_id,
+        "client_id": production.client_id,
+        "deadline": production.deadline,
+        "shooting_sessions": production.shooting_sessions,
+        "payment_method": production.payment_method,
+        "due_date": production.due_date,
+        "tax_rate": production.tax_rate,
+        "status": production.status,
+        "payment_status": production.payment_status,
+        "created_at": production.created_at,
+        "updated_at": production.updated_at
     }
 
 
+def _json_text_response(payload: str, etag: str | None) -> Response:
+    """Response for a body that is already JSON text (no Python encoding)."""
+    json_response = Response(content=payload, media_type="application/json")
+    http_cache.set_etag_headers(json_response, etag)
+    return json_response
+
+
+def get_production_filters(
+    status: List[ProductionStatus] = Query([]),
+    payment_status: List[str] = Query([]),
+    priority: List[str] = Query([]),
+    client_id: Optional[int] = None,
+    deadline_from: Optional[date] = None,
+    deadline_to: Optional[date] = None,
+    due_date_from: Optional[date] = None,
+    due_date_to: Optional[date] = None,
+    sort: Literal[PRODUCTION_SORT_FIELDS] = "created_at",  # type: ignore[valid-type]
+    order: Literal["asc", "desc"] = "desc"
+) -> ProductionFilters:
+    """Collect list filters from the query string (repeat a param to match several values)."""
+    return ProductionFilters(
+        status=status, payment_status=payment_status, priority=priority, client_id=client_id,
+        deadline_from=deadline_from, deadline_to=deadline_to,
+        due_date_from=due_date_from, due_date_to=due_date_to,
+        sort=sort, order=order
+    )
+
+
 @router.get("/")
 @limiter.limit("200/minute")  # Read operations limit
 async def get_productions(
     request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    filters: ProductionFilters = Depends(get_production_filters),
     current_profile: Profile = Depends(get_current_supabase_user),
     db: AsyncSession = Depends(get_db),
     org: dict = Depends(check_supabase_subscription)
@@ -315,13 +375,19 @@ async def get_productions(
     """
     Get productions for the current user based on their role.
 
-    Optimized to use a single query with eager loading to prevent N+1 query problems.
-    All related data (items, expenses, crew, client) is loaded in one efficient query.
-    Uses Redis cache for first page to improve performance.
+    Reads plain column rows into slotted read models (app.services.read_models)
+    instead of ORM objects: one query for the page and its client, plus one
+    each for items, expenses and crew, whatever the page size. With
+    PRODUCTIONS_SQL_JSON on PostgreSQL the whole response is built by a single
+    json_agg statement and returned without Python JSON encoding.
+    Uses Redis cache for the first page of each filter set to improve performance.
+    Answers 304 Not Modified when the client's ETag is still current.
 
     Args:
         skip: Number of records to skip (for pagination). Default: 0
         limit: Maximum number of records to return. Default: 50, Max: 100
+        filters: status, payment_status, priority (repeatable), client_id,
+            deadline_from/to and due_date_from/to (inclusive days), sort and order
         current_user: Authenticated user
         db: Database session
 
@@ -329,13 +395,28 @@ async def get_productions(
         List of productions with pagination metadata
     """
 
-        # Try cache for first page only (most common case)
+    # Conditional GET: skip queries and serialization when nothing changed
+    version = await cache.get_org_version(current_profile.organization_id)
+    etag = http_cache.version_etag(
+        version, current_profile.organization_id, "productions", current_profile.role,
+        current_profile.id if current_profile.role != "admin" else None, skip, limit, filters.cache_key()
+    )
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag)
+    http_cache.set_etag_headers(response, etag)
+
+    # Try cache for first page only (most common case), per normalized filter set
     cache_key = None
-    if skip == 0 and limit <= 50:  # Only cache first page with reasonable limit
-        cache_key = CacheKeys.productions_list(current_profile.organization_id, current_profile.role, skip, limit)
+    if version is not None and skip == 0 and limit <= 50:  # Only cache first page with reasonable limit
+        cache_key = CacheKeys.productions_list(
+            current_profile.organization_id, version, current_profile.role, skip, limit, filters.cache_key()
+        )
         cached_result = await cache.get(cache_key)
         if cached_result:
             logger.info(f"Cache hit for productions list: {cache_key}")
+            if isinstance(cached_result, str):
+                # JSON text cached by the database-assembled path
+                return _json_text_response(cached_result, etag)
             return cached_result
 
     # Validate pagination parameters
@@ -346,99 +427,37 @@ async def get_productions(
     if limit > 100:
         limit = 100  # Maximum limit to prevent abuse
 
+    if read_models.sql_json_enabled(db):
+        # Postgres assembles the whole payload in one statement; forward the text as is
+        is_admin = current_profile.role == "admin"
+        payload = await read_models.fetch_productions_json(
+            db, current_profile.organization_id, skip, limit,
+            crew_profile_id=None if is_admin else current_profile.id,
+            list_key="productionsList" if is_admin else "items",
+            filters=filters
+        )
+        if cache_key and is_admin:
+            await cache.set(cache_key, payload, ttl_seconds=300)  # 5 minutes cache
+        return _json_text_response(payload, etag)
+
     if current_profile.role == "admin":
         # Admin sees all productions in their organization
-        # Single optimized query with all relationships eagerly loaded
-        
+
         # First, get total count for pagination metadata (optimized with COUNT)
-        count_result = await db.execute(
-            select(func.count(Production.id))
-            .where(Production.organization_id == current_profile.organization_id)
-        )
-        total_count = count_result.scalar_one()
-        
-        # Then get paginated results with explicit eager loading
-        # selectinload prevents N+1 queries by loading all relationships in one query
-        result = await db.execute(
-            select(Production)
-            .where(Production.organization_id == current_profile.organization_id)
-            .options(
-                selectinload(Production.items),
-                selectinload(Production.expenses),
-                selectinload(Production.crew).selectinload(ProductionCrew.user),
-                selectinload(Production.client)
-            )
-            .order_by(Production.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        total_count = await read_models.count_productions(db, current_profile.organization_id, filters)
 
-        # No unique() needed with selectinload - it prevents duplicates by design
-        productions = result.scalars().all()
+        # Then get the page as Core rows (no ORM objects): page + client, items, expenses, crew
+        productions = await read_models.fetch_productions(
+            db, current_profile.organization_id, skip, limit, filters=filters
+        )
 
         # Log query performance metrics (production-ready logging)
-        logger.info(f"ADMIN: Retrieved {len(productions)} productions with eager loading (skip={skip}, limit={limit})")
+        logger.info(f"ADMIN: Retrieved {len(productions)} productions (skip={skip}, limit={limit})")
 
         # Totals are calculated during write operations, no need to recalculate on read
 
         result = {
-            "productionsList": [{
-                "id": production.id,
-                "title": production.title,
-                "organization_id": production.organization_id,
-                "client_id": production.client_id,
-                "client": {
-                    "id": production.client.id,
-                    "full_name": production.client.full_name,
-                    "email": production.client.email,
-                    "cnpj": production.client.cnpj,
-                    "phone": production.client.phone,
-                    "created_at": production.client.created_at
-                } if production.client else None,
-                "status": production.status,
-                "deadline": production.deadline,
-                "shooting_sessions": production.shooting_sessions,
-                "notes": production.notes,
-                "created_at": production.created_at,
-                "updated_at": production.updated_at,
-                # Payment fields
-                "payment_method": production.payment_method,
-                "payment_status": production.payment_status,
-                "due_date": production.due_date,
-                # Financial fields
-                "subtotal": production.subtotal,
-                "discount": production.discount,
-                "tax_rate": production.tax_rate,
-                "tax_amount": production.tax_amount,
-                "total_value": production.total_value,
-                "total_cost": production.total_cost,
-                "profit": production.profit,
-                # Related data - CRÍTICO para o frontend
-                "items": [{
-                    "id": item.id,
-                    "production_id": item.production_id,
-                    "name": item.name,
-                    "quantity": item.quantity,
-                    "unit_price": item.unit_price,
-                    "total_price": item.total_price
-                } for item in production.items],
-                "expenses": [{
-                    "id": expense.id,
-                    "production_id": expense.production_id,
-                    "name": expense.name,
-                    "value": expense.value,
-                    "category": expense.category,
-                    "paid_by": expense.paid_by
-                } for expense in production.expenses],
-                "crew": [{
-                    "id": member.id,
-                    "production_id": member.production_id,
-                    "user_id": member.user_id,
-                    "role": member.role,
-                    "fee": member.fee,
-                    "full_name": member.user.full_name if member.user else None
-                } for member in production.crew]
-            } for production in productions],
+            "productionsList": [production.to_dict() for production in productions],
             "total": total_count,
             "skip": skip,
             "limit": limit,
@@ -454,119 +473,25 @@ async def get_productions(
 
     else:
         # Crew members see only productions they're assigned to
-        # Single optimized query with all relationships eagerly loaded
-        
+
         # First, get total count for pagination metadata (optimized with COUNT)
-        count_result = await db.execute(
-            select(func.count(Production.id))
-            .join(
-                ProductionCrew,
-                Production.id == ProductionCrew.production_id
-            )
-            .where(
-                Production.organization_id == current_profile.organization_id,
-                ProductionCrew.user_id == current_profile.id
-            )
-        )
-        total_count = count_result.scalar_one()
-        
-        # Then get paginated results with explicit eager loading
-        # Added client loading to prevent N+1 queries when displaying client names
-        result = await db.execute(
-            select(Production)
-            .join(
-                ProductionCrew,
-                Production.id == ProductionCrew.production_id
-            )
-            .where(
-                Production.organization_id == current_profile.organization_id,
-                ProductionCrew.user_id == current_profile.id
-            )
-            .options(
-                selectinload(Production.items),
-                selectinload(Production.expenses),
-                selectinload(Production.crew).selectinload(ProductionCrew.user),
-                selectinload(Production.client)  # Added to prevent N+1 queries for client names
-            )
-            .order_by(Production.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        total_count = await read_models.count_productions(
+            db, current_profile.organization_id, filters, crew_profile_id=current_profile.id
         )
 
-        # No unique() needed with selectinload - it prevents duplicates by design
-        productions = result.scalars().all()
-
-        # Privacy filter: Crew members should only see their own crew information
-        for production in productions:
-            production.crew = [member for member in production.crew if member.user_id == current_profile.id]
+        # Then get the page as Core rows
+        # Privacy filter: Crew members only get their own crew information
+        productions = await read_models.fetch_productions(
+            db, current_profile.organization_id, skip, limit, crew_profile_id=current_profile.id, filters=filters
+        )
 
         # Log query performance metrics (production-ready logging)
-        logger.info(f"CREW: Retrieved {len(productions)} productions with eager loading (skip={skip}, limit={limit})")
+        logger.info(f"CREW: Retrieved {len(productions)} productions (skip={skip}, limit={limit})")
 
         # Totals are calculated during write operations, no need to recalculate on read
 
-        # Privacy filter: Crew members should only see their own crew information
-        for production in productions:
-            production.crew = [member for member in production.crew if member.user_id == current_profile.id]
-
         return {
-            "items": [{
-                "id": production.id,
-                "title": production.title,
-                "organization_id": production.organization_id,
-                "client_id": production.client_id,
-                "client": {
-                    "id": production.client.id,
-                    "full_name": production.client.full_name,
-                    "email": production.client.email,
-                    "cnpj": production.client.cnpj,
-                    "phone": production.client.phone,
-                    "created_at": production.client.created_at
-                } if production.client else None,
-                "status": production.status,
-                "deadline": production.deadline,
-                "shooting_sessions": production.shooting_sessions,
-                "notes": production.notes,
-                "created_at": production.created_at,
-                "updated_at": production.updated_at,
-                # Payment fields
-                "payment_method": production.payment_method,
-                "payment_status": production.payment_status,
-                "due_date": production.due_date,
-                # Financial fields (crew pode ver)
-                "subtotal": production.subtotal,
-                "discount": production.discount,
-                "tax_rate": production.tax_rate,
-                "tax_amount": production.tax_amount,
-                "total_value": production.total_value,
-                "total_cost": production.total_cost,
-                "profit": production.profit,
-                # Related data - CRÍTICO para o frontend
-                "items": [{
-                    "id": item.id,
-                    "production_id": item.production_id,
-                    "name": item.name,
-                    "quantity": item.quantity,
-                    "unit_price": item.unit_price,
-                    "total_price": item.total_price
-                } for item in production.items],
-                "expenses": [{
-                    "id": expense.id,
-                    "production_id": expense.production_id,
-                    "name": expense.name,
-                    "value": expense.value,
-                    "category": expense.category,
-                    "paid_by": expense.paid_by
-                } for expense in production.expenses],
-                "crew": [{
-                    "id": member.id,
-                    "production_id": member.production_id,
-                    "user_id": member.user_id,
-                    "role": member.role,
-                    "fee": member.fee,
-                    "full_name": member.user.full_name if member.user else None
-                } for member in production.crew]
-            } for production in productions],
+            "items": [production.to_dict() for production in productions],
             "total": total_count,
             "skip": skip,
             "limit": limit,
@@ -574,6 +499,70 @@ async def get_productions(
         }
 
 
+@router.get("/export")
+@limiter.limit("5/minute")  # Heavy read: full organization history
+async def export_productions(
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    current_profile: Profile = Depends(get_current_supabase_user),
+    org: dict = Depends(check_supabase_subscription)
+):
+    """
+    Export every production of the organization with financial totals.
+
+    Streams one row per production (client name plus item, expense and crew
+    aggregates) as NDJSON or CSV. Rows are read through a server-side cursor,
+    so memory stays constant regardless of the organization size.
+    Only admins can export since the payload contains financial data.
+    """
+
+    if current_profile.role != "admin":
+        raise HTTPException(status_code=403, detail="Only organization admins can export productions")
+
+    filename = f"productions-{current_profile.organization_id}-{date.today().isoformat()}.{format}"
+    if format == "csv":
+        body = stream_productions_csv(current_profile.organization_id)
+        media_type = "text/csv"
+    else:
+        body = stream_productions_ndjson(current_profile.organization_id)
+        media_type = "application/x-ndjson"
+
+    logger.info(f"Starting productions export for org {current_profile.organization_id} (format={format})")
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/changes", response_model=dict)
+@limiter.limit("200/minute")  # Read operations limit
+async def get_production_changes(
+    request: Request,
+    since: Optional[str] = Query(None, description="next_token from the previous call; omit for a full sync"),
+    limit: int = Query(200, ge=1, le=500),
+    current_profile: Profile = Depends(get_current_supabase_user),
+    db: AsyncSession = Depends(get_db),
+    org: dict = Depends(check_supabase_subscription)
+) -> dict:
+    """
+    Incremental sync: productions created/updated and ids deleted since a token.
+
+    Changed productions have the same shape as in GET /productions and come
+    oldest first; keep calling with next_token while has_more is true. A
+    production may be sent again on a later call, so apply changes by id.
+    Crew members only receive productions they are assigned to.
+    """
+    try:
+        since_token = ChangesToken.decode(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid changes token")
+
+    crew_profile_id = current_profile.id if current_profile.role != "admin" else None
+    return await production_changes(db, current_profile.organization_id, since_token, limit, crew_profile_id)
+
+
 @router.get("/{production_id}")
 async def get_production(
     production_id: int,
@@ -678,8 +667,8 @@ async def get_production(
                 ProductionCrew.user_id == current_profile.id,
                 Production.id == production_id
             ).options(
+                # Crew responses never include expenses or the client
                 selectinload(Production.items),
-                selectinload(Production.expenses),
                 selectinload(Production.crew).selectinload(ProductionCrew.user)
             )
         )
@@ -692,9 +681,8 @@ async def get_production(
             # Debug logging
             try:
                 items_count = len(production.items) if production.items else 0
-                expenses_count = len(production.expenses) if production.expenses else 0
                 crew_count = len(production.crew) if production.crew else 0
-                logger.info(f"SINGLE CREW Production {production.id}: items={items_count}, expenses={expenses_count}, crew={crew_count}")
+                logger.info(f"SINGLE CREW Production {production.id}: items={items_count}, crew={crew_count}")
             except Exception as e:
                 logger.warning(f"Could not access relations for single crew production {production.id}: {e}")
 
@@ -0,0 +1,58 @@
+import logging
+import time
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, Request  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.api.deps import check_supabase_subscription, get_current_supabase_user
+from app.core.deadlines import deadline
+from app.core.rate_limit import limiter
+from app.db.session import get_db
+from app.models.user import Organization, Profile
+from app.schemas.search import SearchResponse
+from app.services import search_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Expected upper bound for the search query (index-backed, 100k rows per table);
+# gated by scripts/bench_search.py
+SEARCH_LATENCY_BUDGET_MS = 20
+
+
+@router.get("/", response_model=SearchResponse)
+@limiter.limit("200/minute")  # Read operations limit
+@deadline(5)
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=100, description="Text to search for"),
+    types: Optional[List[Literal["production", "client", "service"]]] = Query(None, alias="type"),
+    limit: int = Query(20, ge=1, le=50),
+    current_profile: Profile = Depends(get_current_supabase_user),
+    db: AsyncSession = Depends(get_db),
+    org: Organization = Depends(check_supabase_subscription)
+) -> SearchResponse:
+    """
+    Search productions (title, notes), clients (name, email, CNPJ) and services
+    (name, description) of the current organization.
+
+    Results from all types are ranked together by similarity. Crew members
+    only find productions they are assigned to.
+    """
+    query = q.strip()
+    crew_profile_id = current_profile.id if current_profile.role != "admin" else None
+
+    start = time.perf_counter()
+    results = await search_service.search(
+        db, query, current_profile.organization_id, types, limit, crew_profile_id
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms > SEARCH_LATENCY_BUDGET_MS:
+        logger.warning(
+            "Search over latency budget",
+            extra={"organization_id": current_profile.organization_id, "elapsed_ms": round(elapsed_ms, 1)}
+        )
+
+    return {"query": query, "results": results}
@@ -1,15 +1,19 @@
-from typing import List
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile
 from sqlalchemy import select
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_admin, get_current_user
+from app.core import http_cache
+from app.core.cache import cache
 from app.db.session import get_db
 from app.models.service import Service
 from app.models.user import User
-from app.schemas.service import ServiceCreate, ServiceCrewRead, ServiceResponse
+from app.schemas.service import ServiceCreate, ServiceResponse
+from app.services import read_models
+from app.services.import_service import detect_import_format, import_records
 
 router = APIRouter()
 
@@ -35,28 +39,69 @@ async def create_service(
     await db.commit()
     await db.refresh(service)
 
+    # Invalidate cached reads (ETags)
+    await cache.invalidate_org(current_user.organization_id, "service", "created")
+
     return ServiceResponse.from_orm(service)
 
 
+@router.post("/import", response_model=dict)
+async def import_services(
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "json"]] = None,
+    current_user: User = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Import services from a CSV (header row) or JSON (array or NDJSON) upload.
+
+    Rows are validated like POST /services and inserted in chunks. Invalid
+    rows are reported as errors; valid rows are committed together.
+    """
+
+    upload_format = detect_import_format(file, format)
+
+    report = await import_records(
+        file,
+        upload_format,
+        ServiceCreate,
+        Service,
+        current_user.organization_id,
+        db
+    )
+    await db.commit()
+
+    if report.created:
+        # Invalidate cached reads (ETags)
+        await cache.invalidate_org(current_user.organization_id, "service", "created")
+
+    return report.as_dict()
+
+
 @router.get("/")
 async def get_services(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all services for the current user's organization."""
 
-    # Get only services from current user's organization (data isolation)
-    result = await db.execute(
-        select(Service).where(Service.organization_id == current_user.organization_id)
-    )
-    services = result.scalars().all()
+    # Conditional GET: skip the query when nothing changed
+    etag = await http_cache.resource_etag(current_user.organization_id, "services", current_user.role == "admin")
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag)
+    http_cache.set_etag_headers(response, etag)
+
+    # Get only services from current user's organization (data isolation), as Core rows
+    services = await read_models.fetch_services(db, current_user.organization_id)
 
     if current_user.role == "admin":
         # Admin sees all service details including pricing
-        return [ServiceResponse.from_orm(service) for service in services]
+        return [service.to_dict() for service in services]
     else:
         # Crew members see services without pricing information
-        return [ServiceCrewRead.from_orm(service) for service in services]
+        return [service.to_crew_dict() for service in services]
 
 
 @router.delete("/{service_id}", response_model=ServiceResponse)
@@ -96,4 +141,7 @@ async def delete_service(
     await db.delete(service)
     await db.commit()
 
+    # Invalidate cached reads (ETags)
+    await cache.invalidate_org(current_user.organization_id, "service", "deleted")
+
     return ServiceResponse.from_orm(service)
@@ -8,11 +8,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_admin, get_current_supabase_user, check_supabase_subscription, get_supabase_client
+from app.core.cache import cache
 from app.core.security import get_password_hash
 from app.db.session import get_db
 from app.models.user import Profile, User
 from app.schemas.auth import UserInvite
 from app.services.billing_service import BillingService
+from app.services import read_models
 
 logger = logging.getLogger(__name__)
 
@@ -48,20 +50,10 @@ async def get_users(
 ) -> List[dict]:
     """Get all users in the current user's organization."""
     
-    # Use Profile table (Supabase) since legacy users table is empty
-    result = await db.execute(
-        select(Profile).where(Profile.organization_id == current_profile.organization_id)
-    )
-    profiles = result.scalars().all()
+    # Use Profile table (Supabase) since legacy users table is empty, read as Core rows
+    profiles = await read_models.fetch_profiles(db, current_profile.organization_id)
 
-    return [{
-        "id": str(profile.id),  # UUID as string
-        "email": profile.email,
-        "full_name": profile.full_name,
-        "role": profile.role,
-        "organization_id": profile.organization_id,
-        "is_active": profile.is_active
-    } for profile in profiles]
+    return [profile.to_dict() for profile in profiles]
 
 
 @router.post("/invite-crew", response_model=dict)
@@ -94,10 +86,10 @@ async def invite_crew_member(
         )
 
     # Create user in Supabase Auth first
-    supabase = get_supabase_client()
+    supabase = await get_supabase_client()
     try:
         # Invite user via Supabase Auth - this creates the auth user
-        auth_response = supabase.auth.admin.invite_user_by_email(invite_data.email, {
+        auth_response = await supabase.auth.admin.invite_user_by_email(invite_data.email, {
             'data': {
                 'full_name': invite_data.full_name,
                 'organization_id': current_profile.organization_id,
@@ -133,6 +125,9 @@ async def invite_crew_member(
     await db.commit()
     await db.refresh(profile)
 
+    # Crew and dashboard payloads embed profile names and roles
+    await cache.invalidate_org(current_profile.organization_id, "user", "created")
+
     return {
         "id": str(profile.id),
         "email": profile.email,
@@ -178,6 +173,8 @@ async def update_user_status(
     await db.commit()
     await db.refresh(profile)
 
+    await cache.invalidate_org(current_profile.organization_id, "user", "updated")
+
     return {
         "id": str(profile.id),
         "email": profile.email,
@@ -220,6 +217,8 @@ async def delete_user(
     await db.delete(profile)
     await db.commit()
 
+    await cache.invalidate_org(current_profile.organization_id, "user", "deleted")
+
     return {"message": "User deleted successfully"}
 
 
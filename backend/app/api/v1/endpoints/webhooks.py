@@ -1,14 +1,11 @@
-import stripe
 from fastapi import APIRouter, Header, HTTPException, Request, status, Depends
 from app.core.config import settings
+from app.core.stripe_client import get_stripe
 import logging
 from app.db.session import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.billing_service import BillingService
 
-# Configure Stripe API key globally for webhooks
-stripe.api_key = settings.stripe_secret_key
-
 router = APIRouter()
 logger = logging.getLogger("app.api.v1.endpoints.webhooks")
 
@@ -21,6 +18,7 @@ async def stripe_webhook(request: Request, stripe_signature: str = Header(None),
         logger.error("❌ Stripe webhook secret is not configured")
         raise HTTPException(status_code=500, detail="Stripe webhook secret is not configured.")
 
+    stripe = get_stripe()
     try:
         logger.info("🔐 Constructing Stripe event...")
         event = stripe.Webhook.construct_event(
@@ -0,0 +1,210 @@
+"""
+Admission control: bound the work a worker accepts so one organization can't
+saturate the database pool and starve the others.
+
+Each request takes a slot under two limits before it reaches the app:
+- a global in-flight cap per worker (ADMISSION_MAX_IN_FLIGHT, sized against the
+  DB pool), and
+- a per-tenant cap (ADMISSION_MAX_PER_ORG) keyed by organization.
+
+Requests that can't be admitted wait in a bounded FIFO queue. When the queue is
+full, or a request waited longer than ADMISSION_MAX_WAIT_MS, it is shed with
+503 and a Retry-After header. Behind the admission layer, the DB pool's own
+checkout wait is bounded by DB_POOL_TIMEOUT_SECONDS, and a pool timeout is
+turned into the same 503 (see the handler in app.main).
+
+Admission runs before authentication, so it never trusts token contents. The
+auth dependencies (app.api.deps) remember a digest of each bearer token they
+verified, with its organization; later requests carrying that exact token
+share the organization's slots. Any other request (no token, a token not
+verified yet on this worker, a forged one) is bucketed by client IP, so it
+can't take another organization's slots.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Probes and long-lived streams are never queued or shed
+EXEMPT_PATHS = ("/health", "/ready", "/api/v1/events")
+
+# Verified tokens whose organization we remember (bounded, cleared when full)
+MAX_KNOWN_TENANTS = 10000
+
+_Waiter = Tuple[str, "asyncio.Future[bool]"]
+
+
+class AdmissionController:
+    """Global and per-tenant concurrency limits with a bounded wait queue."""
+
+    def __init__(self, max_in_flight: int, max_per_tenant: int, max_queue: int, max_wait_seconds: float):
+        self.max_in_flight = max_in_flight
+        self.max_per_tenant = max_per_tenant
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.in_flight = 0
+        self.tenant_in_flight: Dict[str, int] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "wait_timeout": 0, "db_pool_timeout": 0}
+
+    def _can_admit(self, tenant: str) -> bool:
+        return self.in_flight < self.max_in_flight and self.tenant_in_flight.get(tenant, 0) < self.max_per_tenant
+
+    def _take(self, tenant: str) -> None:
+        self.in_flight += 1
+        self.tenant_in_flight[tenant] = self.tenant_in_flight.get(tenant, 0) + 1
+        self.admitted += 1
+
+    def _wake(self) -> None:
+        """Admit queued requests, in order, that fit now (skipping tenants at their cap)."""
+        for waiter in list(self._waiters):
+            tenant, future = waiter
+            if self.in_flight >= self.max_in_flight:
+                break
+            if not future.done() and self._can_admit(tenant):
+                self._waiters.remove(waiter)
+                self._take(tenant)
+                future.set_result(True)
+
+    async def acquire(self, tenant: str) -> Optional[str]:
+        """
+        Take a slot for a tenant, waiting in the queue if needed.
+
+        Returns None once admitted, or the rejection reason
+        ("queue_full", "wait_timeout") when the request must be shed.
+        """
+        if self._can_admit(tenant):
+            self._take(tenant)
+            return None
+        if len(self._waiters) >= self.max_queue:
+            self.rejected["queue_full"] += 1
+            return "queue_full"
+
+        waiter: _Waiter = (tenant, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout=self.max_wait_seconds)
+            return None
+        except asyncio.TimeoutError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self.rejected["wait_timeout"] += 1
+            return "wait_timeout"
+        except asyncio.CancelledError:
+            # Client went away while queued; give back a slot granted in the meantime
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter[1].done() and not waiter[1].cancelled():
+                self.release(tenant)
+            raise
+
+    def release(self, tenant: str) -> None:
+        self.in_flight -= 1
+        remaining = self.tenant_in_flight.get(tenant, 1) - 1
+        if remaining:
+            self.tenant_in_flight[tenant] = remaining
+        else:
+            self.tenant_in_flight.pop(tenant, None)
+        self._wake()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "tenants_in_flight": len(self.tenant_in_flight),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "limits": {
+                "max_in_flight": self.max_in_flight,
+                "max_per_org": self.max_per_tenant,
+                "max_queue": self.max_queue,
+                "max_wait_ms": round(self.max_wait_seconds * 1000),
+            },
+        }
+
+
+# Global controller (one per worker)
+admission = AdmissionController(
+    max_in_flight=settings.admission_max_in_flight,
+    max_per_tenant=settings.admission_max_per_org,
+    max_queue=settings.admission_max_queue,
+    max_wait_seconds=settings.admission_max_wait_ms / 1000,
+)
+
+# sha256 of a verified bearer token -> organization id, filled in by the auth dependencies
+_token_orgs: Dict[str, int] = {}
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("latin-1", "replace")).hexdigest()
+
+
+def remember_tenant(token: str, organization_id: Optional[int]) -> None:
+    """Record the organization of a token that passed authentication, so its next requests share the org's slots."""
+    if organization_id is None:
+        return
+    if len(_token_orgs) >= MAX_KNOWN_TENANTS:
+        _token_orgs.clear()
+    _token_orgs[_token_digest(token)] = organization_id
+
+
+def tenant_key(scope: Scope) -> str:
+    """Organization of a verified token, else the client IP."""
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                organization_id = _token_orgs.get(_token_digest(token))
+                if organization_id is not None:
+                    return f"org:{organization_id}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def overloaded_response(reason: str) -> JSONResponse:
+    """503 telling the client when to retry."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry shortly", "reason": reason},
+        headers={"Retry-After": str(settings.admission_retry_after_seconds)},
+    )
+
+
+class AdmissionMiddleware:
+    """Admit HTTP requests through the global AdmissionController."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.admission_enabled
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(EXEMPT_PATHS)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        tenant = tenant_key(scope)
+        reason = await admission.acquire(tenant)
+        if reason is not None:
+            logger.warning(f"Request shed ({reason}) for {tenant} on {scope['path']}")
+            await overloaded_response(reason)(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission.release(tenant)
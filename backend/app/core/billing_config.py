@@ -20,24 +20,28 @@ PLAN_LIMITS: Dict[SubscriptionPlan, Dict[str, Any]] = {
         "max_collaborators": 2,
         "max_clients": 5,
         "max_active_productions": 1,
-        "features": ["basic_calendar"]
+        "features": ["basic_calendar"],
+        "rate_limit_multiplier": 1  # API rate limits = base limit x multiplier
     },
     SubscriptionPlan.STARTER: {
         "max_collaborators": 5,
         "max_clients": 999999, # Unlimited
         "max_active_productions": 10,
-        "features": ["basic_calendar", "chat_support"]
+        "features": ["basic_calendar", "chat_support"],
+        "rate_limit_multiplier": 2
     },
     SubscriptionPlan.PRO: {
         "max_collaborators": 20,
         "max_clients": 999999, # Unlimited
         "max_active_productions": 999999, # Unlimited
-        "features": ["advanced_reports", "email_support", "team_management"]
+        "features": ["advanced_reports", "email_support", "team_management"],
+        "rate_limit_multiplier": 5
     },
     SubscriptionPlan.ENTERPRISE: {
         "max_collaborators": 999999,
         "max_clients": 999999,
         "max_active_productions": 999999,
-        "features": ["all"]
+        "features": ["all"],
+        "rate_limit_multiplier": 10
     }
 }
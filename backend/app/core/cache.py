@@ -1,12 +1,20 @@
 """
 Redis cache implementation for SafeTasks V2
 Provides simple caching with TTL for performance optimization
+Values are stored as framed bytes (see app.core.cache_codec)
 """
 
+import hashlib
 import json
 import logging
-from typing import Any, Optional, Union
-import redis.asyncio as redis
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+from app.core.cache_codec import CacheSerializer
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -16,18 +24,27 @@ class Cache:
     """Redis cache wrapper with error handling and graceful degradation"""
 
     def __init__(self):
-        self.client: Optional[redis.Redis] = None
-        self.enabled = False
-
-        # Only initialize if Redis URL is configured
-        if hasattr(settings, 'REDIS_URL') and settings.REDIS_URL:
+        self._client: Optional["redis.Redis"] = None
+        # Only enabled if Redis URL is configured; the client is created on first use
+        self.enabled = bool(settings.redis_url)
+        self.serializer = CacheSerializer(
+            codec=settings.cache_codec,
+            compression=settings.cache_compression,
+            compression_min_bytes=settings.cache_compression_min_bytes,
+        )
+
+    @property
+    def client(self) -> Optional["redis.Redis"]:
+        """Redis client, created on first use so importing the app doesn't load redis"""
+        if self._client is None and self.enabled:
             try:
-                self.client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-                self.enabled = True
+                import redis.asyncio as redis
+                self._client = redis.from_url(settings.redis_url, decode_responses=False)
                 logger.info("Redis cache initialized successfully")
             except Exception as e:
                 logger.warning(f"Redis cache initialization failed: {e}. Continuing without cache.")
                 self.enabled = False
+        return self._client
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
@@ -37,7 +54,7 @@ class Cache:
         try:
             value = await self.client.get(key)
             if value:
-                return json.loads(value)
+                return self.serializer.decode(value)
             return None
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
@@ -49,7 +66,7 @@ class Cache:
             return False
 
         try:
-            serialized = json.dumps(value)
+            serialized = self.serializer.encode(value)
             await self.client.setex(key, ttl_seconds, serialized)
             return True
         except Exception as e:
@@ -69,13 +86,12 @@ class Cache:
             return False
 
     async def delete_pattern(self, pattern: str) -> bool:
-        """Delete all keys matching pattern"""
+        """Delete all keys matching pattern (SCAN, so Redis is never blocked; not for hot paths)"""
         if not self.enabled or not self.client:
             return False
 
         try:
-            # Get all keys matching pattern
-            keys = await self.client.keys(pattern)
+            keys = [key async for key in self.client.scan_iter(match=pattern, count=500)]
             if keys:
                 await self.client.delete(*keys)
             return True
@@ -83,10 +99,88 @@ class Cache:
             logger.warning(f"Cache delete pattern error for {pattern}: {e}")
             return False
 
+    async def get_org_version(self, org_id: int) -> Optional[str]:
+        """
+        Get the opaque data version token for an organization.
+
+        The token changes on every write to the organization's data and is
+        used to build ETags. A fresh random token is created when missing, so
+        an evicted key can never make an old ETag match again.
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        key = CacheKeys.org_version(org_id)
+        try:
+            value = await self.client.get(key)
+            if value is None:
+                await self.client.set(key, uuid.uuid4().hex, nx=True)
+                value = await self.client.get(key)
+            return value.decode("utf-8") if isinstance(value, bytes) else value
+        except Exception as e:
+            logger.warning(f"Cache version get error for org {org_id}: {e}")
+            return None
+
+    async def bump_org_version(self, org_id: int) -> bool:
+        """Replace the organization's data version token (invalidates its ETags)"""
+        if not self.enabled or not self.client:
+            return False
+
+        try:
+            await self.client.set(CacheKeys.org_version(org_id), uuid.uuid4().hex)
+            return True
+        except Exception as e:
+            logger.warning(f"Cache version bump error for org {org_id}: {e}")
+            return False
+
+    async def publish_event(self, org_id: int, event: dict) -> bool:
+        """Publish a change event to the organization's channel (see app.core.events)"""
+        if not self.enabled or not self.client:
+            return False
+
+        try:
+            await self.client.publish(CacheKeys.org_events(org_id), json.dumps(event, default=str))
+            return True
+        except Exception as e:
+            logger.warning(f"Cache publish error for org {org_id}: {e}")
+            return False
+
+    async def invalidate_org(
+        self,
+        org_id: int,
+        resource: str = "organization",
+        action: str = "updated",
+        production_id: Optional[int] = None
+    ) -> None:
+        """
+        Invalidate every cached read for an organization after a write and
+        push a change event to its live subscribers (GET /events).
+
+        Args:
+            resource: What changed (production, item, expense, crew, client, service, user)
+            action: created, updated or deleted
+            production_id: Production affected, when there is one
+        """
+        # List keys embed the version, so bumping it retires them (they expire by TTL)
+        await self.bump_org_version(org_id)
+        await self.delete(CacheKeys.dashboard_summary(org_id))
+        await self.publish_event(org_id, {
+            "resource": resource,
+            "action": action,
+            "production_id": production_id,
+            "ts": time.time(),
+        })
+
+    async def ping(self) -> bool:
+        """Open a connection and check Redis answers (startup warm-up)"""
+        if not self.enabled or not self.client:
+            return False
+        return bool(await self.client.ping())
+
     async def close(self):
         """Close Redis connection"""
-        if self.client:
-            await self.client.close()
+        if self._client:
+            await self._client.close()
 
 
 # Global cache instance
@@ -98,9 +192,31 @@ class CacheKeys:
     """Standardized cache key generation"""
 
     @staticmethod
-    def productions_list(org_id: int, user_role: str, skip: int = 0, limit: int = 50) -> str:
-        """Cache key for productions list"""
-        return f"productions:list:{org_id}:{user_role}:{skip}:{limit}"
+    def productions_list(
+        org_id: int, version: str, user_role: str, skip: int = 0, limit: int = 50, filters: str = "all"
+    ) -> str:
+        """
+        Cache key for productions list.
+
+        `version` is the organization's data version token (get_org_version):
+        a write bumps it, so the new key misses and old entries just expire.
+        `filters` is the normalized filter set (ProductionFilters.cache_key()),
+        so equivalent queries (same values in any order or case) share a key.
+        Long filter sets are hashed to keep keys short.
+        """
+        if len(filters) > 64:
+            filters = hashlib.sha1(filters.encode("utf-8")).hexdigest()
+        return f"productions:list:{org_id}:{version}:{user_role}:{filters}:{skip}:{limit}"
+
+    @staticmethod
+    def org_version(org_id: int) -> str:
+        """Cache key for the organization data version (ETag seed)"""
+        return f"org:version:{org_id}"
+
+    @staticmethod
+    def org_events(org_id: int) -> str:
+        """Pub/sub channel for the organization's change events"""
+        return f"events:org:{org_id}"
 
     @staticmethod
     def dashboard_summary(org_id: int) -> str:
@@ -0,0 +1,273 @@
+"""
+Serialization codecs for Redis cached payloads.
+
+Cached values are stored as framed bytes:
+
+    FORMAT_VERSION (1 byte) | codec id (1 byte) | compression id (1 byte) | payload
+
+The codec and compression ids are stored with every value, so changing the
+configured codec never breaks keys already in Redis. Values written before
+framing existed are plain JSON text and are still decoded transparently.
+
+orjson is a regular dependency; msgpack, zstandard and lz4 come with the
+`cache-codecs` extra (poetry install -E cache-codecs). When a configured
+backend is not installed we fall back to orjson / json and zlib.
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame as lz4_frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    lz4_frame = None
+    LZ4_AVAILABLE = False
+
+
+# First byte of every framed value. JSON text never starts with 0x01,
+# which is how legacy (unframed) values are told apart.
+FORMAT_VERSION = 1
+HEADER_SIZE = 3
+
+
+class CacheCodecError(Exception):
+    """Raised when a cached value cannot be encoded or decoded."""
+    pass
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types the codecs don't handle natively (datetimes, UUIDs, enums)."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class Codec:
+    """Base class for value codecs."""
+    codec_id: int = 0
+    name: str = ""
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Stdlib json codec (always available)."""
+    codec_id = 1
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson codec - serializes datetimes/UUIDs natively and is several times faster."""
+    codec_id = 2
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """msgpack codec - most compact encoding for large numeric lists."""
+    codec_id = 3
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class Compressor:
+    """Base class for payload compressors."""
+    compression_id: int = 0
+    name: str = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZlibCompressor(Compressor):
+    compression_id = 1
+    name = "zlib"
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, 6)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    compression_id = 2
+    name = "zstd"
+
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    compression_id = 3
+    name = "lz4"
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+# name -> (factory, available)
+CODECS: Dict[str, tuple[Callable[[], Codec], bool]] = {
+    JsonCodec.name: (JsonCodec, True),
+    OrjsonCodec.name: (OrjsonCodec, ORJSON_AVAILABLE),
+    MsgpackCodec.name: (MsgpackCodec, MSGPACK_AVAILABLE),
+}
+
+COMPRESSORS: Dict[str, tuple[Callable[[], Compressor], bool]] = {
+    Compressor.name: (Compressor, True),
+    ZlibCompressor.name: (ZlibCompressor, True),
+    ZstdCompressor.name: (ZstdCompressor, ZSTD_AVAILABLE),
+    Lz4Compressor.name: (Lz4Compressor, LZ4_AVAILABLE),
+}
+
+
+def _build_codec(name: str) -> Codec:
+    factory, available = CODECS.get(name, (None, False))
+    if factory is None or not available:
+        fallback = OrjsonCodec.name if ORJSON_AVAILABLE else JsonCodec.name
+        logger.warning(f"Cache codec '{name}' not available, falling back to '{fallback}'")
+        return CODECS[fallback][0]()
+    return factory()
+
+
+def _build_compressor(name: str) -> Compressor:
+    factory, available = COMPRESSORS.get(name, (None, False))
+    if factory is None or not available:
+        logger.warning(f"Cache compression '{name}' not available, falling back to 'zlib'")
+        return ZlibCompressor()
+    return factory()
+
+
+class CacheSerializer:
+    """Encodes values into framed bytes and decodes framed or legacy values."""
+
+    def __init__(self, codec: str = "orjson", compression: str = "zlib", compression_min_bytes: int = 1024):
+        self.codec = _build_codec(codec)
+        self.compressor = _build_compressor(compression)
+        self.compression_min_bytes = compression_min_bytes
+        self._uncompressed = Compressor()
+
+        # Decoders for every available backend, so values written under a
+        # previous configuration stay readable.
+        self._codecs_by_id: Dict[int, Codec] = {}
+        for factory, available in CODECS.values():
+            if available:
+                instance = factory()
+                self._codecs_by_id[instance.codec_id] = instance
+
+        self._compressors_by_id: Dict[int, Compressor] = {}
+        for factory, available in COMPRESSORS.values():
+            if available:
+                instance = factory()
+                self._compressors_by_id[instance.compression_id] = instance
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value, compressing it when it exceeds the size threshold."""
+        try:
+            payload = self.codec.dumps(value)
+        except (TypeError, ValueError) as e:
+            raise CacheCodecError(f"Could not encode value with {self.codec.name}: {e}") from e
+
+        compressor = self._uncompressed
+        if self.compressor.compression_id and len(payload) >= self.compression_min_bytes:
+            compressed = self.compressor.compress(payload)
+            # Only keep the compressed form when it actually saves space
+            if len(compressed) < len(payload):
+                payload = compressed
+                compressor = self.compressor
+
+        header = bytes((FORMAT_VERSION, self.codec.codec_id, compressor.compression_id))
+        return header + payload
+
+    def decode(self, raw: Optional[bytes]) -> Any:
+        """Deserialize a framed value, or a legacy plain-JSON value."""
+        if raw is None:
+            return None
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        if not raw:
+            return None
+
+        if raw[0] != FORMAT_VERSION:
+            # Legacy value written with json.dumps before framing
+            return json.loads(raw)
+
+        if len(raw) < HEADER_SIZE:
+            raise CacheCodecError("Truncated cache value header")
+
+        codec = self._codecs_by_id.get(raw[1])
+        compressor = self._compressors_by_id.get(raw[2])
+        if codec is None or compressor is None:
+            raise CacheCodecError(f"Unsupported cache value format (codec={raw[1]}, compression={raw[2]})")
+
+        payload = compressor.decompress(raw[HEADER_SIZE:])
+        return codec.loads(payload)
@@ -52,6 +52,80 @@ class Settings(BaseSettings):
     # 7. Regras de Negócio
     trial_period_days: int = int(os.getenv("TRIAL_PERIOD_DAYS", "7"))
 
+    # 8. Cache (serialização dos valores no Redis)
+    # CACHE_CODEC: json | orjson | msgpack (cai para orjson/json se o pacote não estiver instalado)
+    # CACHE_COMPRESSION: none | zlib | zstd | lz4, aplicada só acima de CACHE_COMPRESSION_MIN_BYTES
+    # msgpack, zstd e lz4 vêm do extra "cache-codecs": poetry install -E cache-codecs
+    cache_codec: str = os.getenv("CACHE_CODEC", "orjson")
+    cache_compression: str = os.getenv("CACHE_COMPRESSION", "zlib")
+    cache_compression_min_bytes: int = int(os.getenv("CACHE_COMPRESSION_MIN_BYTES", "1024"))
+
+    # 9. Compressão das respostas HTTP (gzip, ou brotli com o extra "brotli": poetry install -E brotli)
+    response_compression_min_bytes: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1000"))
+
+    # 10. Rate limiting (contadores compartilhados no Redis, por perfil/organização)
+    rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+
+    # 11. Listagem de produções montada no Postgres (json_build_object/json_agg)
+    # Uma única query devolve o JSON pronto; a API só repassa os bytes
+    productions_sql_json: bool = os.getenv("PRODUCTIONS_SQL_JSON", "false").lower() == "true"
+
+    # 12. Ciclo de vida (lifespan): aquecimento na subida e drenagem no desligamento
+    # /ready só responde 200 depois que banco, Redis e clientes externos estiverem prontos
+    db_pool_warm_connections: int = int(os.getenv("DB_POOL_WARM_CONNECTIONS", "2"))
+    startup_timeout_seconds: float = float(os.getenv("STARTUP_TIMEOUT_SECONDS", "15"))
+    shutdown_drain_seconds: float = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "20"))
+
+    # 13. Controle de admissão (por worker): limite global de requisições em andamento,
+    # limite por organização e fila de espera limitada; o excedente recebe 503 + Retry-After
+    admission_enabled: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    admission_max_in_flight: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "30"))
+    admission_max_per_org: int = int(os.getenv("ADMISSION_MAX_PER_ORG", "8"))
+    admission_max_queue: int = int(os.getenv("ADMISSION_MAX_QUEUE", "100"))
+    admission_max_wait_ms: int = int(os.getenv("ADMISSION_MAX_WAIT_MS", "2000"))
+    admission_retry_after_seconds: int = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "2"))
+    # Espera máxima por uma conexão do pool do banco antes de responder 503
+    db_pool_timeout_seconds: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "5"))
+
+    # 14. Prazo padrão das requisições: limita o handler e o statement_timeout das queries
+    # de cada requisição (rotas com @deadline usam o próprio prazo); estourou, a API responde 504
+    request_deadline_seconds: float = float(os.getenv("REQUEST_DEADLINE_SECONDS", "30"))
+    # Exportação em streaming: prazo total (queries e leitura pelo cliente) da conexão que ela ocupa
+    export_deadline_seconds: float = float(os.getenv("EXPORT_DEADLINE_SECONDS", "300"))
+
+    # 15. Monitor de lag do event loop: mede o atraso do loop e, quando passa do limite,
+    # registra no log a stack da chamada que está bloqueando e a rota da requisição
+    loop_monitor_enabled: bool = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+    loop_lag_interval_ms: int = int(os.getenv("LOOP_LAG_INTERVAL_MS", "250"))
+    loop_lag_threshold_ms: int = int(os.getenv("LOOP_LAG_THRESHOLD_MS", "100"))
+    loop_monitor_slow_callbacks: bool = os.getenv("LOOP_MONITOR_SLOW_CALLBACKS", "false").lower() == "true"
+
+    # 16. Diagnóstico (/api/v1/diagnostics): somente operadores, com o header
+    # "X-Diagnostics-Token" igual a DIAGNOSTICS_TOKEN (vazio: ninguém tem acesso).
+    # Profiler por amostragem: perfil do worker por N segundos em
+    # /api/v1/diagnostics/profile, ou de uma requisição com os headers "X-Profile: 1"
+    # e "X-Diagnostics-Token"
+    diagnostics_token: str = os.getenv("DIAGNOSTICS_TOKEN", "")
+    profiling_enabled: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    profile_max_seconds: int = int(os.getenv("PROFILE_MAX_SECONDS", "60"))
+    profile_interval_ms: float = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+    profile_request_interval_ms: float = float(os.getenv("PROFILE_REQUEST_INTERVAL_MS", "1"))
+
+    # 17. Log de queries lentas (por worker, em /api/v1/diagnostics/slow-queries), com
+    # o plano genérico (EXPLAIN sem os valores dos parâmetros) de uma amostra dos SELECTs lentos
+    slow_query_log_enabled: bool = os.getenv("SLOW_QUERY_LOG_ENABLED", "false").lower() == "true"
+    slow_query_threshold_ms: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    slow_query_log_size: int = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+    slow_query_explain_sample_rate: float = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1"))
+    slow_query_explain_cooldown_seconds: int = int(os.getenv("SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS", "300"))
+
+    # 18. Diagnóstico de memória: RSS/GC em /api/v1/diagnostics/stats e no log a cada
+    # N segundos (0 desliga o log); tracemalloc sob demanda em /api/v1/diagnostics/memory
+    # (somente operadores)
+    memory_diagnostics_enabled: bool = os.getenv("MEMORY_DIAGNOSTICS_ENABLED", "true").lower() == "true"
+    memory_stats_interval_seconds: int = int(os.getenv("MEMORY_STATS_INTERVAL_SECONDS", "300"))
+    tracemalloc_frames: int = int(os.getenv("TRACEMALLOC_FRAMES", "10"))
+
     @property
     def async_database_url(self) -> str:
         """Converte a URL do Render (postgresql://) para o driver Async (postgresql+asyncpg://)"""
@@ -0,0 +1,192 @@
+"""
+Request deadlines: bound how long a request may run and hold a database connection.
+
+Every route has a deadline: REQUEST_DEADLINE_SECONDS by default, or the value
+given with the @deadline(seconds) decorator.
+
+- DeadlineMiddleware runs every request under asyncio.timeout(), so a handler
+  stuck on Supabase, Stripe, Redis or a pool checkout is cancelled too. The
+  default deadline counts from the start of the request; once the route is
+  known (get_db opening the session, or @deadline) it is re-based on the
+  route's own deadline. The timer stops when the response starts, so
+  streaming bodies (events, exports) bound themselves.
+- Each transaction of the request's session starts with
+  `SET LOCAL statement_timeout = <remaining ms>`, so Postgres cancels a query
+  that would outlive the deadline (SET LOCAL ends with the transaction, so
+  nothing leaks to the next user of the pooled connection or to pgbouncer).
+- @deadline also runs the handler under its own asyncio.timeout(), so the
+  override holds wherever the endpoint is called from.
+
+Either timeout answers 504 and is counted in deadline_stats (GET /api/v1/diagnostics/stats).
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres "query_canceled" (raised when statement_timeout fires)
+QUERY_CANCELED_SQLSTATE = "57014"
+
+# Smallest statement_timeout we set (0 would disable it)
+MIN_STATEMENT_TIMEOUT_MS = 100
+
+
+class DeadlineStats:
+    """Timeout counters for this worker."""
+
+    def __init__(self):
+        self.handler_timeouts = 0
+        self.statement_timeouts = 0
+        self.by_route: Dict[str, int] = {}
+
+    def record(self, kind: str, route: str) -> None:
+        if kind == "handler":
+            self.handler_timeouts += 1
+        else:
+            self.statement_timeouts += 1
+        self.by_route[route] = self.by_route.get(route, 0) + 1
+
+    def snapshot(self) -> dict:
+        return {
+            "handler_timeouts": self.handler_timeouts,
+            "statement_timeouts": self.statement_timeouts,
+            "by_route": dict(self.by_route),
+        }
+
+
+deadline_stats = DeadlineStats()
+
+
+def route_name(request: Request) -> str:
+    route = request.scope.get("route")
+    return f"{request.method} {getattr(route, 'path', request.url.path)}"
+
+
+def route_deadline_seconds(request: Request) -> float:
+    """Deadline of the matched route (@deadline value, or the default)."""
+    endpoint = getattr(request.scope.get("route"), "endpoint", None)
+    return getattr(endpoint, "deadline_seconds", settings.request_deadline_seconds)
+
+
+def request_deadline(request: Request) -> float:
+    """Monotonic time the request must finish by (set on first call, and applied to DeadlineMiddleware's timer)."""
+    deadline_at = getattr(request.state, "deadline_at", None)
+    if deadline_at is None:
+        deadline_at = time.monotonic() + route_deadline_seconds(request)
+        request.state.deadline_at = deadline_at
+        timeout = getattr(request.state, "deadline_timeout", None)
+        if timeout is not None and timeout.when() is not None:
+            loop = asyncio.get_running_loop()
+            timeout.reschedule(loop.time() + (deadline_at - time.monotonic()))
+    return deadline_at
+
+
+def apply_statement_timeout(session: AsyncSession, deadline_at: float) -> None:
+    """Start every transaction of the session with a statement_timeout ending at the deadline."""
+
+    @event.listens_for(session.sync_session, "after_begin")
+    def _set_statement_timeout(sync_session, transaction, connection):
+        if connection.dialect.name != "postgresql":
+            return
+        remaining_ms = int((deadline_at - time.monotonic()) * 1000)
+        # SET doesn't take bind parameters; the value is an int we computed
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {max(MIN_STATEMENT_TIMEOUT_MS, remaining_ms)}"
+        )
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    return getattr(getattr(exc, "orig", None), "sqlstate", None) == QUERY_CANCELED_SQLSTATE
+
+
+def deadline_exceeded() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail="The request took too long to complete"
+    )
+
+
+def deadline(seconds: float):
+    """
+    Decorator giving an endpoint its own deadline, e.g. @deadline(10).
+
+    Sets the statement_timeout budget of the request's session and cancels the
+    handler with 504 when it runs past the deadline. Apply it below the
+    rate-limit decorator; the endpoint should take a `request: Request`
+    parameter so the deadline counts from when its session was opened.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Optional[Request] = kwargs.get("request")
+            if request is None:
+                request = next((arg for arg in args if isinstance(arg, Request)), None)
+            remaining = request_deadline(request) - time.monotonic() if request is not None else seconds
+
+            timeout = asyncio.timeout(max(remaining, 0))
+            try:
+                async with timeout:
+                    return await func(*args, **kwargs)
+            except TimeoutError:
+                if not timeout.expired():
+                    raise  # Raised by the handler itself, not our deadline
+                route = route_name(request) if request is not None else func.__name__
+                deadline_stats.record("handler", route)
+                logger.warning(f"Deadline of {seconds:g} s exceeded on {route}")
+                raise deadline_exceeded()
+
+        wrapper.deadline_seconds = seconds
+        return wrapper
+
+    return decorator
+
+
+class DeadlineMiddleware:
+    """Cancel requests that outlive their deadline (504) until the response starts."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        timeout = asyncio.timeout(None)
+        scope.setdefault("state", {})["deadline_timeout"] = timeout
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                timeout.reschedule(None)
+            await send(message)
+
+        try:
+            async with timeout:
+                timeout.reschedule(loop.time() + settings.request_deadline_seconds)
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            if not timeout.expired():
+                raise  # Raised by the handler itself, not our deadline
+            route = route_name(Request(scope))
+            deadline_stats.record("handler", route)
+            logger.warning(f"Deadline exceeded on {route}")
+            if not response_started:
+                error = deadline_exceeded()
+                await JSONResponse(status_code=error.status_code, content={"detail": error.detail})(scope, receive, send)
@@ -0,0 +1,128 @@
+"""
+Live change events for the SSE endpoint (GET /api/v1/events).
+
+Writes publish a small JSON event to the organization's Redis channel (see
+Cache.invalidate_org). Each worker keeps one pub/sub connection, subscribed
+only to the channels of organizations that have a connected client, and fans
+messages out to in-process queues, so the number of Redis connections does not
+grow with the number of open streams.
+
+A subscriber that falls too far behind gets a single {"resource": "resync"}
+event instead of the backlog; clients then catch up with
+GET /productions/changes. Without Redis no events are delivered and clients
+keep polling.
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.core.cache import CacheKeys, cache
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per subscriber before it is told to resync
+SUBSCRIBER_QUEUE_SIZE = 100
+
+RESYNC_EVENT = {"resource": "resync", "action": "resync", "production_id": None}
+
+
+class EventHub:
+    """Per-worker fan-out of organization change events from Redis pub/sub."""
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        return cache.enabled and cache.client is not None
+
+    def _deliver(self, org_id: int, event: dict) -> None:
+        for queue in self._subscribers.get(org_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Too slow: drop the backlog and ask the client to resync
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+    async def _listen(self) -> None:
+        """Read messages from the shared pub/sub connection until cancelled."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None or message.get("type") != "message":
+                    continue
+                channel = message["channel"].decode() if isinstance(message["channel"], bytes) else message["channel"]
+                org_id = int(channel.rsplit(":", 1)[1])
+                self._deliver(org_id, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event listener error: {e}")
+                # Subscribers may have missed events while the connection was down
+                for org_id in list(self._subscribers):
+                    self._deliver(org_id, RESYNC_EVENT)
+                await asyncio.sleep(1.0)
+
+    async def _subscribe_channel(self, org_id: int) -> None:
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = cache.client.pubsub()
+            await self._pubsub.subscribe(CacheKeys.org_events(org_id))
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+
+    async def _unsubscribe_channel(self, org_id: int) -> None:
+        async with self._lock:
+            # A new client may have subscribed while we waited for the lock
+            if self._pubsub is not None and org_id not in self._subscribers:
+                await self._pubsub.unsubscribe(CacheKeys.org_events(org_id))
+
+    @asynccontextmanager
+    async def subscribe(self, org_id: int) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving the organization's events while the context is open."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        first = org_id not in self._subscribers
+        self._subscribers.setdefault(org_id, set()).add(queue)
+        try:
+            if first and self.available:
+                await self._subscribe_channel(org_id)
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(org_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[org_id]
+                    if self.available:
+                        try:
+                            await self._unsubscribe_channel(org_id)
+                        except Exception as e:
+                            logger.warning(f"Event unsubscribe error for org {org_id}: {e}")
+
+    async def close(self) -> None:
+        """Stop the listener and close the pub/sub connection"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception as e:
+                logger.warning(f"Event pub/sub close error: {e}")
+            self._pubsub = None
+
+
+# Global hub instance (one per worker)
+event_hub = EventHub()
@@ -0,0 +1,81 @@
+"""
+ETag / conditional GET helpers for read endpoints.
+
+ETags are derived from the organization's data version token (see
+Cache.get_org_version), which changes on every write. That lets an endpoint
+answer 304 Not Modified before running any list query or serializing a body.
+When Redis is not available no ETag is emitted and responses are unchanged.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.core.cache import cache
+
+# Browsers must revalidate on every poll, but may reuse the body on 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the given parts.
+
+    Weak because the same validator covers the gzip, brotli and identity
+    encodings of a body, which a strong ETag must not (RFC 9110 8.8.3).
+    """
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def version_etag(version: Optional[str], org_id: int, resource: str, *scope: Any) -> Optional[str]:
+    """resource_etag for a data version already fetched (None when unavailable)."""
+    if version is None:
+        return None
+    return make_etag(resource, org_id, version, *scope)
+
+
+async def resource_etag(org_id: int, resource: str, *scope: Any) -> Optional[str]:
+    """
+    Get the current ETag for an organization-scoped resource.
+
+    Args:
+        org_id: Organization that owns the data
+        resource: Resource name (e.g. "productions")
+        scope: Anything else the response depends on (role, profile id, pagination)
+
+    Returns:
+        The ETag, or None when the data version is unavailable
+    """
+    return version_etag(await cache.get_org_version(org_id), org_id, resource, *scope)
+
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """Check the request's If-None-Match header against the current ETag."""
+    if etag is None:
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # Weak comparison as required for If-None-Match (RFC 9110 13.1.2)
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response carrying the validator headers."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag_headers(response: Response, etag: Optional[str]) -> None:
+    """Attach the ETag to a full (200) response."""
+    if etag is None:
+        return
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
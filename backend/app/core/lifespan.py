@@ -0,0 +1,184 @@
+"""
+Application lifespan: startup warm-up, readiness and graceful shutdown.
+
+Long-lived clients (database pool, Redis, pub/sub, Supabase, Stripe) register
+with the ResourceRegistry. On startup each resource is warmed in registration
+order (opening pool connections, pinging Redis, ...) and the app only reports
+ready (GET /ready) once every critical resource is up. On shutdown the app
+stops reporting ready, waits for in-flight requests to finish (up to
+SHUTDOWN_DRAIN_SECONDS) and closes resources in reverse order.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[[], Awaitable[None]]
+
+# Paths that don't count as in-flight work (probes, long-lived streams)
+UNTRACKED_PATHS = ("/health", "/ready", "/api/v1/events")
+
+
+@dataclass
+class Resource:
+    name: str
+    startup: Optional[Hook] = None
+    shutdown: Optional[Hook] = None
+    critical: bool = True  # Readiness waits for it; a failed warm-up keeps the app unready
+    ready: bool = False
+    error: Optional[str] = None
+
+
+class ResourceRegistry:
+    """Ordered set of resources warmed at startup and closed at shutdown."""
+
+    def __init__(self):
+        self.resources: List[Resource] = []
+        self.started = False
+        self.draining = False
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def register(
+        self,
+        name: str,
+        startup: Optional[Hook] = None,
+        shutdown: Optional[Hook] = None,
+        critical: bool = True
+    ) -> None:
+        """Add a resource; hooks run in registration order (shutdown in reverse)."""
+        self.resources.append(Resource(name, startup, shutdown, critical))
+
+    @property
+    def ready(self) -> bool:
+        return self.started and not self.draining and all(
+            resource.ready for resource in self.resources if resource.critical
+        )
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "draining": self.draining,
+            "in_flight": self.in_flight,
+            "resources": {
+                resource.name: "ok" if resource.ready else (resource.error or "pending")
+                for resource in self.resources
+            },
+        }
+
+    async def startup(self) -> None:
+        """Warm every resource (each bounded by STARTUP_TIMEOUT_SECONDS); failures are logged."""
+        for resource in self.resources:
+            start = time.perf_counter()
+            try:
+                if resource.startup is not None:
+                    await asyncio.wait_for(resource.startup(), timeout=settings.startup_timeout_seconds)
+                resource.ready = True
+                logger.info(f"Resource '{resource.name}' ready in {(time.perf_counter() - start) * 1000:.0f} ms")
+            except Exception as e:
+                resource.error = f"{type(e).__name__}: {e}"
+                log = logger.error if resource.critical else logger.warning
+                log(f"Resource '{resource.name}' failed to start: {resource.error}")
+        self.started = True
+
+    async def drain(self) -> None:
+        """Stop reporting ready and wait for in-flight requests to finish."""
+        self.draining = True
+        if self.in_flight:
+            logger.info(f"Draining {self.in_flight} in-flight request(s)")
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=settings.shutdown_drain_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(f"Shutdown drain timed out with {self.in_flight} request(s) still running")
+
+    async def shutdown(self) -> None:
+        """Drain, then close resources in reverse order (errors are logged, not raised)."""
+        await self.drain()
+        for resource in reversed(self.resources):
+            if resource.shutdown is None:
+                continue
+            try:
+                await resource.shutdown()
+                logger.info(f"Resource '{resource.name}' closed")
+            except Exception as e:
+                logger.warning(f"Resource '{resource.name}' failed to close: {e}")
+            resource.ready = False
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self._idle.clear()
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+
+# Global registry (one per worker)
+registry = ResourceRegistry()
+
+
+class InFlightMiddleware:
+    """Count in-flight HTTP requests so shutdown can wait for them."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(UNTRACKED_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        registry.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            registry.request_finished()
+
+
+def register_default_resources() -> None:
+    """Register the app's shared clients, in dependency order."""
+    from app.core.cache import cache
+    from app.core.events import event_hub
+    from app.core.loop_monitor import loop_monitor
+    from app.core.memory import memory_stats_logger
+    from app.core.stripe_client import close_stripe, init_stripe
+    from app.core.supabase_client import close_supabase, init_supabase
+    from app.db.session import dispose_engine, warm_up_pool
+
+    async def warm_database():
+        await warm_up_pool(settings.db_pool_warm_connections)
+
+    async def ping_redis():
+        if cache.enabled and not await cache.ping():
+            raise ConnectionError("Redis did not answer PING")
+
+    registry.register("database", warm_database, dispose_engine)
+    registry.register("redis", ping_redis, cache.close, critical=False)  # Cache degrades gracefully
+    registry.register("events", None, event_hub.close, critical=False)
+    registry.register("supabase", init_supabase, close_supabase)
+    registry.register("stripe", init_stripe, close_stripe, critical=False)
+    if settings.loop_monitor_enabled:
+        registry.register("loop_monitor", loop_monitor.start, loop_monitor.stop, critical=False)
+    if settings.memory_diagnostics_enabled:
+        registry.register("memory_stats", memory_stats_logger.start, memory_stats_logger.stop, critical=False)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """FastAPI lifespan: warm registered resources, then drain and close them."""
+    await registry.startup()
+    try:
+        yield
+    finally:
+        await registry.shutdown()
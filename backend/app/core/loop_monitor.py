@@ -0,0 +1,149 @@
+"""
+Event-loop lag monitor: finds blocking calls (sync SDK calls, heavy CPU work,
+synchronous I/O) running inside async handlers.
+
+- A heartbeat task sleeps LOOP_LAG_INTERVAL_MS at a time and records how late
+  it wakes up in a histogram. That delay is the loop lag every request
+  handled by this worker felt.
+- A watchdog thread checks whether the heartbeat is overdue. Once the loop has
+  been stuck for more than LOOP_LAG_THRESHOLD_MS, it captures the loop
+  thread's stack *while it is still blocked* (the blocking call is on top)
+  and logs it with the route of the request that was running.
+- Optionally (LOOP_MONITOR_SLOW_CALLBACKS=true) asyncio debug mode also logs
+  every callback slower than the threshold. Debug mode slows the loop down, so
+  only turn it on while investigating.
+
+Stats are reported under "event_loop" in GET /api/v1/diagnostics/stats.
+"""
+
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the lag histogram buckets; the last bucket is unbounded
+LAG_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+# Deepest stack logged for a blocked loop
+MAX_STACK_FRAMES = 30
+
+
+def route_from_frame(frame: Optional[FrameType]) -> Optional[str]:
+    """Route of the request whose code is running in `frame` (from the ASGI scope of an outer frame)."""
+    while frame is not None:
+        scope = frame.f_locals.get("scope")
+        if isinstance(scope, dict) and scope.get("type") == "http":
+            route = scope.get("route")
+            return f"{scope.get('method')} {getattr(route, 'path', None) or scope.get('path')}"
+        frame = frame.f_back
+    return None
+
+
+class LoopLagMonitor:
+    """Heartbeat-based loop lag histogram plus a watchdog that captures blocking stacks."""
+
+    def __init__(self, interval_seconds: float, threshold_seconds: float):
+        self.interval = interval_seconds
+        self.threshold = threshold_seconds
+        self.counts: List[int] = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.samples = 0
+        self.max_lag_ms = 0.0
+        self.blocked_reports = 0
+        self._due: Optional[float] = None  # time.monotonic() the heartbeat should wake up at
+        self._reported_due: Optional[float] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def record(self, lag_ms: float) -> None:
+        self.counts[bisect.bisect_left(LAG_BUCKETS_MS, lag_ms)] += 1
+        self.samples += 1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the given percentile (None above the last bound)."""
+        if not self.samples:
+            return 0.0
+        target = fraction * self.samples
+        seen = 0
+        for bound, count in zip(LAG_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    async def _beat(self) -> None:
+        while True:
+            self._due = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.monotonic() - self._due) * 1000)
+
+    def _watch(self) -> None:
+        """Watchdog thread: report the loop's stack once per stall longer than the threshold."""
+        while not self._stopped.wait(self.threshold / 2):
+            due = self._due
+            if due is None or due == self._reported_due:
+                continue
+            stalled = time.monotonic() - due
+            if stalled < self.threshold:
+                continue
+            self._reported_due = due
+            self.blocked_reports += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=MAX_STACK_FRAMES)) if frame else "<unavailable>"
+            route = route_from_frame(frame) or "no request"
+            logger.warning(
+                f"Event loop blocked for {stalled * 1000:.0f}+ ms ({route}); loop thread stack:\n{stack}",
+                extra={"route": route, "blocked_ms": round(stalled * 1000)}
+            )
+            del frame
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._heartbeat = asyncio.create_task(self._beat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        if settings.loop_monitor_slow_callbacks:
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.threshold
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        self._due = None
+
+    def stats(self) -> dict:
+        labels = [f"le_{bound}ms" for bound in LAG_BUCKETS_MS] + [f"gt_{LAG_BUCKETS_MS[-1]}ms"]
+        return {
+            "samples": self.samples,
+            "p50_ms": self.percentile(0.50),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_lag_ms, 1),
+            "blocked_reports": self.blocked_reports,
+            "histogram": dict(zip(labels, self.counts)),
+        }
+
+
+# Global monitor (one per worker), started by the lifespan
+loop_monitor = LoopLagMonitor(
+    interval_seconds=settings.loop_lag_interval_ms / 1000,
+    threshold_seconds=settings.loop_lag_threshold_ms / 1000,
+)
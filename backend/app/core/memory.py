@@ -0,0 +1,213 @@
+"""
+Memory diagnostics for long-running workers: find leaks and large
+allocations without attaching a debugger.
+
+- memory_stats(): RSS, garbage collector counters and pauses, and the size of
+  the in-process caches that grow with traffic. Reported under "memory" in
+  GET /api/v1/diagnostics/stats, and logged every MEMORY_STATS_INTERVAL_SECONDS
+  by a background task so growth shows up in the logs.
+- MemoryTracer: tracemalloc baseline/diff. Take a baseline, let the worker
+  run (or call the suspect endpoint, e.g. GET /api/v1/productions/), then
+  diff: the top allocation sites by growth since the baseline. tracemalloc
+  slows allocations down and uses memory of its own, so it only runs between
+  start and stop (operators, /api/v1/diagnostics/memory/*). Snapshots take
+  seconds on a large heap: call start, top and diff from a thread.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Allocations made by the tracing machinery itself
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size (Linux), else None."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+class GCPauses:
+    """Collections and pause time per generation, via gc.callbacks."""
+
+    def __init__(self):
+        self.pause_ms = [0.0, 0.0, 0.0]
+        self.max_pause_ms = 0.0
+        self._started: Optional[float] = None
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            elapsed_ms = (time.perf_counter() - self._started) * 1000
+            self.pause_ms[info["generation"]] += elapsed_ms
+            self.max_pause_ms = max(self.max_pause_ms, elapsed_ms)
+            self._started = None
+
+    def install(self) -> None:
+        if self not in gc.callbacks:
+            gc.callbacks.append(self)
+
+
+gc_pauses = GCPauses()
+
+
+def _in_memory_state() -> dict:
+    """Sizes of the per-worker structures that grow with traffic."""
+    from app.core.rate_limit import limiter
+    from app.core.slow_queries import _slow_queries
+    from app.services.billing_service import _processed_sessions
+
+    return {
+        "rate_limit_buckets": len(limiter._buckets),
+        "processed_checkout_sessions": len(_processed_sessions),
+        "slow_queries": len(_slow_queries),
+    }
+
+
+def memory_stats() -> dict:
+    generations = gc.get_stats()
+    traced, traced_peak = tracemalloc.get_traced_memory()
+    rss = rss_bytes()
+    return {
+        "rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+        "peak_rss_mb": round(peak_rss_bytes() / 2**20, 1),
+        "gc": {
+            "pending": gc.get_count(),
+            "collections": [generation["collections"] for generation in generations],
+            "collected": [generation["collected"] for generation in generations],
+            "uncollectable": [generation["uncollectable"] for generation in generations],
+            "garbage": len(gc.garbage),
+            "pause_ms": [round(pause, 1) for pause in gc_pauses.pause_ms],
+            "max_pause_ms": round(gc_pauses.max_pause_ms, 1),
+        },
+        "tracemalloc": {
+            "tracing": tracemalloc.is_tracing(),
+            "traced_mb": round(traced / 2**20, 1),
+            "traced_peak_mb": round(traced_peak / 2**20, 1),
+        },
+        "state": _in_memory_state(),
+    }
+
+
+def _format_stat(stat) -> dict:
+    entry = {
+        "size_kb": round(stat.size / 1024, 1),
+        "count": stat.count,
+        "traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+    }
+    if isinstance(stat, tracemalloc.StatisticDiff):
+        entry["size_diff_kb"] = round(stat.size_diff / 1024, 1)
+        entry["count_diff"] = stat.count_diff
+    return entry
+
+
+class NoBaseline(Exception):
+    """diff() or top() without a baseline (tracing stopped, or never started)."""
+
+
+class MemoryTracer:
+    """tracemalloc baseline and diff for this worker."""
+
+    def __init__(self):
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.baseline_at: Optional[float] = None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in _IGNORED_FILES])
+
+    def start(self, frames: int) -> None:
+        """Start tracing (if needed) and take the baseline."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info(f"tracemalloc started ({frames} frames)")
+        tracemalloc.reset_peak()
+        self.baseline = self._snapshot()
+        self.baseline_at = time.time()
+
+    def top(self, group_by: str, limit: int) -> List[dict]:
+        """Largest live allocation sites."""
+        try:
+            snapshot = self._snapshot()
+        except RuntimeError:  # stop() ran meanwhile: tracemalloc is off
+            raise NoBaseline()
+        return [_format_stat(stat) for stat in snapshot.statistics(group_by)[:limit]]
+
+    def diff(self, group_by: str, limit: int) -> List[dict]:
+        """Allocation sites that grew the most since the baseline."""
+        baseline = self.baseline  # stop() may clear it meanwhile
+        if baseline is None:
+            raise NoBaseline()
+        try:
+            snapshot = self._snapshot()
+        except RuntimeError:
+            raise NoBaseline()
+        stats = snapshot.compare_to(baseline, group_by)
+        return [_format_stat(stat) for stat in stats[:limit]]
+
+    def stop(self) -> None:
+        self.baseline = None
+        self.baseline_at = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc stopped")
+
+
+memory_tracer = MemoryTracer()
+
+
+class MemoryStatsLogger:
+    """Background task logging memory_stats() every MEMORY_STATS_INTERVAL_SECONDS."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            stats = memory_stats()
+            logger.info(
+                f"Memory: rss {stats['rss_mb']} MB (peak {stats['peak_rss_mb']} MB), "
+                f"gc collections {stats['gc']['collections']}, state {stats['state']}",
+                extra={"rss_mb": stats["rss_mb"], "gc_pause_ms": stats["gc"]["pause_ms"]}
+            )
+
+    async def start(self) -> None:
+        gc_pauses.install()
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+memory_stats_logger = MemoryStatsLogger(settings.memory_stats_interval_seconds)
@@ -0,0 +1,224 @@
+"""
+Sampling profiler for a running worker, exported in speedscope's format
+(open the file at https://www.speedscope.app).
+
+A background thread samples Python stacks every few milliseconds, so the
+profiled code isn't instrumented and runs at almost full speed:
+
+- profile_worker(): samples the event-loop thread for N seconds (every request
+  this worker serves, plus idle time spent in the selector);
+- ProfilingMiddleware: with the `X-Profile: 1` header, samples only the task
+  serving that request. While the request awaits (a query, an HTTP call), the
+  sample is its await chain, so the profile is wall-clock time, not just CPU.
+  The operator token (`X-Diagnostics-Token`) is checked before sampling
+  starts; without it the header is ignored and the request runs as usual.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.security import verify_diagnostics_token
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+TOKEN_HEADER = b"x-diagnostics-token"
+
+# Streams never finish, so they can't be profiled per request
+UNPROFILED_PATHS = ("/api/v1/events",)
+
+# Deepest stack kept per sample
+MAX_DEPTH = 200
+
+_FrameKey = Tuple[str, str, int]
+
+
+class SamplingProfiler:
+    """Collects stacks (root first) and renders them as a speedscope sampled profile."""
+
+    def __init__(self, name: str, interval_seconds: float):
+        self.name = name
+        self.interval = interval_seconds
+        self.frames: List[dict] = []
+        self._frame_ids: Dict[_FrameKey, int] = {}
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self.started_at = time.perf_counter()
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _frame_id(self, code: CodeType) -> int:
+        key = (code.co_qualname, code.co_filename, code.co_firstlineno)
+        frame_id = self._frame_ids.get(key)
+        if frame_id is None:
+            frame_id = self._frame_ids[key] = len(self.frames)
+            self.frames.append({"name": key[0], "file": key[1], "line": key[2]})
+        return frame_id
+
+    def add(self, stack: List[FrameType], weight: float) -> None:
+        if stack:
+            self.samples.append([self._frame_id(frame.f_code) for frame in stack[-MAX_DEPTH:]])
+            self.weights.append(weight)
+
+    def run(self, collect: Callable[[], List[FrameType]]) -> None:
+        """Sample `collect()` every interval until stop() (call from a dedicated thread)."""
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            self.add(collect(), now - last)
+            last = now
+
+    def start(self, collect: Callable[[], List[FrameType]]) -> None:
+        self._thread = threading.Thread(target=self.run, args=(collect,), name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+
+    def speedscope(self) -> dict:
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "safetasks-sampling-profiler",
+            "shared": {"frames": self.frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": round(self.duration, 6),
+                "samples": self.samples,
+                "weights": [round(weight, 6) for weight in self.weights],
+            }],
+        }
+
+
+def thread_stack(thread_id: int) -> List[FrameType]:
+    """Current stack of a thread, root first."""
+    frame = sys._current_frames().get(thread_id)
+    stack = []
+    while frame is not None:
+        stack.append(frame)
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def await_chain(coro) -> List[FrameType]:
+    """Frames of a suspended coroutine and everything it awaits, outermost first."""
+    stack = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        stack.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    return stack
+
+
+def task_stack(task: asyncio.Task, loop_thread_id: int) -> List[FrameType]:
+    """Stack of a task: from the loop thread while it runs, its await chain while suspended."""
+    coro = task.get_coro()
+    root = getattr(coro, "cr_frame", None)
+    if root is None:
+        return []
+    running = thread_stack(loop_thread_id)
+    for index, frame in enumerate(running):
+        if frame is root:
+            return running[index:]
+    return await_chain(coro)
+
+
+_worker_lock = asyncio.Lock()
+
+
+def worker_profile_running() -> bool:
+    return _worker_lock.locked()
+
+
+async def profile_worker(seconds: float, interval_seconds: float) -> dict:
+    """Sample the event-loop thread for `seconds`; returns a speedscope document."""
+    async with _worker_lock:
+        loop_thread_id = threading.get_ident()
+        profiler = SamplingProfiler(f"worker pid {os.getpid()} ({seconds:g} s)", interval_seconds)
+        profiler.start(lambda: thread_stack(loop_thread_id))
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        logger.info(f"Worker profile finished: {len(profiler.samples)} samples over {profiler.duration:.1f} s")
+        return profiler.speedscope()
+
+
+class ProfilingMiddleware:
+    """Profile one request when it carries `X-Profile: 1` and the operator token."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _requested(self, scope: Scope) -> bool:
+        if (
+            scope["type"] != "http"
+            or not settings.profiling_enabled
+            or scope["path"].startswith(UNPROFILED_PATHS)
+        ):
+            return False
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_HEADER) not in (b"1", b"true"):
+            return False
+        return verify_diagnostics_token(headers.get(TOKEN_HEADER, b"").decode("latin-1"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        loop_thread_id = threading.get_ident()
+        task = asyncio.current_task()
+        profiler = SamplingProfiler(
+            f"{scope['method']} {scope['path']}", settings.profile_request_interval_ms / 1000
+        )
+        messages: List[Message] = []
+
+        async def buffer(message: Message) -> None:
+            messages.append(message)
+
+        profiler.start(lambda: task_stack(task, loop_thread_id))
+        try:
+            await self.app(scope, receive, buffer)
+        finally:
+            profiler.stop()
+
+        start = next((m for m in messages if m["type"] == "http.response.start"), None)
+        original_status = start["status"] if start else 500
+        route = scope.get("route")
+        profiler.name = f"{scope['method']} {getattr(route, 'path', scope['path'])} -> {original_status}"
+        body = json.dumps(profiler.speedscope()).encode()
+        logger.info(f"Profiled {profiler.name}: {len(profiler.samples)} samples in {profiler.duration * 1000:.0f} ms")
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"content-disposition", b'attachment; filename="request.speedscope.json"'),
+                (b"x-profiled-status", str(original_status).encode()),
+                (b"x-profile-duration-ms", f"{profiler.duration * 1000:.1f}".encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,14 +1,31 @@
 """
 Rate limiting configuration for the API.
 
-Uses slowapi to implement rate limiting per IP address to prevent abuse.
+Limits are enforced per authenticated profile (IP address as fallback) with a
+sliding window kept in Redis, so every uvicorn worker shares the same counters.
+
+To avoid a Redis round trip on every request, each worker leases a small batch
+of tokens from the shared window and spends them locally; Redis is only hit
+when the local lease runs out, and a key that is over its limit is rejected
+locally until its window ends. Limits scale with the organization's plan
+(see "rate_limit_multiplier" in PLAN_LIMITS).
+
+Without Redis the limiter falls back to per-worker in-memory windows.
 """
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+import functools
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
 
-# Create limiter instance
-limiter = Limiter(key_func=get_remote_address)
+from fastapi import HTTPException, Request, status
+
+from app.core.billing_config import PLAN_LIMITS, SubscriptionPlan
+from app.core.cache import cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 # Rate limit configurations
 # Format: "number of requests / time period"
@@ -19,4 +36,219 @@ RATE_LIMITS = {
     "read": "200/minute",  # Read operations: 200 requests per minute
 }
 
+PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def parse_limit(limit_value: str) -> Tuple[int, int]:
+    """Parse "30/minute" into (30, 60)."""
+    amount, _, period = limit_value.partition("/")
+    period = period.strip().lower().rstrip("s")
+    if period not in PERIODS:
+        raise ValueError(f"Invalid rate limit period: {limit_value}")
+    return int(amount), PERIODS[period]
+
+
+def get_remote_address(request: Request) -> str:
+    """Client IP address (uvicorn resolves proxy headers when configured)."""
+    return request.client.host if request.client else "127.0.0.1"
+
+
+def get_rate_limit_key(request: Request) -> str:
+    """Key requests by authenticated organization/profile, falling back to IP address."""
+    profile = getattr(request.state, "profile", None)
+    if profile is not None:
+        return f"org:{profile.organization_id}:profile:{profile.id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+def get_plan_multiplier(request: Request) -> int:
+    """
+    Limit multiplier for the request's organization plan.
+
+    Uses the organization loaded by the subscription dependency; requests
+    without it get the FREE plan limits.
+    """
+    organization = getattr(request.state, "organization", None)
+    try:
+        plan = SubscriptionPlan(getattr(organization, "subscription_plan", None))
+    except ValueError:
+        plan = SubscriptionPlan.FREE
+    limits = PLAN_LIMITS.get(plan, PLAN_LIMITS[SubscriptionPlan.FREE])
+    return limits.get("rate_limit_multiplier", 1)
+
+
+@dataclass
+class _LocalBucket:
+    """Tokens leased by this worker for one key and window."""
+    window: int
+    period: int
+    tokens: int
+    blocked_until: float = 0.0
+
+
+class RateLimiter:
+    """Distributed sliding-window rate limiter with local token leases."""
+
+    def __init__(
+        self,
+        key_func: Callable[[Request], str] = get_rate_limit_key,
+        lease_fraction: float = 0.1,
+        max_lease: int = 10,
+        max_local_keys: int = 10000,
+    ):
+        self.key_func = key_func
+        self.lease_fraction = lease_fraction
+        self.max_lease = max_lease
+        self.max_local_keys = max_local_keys
+        self.enabled = settings.rate_limit_enabled
+        self._buckets: Dict[str, _LocalBucket] = {}
+
+    def _lease_size(self, limit: int) -> int:
+        return max(1, min(self.max_lease, int(limit * self.lease_fraction)))
+
+    async def _lease_from_redis(self, bucket_key: str, limit: int, period: int, window: int, now: float) -> Optional[int]:
+        """
+        Take up to a lease of tokens from the shared sliding window.
+
+        The window is approximated from the current and previous fixed windows
+        (previous count weighted by how much of it still overlaps). Returns the
+        number of tokens granted, or None when Redis is unavailable.
+        """
+        if not cache.enabled or not cache.client:
+            return None
 
+        lease = self._lease_size(limit)
+        current_key = f"ratelimit:{bucket_key}:{window}"
+        previous_key = f"ratelimit:{bucket_key}:{window - 1}"
+
+        try:
+            pipe = cache.client.pipeline(transaction=False)
+            pipe.incrby(current_key, lease)
+            pipe.expire(current_key, period * 2)
+            pipe.get(previous_key)
+            current, _, previous = await pipe.execute()
+
+            previous_weight = 1 - (now - window * period) / period
+            used = int(previous or 0) * previous_weight + (current - lease)
+            granted = max(0, min(lease, int(limit - used)))
+
+            # Give back what we couldn't use so other workers can
+            if granted < lease:
+                await cache.client.decrby(current_key, lease - granted)
+            return granted
+        except Exception as e:
+            logger.warning(f"Rate limit Redis error for {bucket_key}: {e}")
+            return None
+
+    def _prune(self, now: float) -> None:
+        """
+        Keep the local buckets under max_local_keys (called before adding one).
+
+        Buckets of past windows are dropped (their leftover tokens can't be
+        spent anymore) unless they still block their key. If the live buckets
+        alone are over the cap, the oldest leases go too, down to half the cap,
+        so pruning doesn't run again on every request. Redis holds the real
+        counts, so an evicted key only costs one extra Redis hop.
+        """
+        if len(self._buckets) < self.max_local_keys:
+            return
+        live = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket.window == int(now // bucket.period) or bucket.blocked_until > now
+        }
+        keep = max(1, self.max_local_keys // 2)
+        if len(live) > keep:
+            live = dict(list(live.items())[-keep:])
+        self._buckets = live
+
+    async def hit(self, bucket_key: str, limit: int, period: int) -> Tuple[bool, float]:
+        """
+        Register one request for a key.
+
+        Returns:
+            (allowed, retry_after_seconds)
+        """
+        now = time.time()
+        window = int(now // period)
+        window_end = (window + 1) * period
+        bucket = self._buckets.get(bucket_key)
+
+        # Local pre-check: no Redis hop while blocked or while leased tokens remain
+        if bucket is not None:
+            if bucket.blocked_until > now:
+                return False, bucket.blocked_until - now
+            if bucket.window == window and bucket.tokens > 0:
+                bucket.tokens -= 1
+                return True, 0.0
+
+        granted = await self._lease_from_redis(bucket_key, limit, period, window, now)
+        if granted is None:
+            # Per-worker fallback: one fixed window holding the whole limit
+            first_in_window = bucket is None or bucket.window != window
+            granted = limit if first_in_window else 0
+
+        # Re-insert so the dict stays ordered from oldest to newest lease
+        self._buckets.pop(bucket_key, None)
+        self._prune(now)
+        if granted <= 0:
+            self._buckets[bucket_key] = _LocalBucket(window=window, period=period, tokens=0, blocked_until=window_end)
+            return False, window_end - now
+
+        self._buckets[bucket_key] = _LocalBucket(window=window, period=period, tokens=granted - 1)
+        return True, 0.0
+
+    async def check(self, request: Request, scope: str, limit_value: str) -> None:
+        """Raise 429 Too Many Requests when the request's key is over the limit."""
+        amount, period = parse_limit(limit_value)
+        limit = amount * get_plan_multiplier(request)
+        bucket_key = f"{scope}:{self.key_func(request)}"
+
+        allowed, retry_after = await self.hit(bucket_key, limit, period)
+        if not allowed:
+            logger.warning(
+                "Rate limit exceeded",
+                extra={"scope": scope, "key": bucket_key, "limit": limit, "period": period}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Rate limit exceeded: {limit} per {period} seconds",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+    def limit(self, limit_value: str):
+        """
+        Decorator limiting an endpoint, e.g. @limiter.limit("30/minute").
+
+        The endpoint must take a `request: Request` parameter. Dependencies run
+        before the wrapper, so the authenticated profile and organization are
+        already on request.state when the limit is checked.
+        """
+        parse_limit(limit_value)  # Fail fast on invalid limits
+
+        def decorator(func):
+            scope = f"{func.__module__}.{func.__name__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if request is None:
+                    request = next((arg for arg in args if isinstance(arg, Request)), None)
+                if request is None:
+                    raise RuntimeError(f"{func.__name__} needs a 'request: Request' parameter to be rate limited")
+
+                if self.enabled:
+                    await self.check(request, scope, limit_value)
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+# Create limiter instance
+limiter = RateLimiter()
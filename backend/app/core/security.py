@@ -1,25 +1,39 @@
+import hmac
 from datetime import datetime, timedelta
-from jose import jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import Optional
 
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=None)
+def _pwd_context():
+    """Password hashing context (passlib is imported on first use: legacy auth only)."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
+
+
+def verify_diagnostics_token(token: Optional[str]) -> bool:
+    """Operator credential for diagnostics (DIAGNOSTICS_TOKEN); unset means nobody has it."""
+    if not settings.diagnostics_token or not token:
+        return False
+    return hmac.compare_digest(token.encode(), settings.diagnostics_token.encode())
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Create JWT access token."""
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -0,0 +1,184 @@
+"""
+Slow query log: every statement slower than SLOW_QUERY_THRESHOLD_MS is kept in a
+per-worker ring buffer (GET /api/v1/diagnostics/slow-queries) and logged.
+
+Each entry has the statement, the route and organization of the request
+that ran it, and the *shape* of its bind parameters (types and list
+lengths, never values). A sample of slow SELECTs (SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+at most once per statement every SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS) gets its
+generic plan: the statement is prepared with plan_cache_mode =
+force_generic_plan and explained with NULL parameters, so the plan shows $1,
+$2... instead of the request's values, and the query is not run again. It
+happens on the same connection and transaction, inside a savepoint so a
+failure can't abort the request's transaction.
+
+The request context comes from a ContextVar set by get_db; SQLAlchemy runs
+the sync event hooks in the same context as the awaiting task.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.deadlines import route_name
+
+logger = logging.getLogger(__name__)
+
+# Request whose database session is running the statement (set by get_db)
+current_request: ContextVar[Optional[Request]] = ContextVar("current_request", default=None)
+
+# Longest statement text kept per entry
+MAX_STATEMENT_CHARS = 4000
+
+_WRITE_KEYWORDS = {"INSERT", "UPDATE", "DELETE", "MERGE"}
+
+_slow_queries: Deque[Dict[str, Any]] = deque(maxlen=settings.slow_query_log_size)
+_explained_at: Dict[str, float] = {}
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """Types of the bind parameters (list/tuple lengths included), without their values."""
+    if isinstance(parameters, dict):
+        return {str(key): parameter_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and all(isinstance(value, (list, tuple, dict)) for value in parameters):
+            return [parameter_shape(value) for value in parameters[:5]]  # executemany: first rows
+        return [
+            f"{type(value).__name__}[{len(value)}]" if isinstance(value, (list, tuple, set)) else type(value).__name__
+            for value in parameters
+        ]
+    return type(parameters).__name__
+
+
+def _request_context() -> Dict[str, Any]:
+    request = current_request.get()
+    if request is None:
+        return {"route": None, "organization_id": None}
+    profile = getattr(request.state, "profile", None)
+    return {
+        "route": route_name(request),
+        "organization_id": getattr(profile, "organization_id", None),
+    }
+
+
+def _is_read_only(statement: str) -> bool:
+    """SELECT, or a WITH query without data-modifying CTEs."""
+    words = re.findall(r"[A-Z_]+", statement.upper())
+    if not words or words[0] not in ("SELECT", "WITH"):
+        return False
+    return words[0] == "SELECT" or not _WRITE_KEYWORDS.intersection(words)
+
+
+def _should_explain(connection, statement: str, fingerprint: str) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    if not _is_read_only(statement):
+        return False  # Only reads are worth a plan
+    if random.random() >= settings.slow_query_explain_sample_rate:
+        return False
+    now = time.monotonic()
+    if now - _explained_at.get(fingerprint, float("-inf")) < settings.slow_query_explain_cooldown_seconds:
+        return False
+    if len(_explained_at) > 1000:
+        _explained_at.clear()
+    _explained_at[fingerprint] = now
+    return True
+
+
+def _explain_execute(statement: str) -> str:
+    """EXPLAIN EXECUTE of the prepared statement, every parameter NULL (never the request's values)."""
+    placeholders = [int(number) for number in re.findall(r"\$(\d+)", statement)]
+    if not placeholders:
+        return "EXPLAIN EXECUTE slow_query_explain"
+    return f"EXPLAIN EXECUTE slow_query_explain({', '.join(['NULL'] * max(placeholders))})"
+
+
+def _explain(connection, statement: str) -> Optional[str]:
+    """Generic plan of the statement, in a savepoint of the current transaction."""
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        prepared = False
+        try:
+            cursor.execute("SET LOCAL plan_cache_mode = force_generic_plan")
+            cursor.execute(f"PREPARE slow_query_explain AS {statement}")
+            prepared = True
+            cursor.execute(_explain_execute(statement))
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            plan = f"EXPLAIN failed: {e}"
+        # Undoes SET LOCAL (and any error); prepared statements outlive the savepoint
+        cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        if prepared:
+            cursor.execute("DEALLOCATE slow_query_explain")
+        return plan
+    except Exception as e:
+        logger.warning(f"Could not EXPLAIN slow query: {e}")
+        return None
+    finally:
+        cursor.close()
+
+
+def record_slow_query(connection, statement: str, parameters: Any, duration_ms: float, executemany: bool) -> dict:
+    fingerprint = hashlib.sha1(statement.encode()).hexdigest()[:12]
+    entry = {
+        "timestamp": time.time(),
+        "duration_ms": round(duration_ms, 1),
+        "fingerprint": fingerprint,
+        "statement": statement[:MAX_STATEMENT_CHARS],
+        "parameters": parameter_shape(parameters),
+        "executemany": executemany,
+        **_request_context(),
+        "explain": None,
+    }
+    if not executemany and _should_explain(connection, statement, fingerprint):
+        entry["explain"] = _explain(connection, statement)
+    _slow_queries.append(entry)
+    logger.warning(
+        f"Slow query ({entry['duration_ms']} ms) on {entry['route'] or 'no request'}: {statement[:200]}",
+        extra={"duration_ms": entry["duration_ms"], "route": entry["route"],
+               "org_id": entry["organization_id"], "fingerprint": fingerprint}
+    )
+    return entry
+
+
+def install(engine: Engine) -> None:
+    """Time every statement of the engine and record the slow ones."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _check_duration(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms >= settings.slow_query_threshold_ms:
+            try:
+                record_slow_query(conn, statement, parameters, duration_ms, executemany)
+            except Exception as e:
+                logger.warning(f"Slow query log error: {e}")
+
+
+def recent(limit: int) -> List[dict]:
+    """Newest slow queries first."""
+    return list(reversed(_slow_queries))[:limit]
+
+
+def clear() -> None:
+    _slow_queries.clear()
+    _explained_at.clear()
@@ -0,0 +1,35 @@
+"""
+Lazily imported, configured Stripe SDK.
+
+`import stripe` costs tens of milliseconds and is only needed by billing
+endpoints and webhooks, so it is kept out of the app's import path:
+call get_stripe() where the SDK is used instead of importing it at module level.
+"""
+
+from types import ModuleType
+from typing import Optional
+
+from app.core.config import settings
+
+_stripe: Optional[ModuleType] = None
+
+
+def get_stripe() -> ModuleType:
+    """The stripe module, imported and given the API key on first use."""
+    global _stripe
+    if _stripe is None:
+        import stripe
+        stripe.api_key = settings.stripe_secret_key
+        _stripe = stripe
+    return _stripe
+
+
+async def init_stripe() -> None:
+    """One HTTP client (keep-alive session) for every Stripe call."""
+    stripe = get_stripe()
+    stripe.default_http_client = stripe.RequestsClient(timeout=30)
+
+
+async def close_stripe() -> None:
+    if _stripe is not None and _stripe.default_http_client is not None:
+        _stripe.default_http_client.close()
@@ -0,0 +1,123 @@
+"""
+Shared async Supabase client for all server-side Supabase Auth calls.
+
+One client per worker, created at startup (see app.core.lifespan) on a single
+httpx.AsyncClient with a keep-alive connection pool, timeouts and retries of
+failed connection attempts, so requests reuse TLS connections to Supabase and
+never block the event loop.
+
+The shared client is only used for stateless calls (JWT validation, admin API
+with the service role key). Signing in stores a session on the auth client and
+switches its Authorization header to the user's token, so sign_in() runs on a
+short-lived GoTrue client that borrows the same connection pool.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# supabase is imported on first use (it costs ~250 ms at startup); only check it's installed
+SUPABASE_AVAILABLE = importlib.util.find_spec("supabase") is not None
+if not SUPABASE_AVAILABLE:
+    logger.warning("Supabase client not available. Supabase auth features will be disabled.")
+
+if TYPE_CHECKING:
+    import httpx
+    from supabase import AsyncClient
+
+# Connection pool for Supabase calls
+SUPABASE_HTTP_TIMEOUT_SECONDS = 10.0
+SUPABASE_CONNECT_TIMEOUT_SECONDS = 3.0
+SUPABASE_MAX_CONNECTIONS = 20
+SUPABASE_MAX_KEEPALIVE_CONNECTIONS = 10
+# Retries of failed connection attempts (the request was never sent, so safe for POSTs)
+SUPABASE_CONNECT_RETRIES = 2
+
+_client: Optional["AsyncClient"] = None
+_http_client: Optional["httpx.AsyncClient"] = None
+_lock = asyncio.Lock()
+
+
+def _create_http_client() -> "httpx.AsyncClient":
+    import httpx
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(SUPABASE_HTTP_TIMEOUT_SECONDS, connect=SUPABASE_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        transport=httpx.AsyncHTTPTransport(retries=SUPABASE_CONNECT_RETRIES),
+    )
+
+
+async def get_supabase_client() -> "AsyncClient":
+    """Shared service-role Supabase client (created on first use if startup didn't)."""
+    global _client, _http_client
+    if not SUPABASE_AVAILABLE:
+        raise Exception("Supabase client not available")
+    if _client is None:
+        async with _lock:
+            if _client is None:
+                from supabase import AsyncClientOptions, acreate_client
+
+                _http_client = _create_http_client()
+                _client = await acreate_client(
+                    settings.supabase_url,
+                    settings.supabase_service_role_key,
+                    options=AsyncClientOptions(
+                        auto_refresh_token=False,
+                        persist_session=False,
+                        httpx_client=_http_client,
+                    ),
+                )
+    return _client
+
+
+async def sign_in(email: str, password: str):
+    """
+    Sign in with email and password; returns the GoTrue AuthResponse.
+
+    Uses a throwaway GoTrue client (no connections of its own) so the user's
+    session never lands on the shared client.
+    """
+    from supabase_auth import AsyncGoTrueClient
+
+    await get_supabase_client()
+    auth = AsyncGoTrueClient(
+        url=f"{settings.supabase_url}/auth/v1",
+        headers={
+            "apiKey": settings.supabase_service_role_key,
+            "Authorization": f"Bearer {settings.supabase_service_role_key}",
+        },
+        auto_refresh_token=False,
+        persist_session=False,
+        http_client=_http_client,
+    )
+    return await auth.sign_in_with_password({"email": email, "password": password})
+
+
+async def sign_out(access_token: str) -> None:
+    """Revoke the refresh tokens of the session an access token belongs to."""
+    supabase = await get_supabase_client()
+    await supabase.auth.admin.sign_out(access_token, "global")
+
+
+async def init_supabase() -> None:
+    """Create the shared client at startup."""
+    if SUPABASE_AVAILABLE and settings.supabase_url and settings.supabase_service_role_key:
+        await get_supabase_client()
+
+
+async def close_supabase() -> None:
+    """Close the shared client's connection pool."""
+    global _client, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _client = None
+    _http_client = None
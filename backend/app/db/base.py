@@ -5,7 +5,9 @@ from app.models.client import Client
 from app.models.expense import Expense
 from app.models.production import Production
 from app.models.production_item import ProductionItem
+from app.models.production_tombstone import ProductionTombstone
 from app.models.service import Service
+from app.models.shooting_session import ShootingSession
 from app.models.user import Organization, User
 
 # This file is only used by Alembic to discover model metadata
@@ -1,19 +1,29 @@
+import asyncio
+
+from fastapi import Request
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core import slow_queries
+from app.core.deadlines import apply_statement_timeout, request_deadline
 
 # Create async engine
 engine = create_async_engine(
     settings.async_database_url,
     echo=False,
     pool_pre_ping=True,
+    pool_timeout=settings.db_pool_timeout_seconds,  # Bounded checkout wait (503, see app.main)
     connect_args={
         "statement_cache_size": 0,  # CRUCIAL PARA SUPABASE - desabilita prepared statements
         "ssl": "require"            # GARANTIR SSL
     }
 )
 
+if settings.slow_query_log_enabled:
+    slow_queries.install(engine.sync_engine)
+
 # Create async session factory
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -22,10 +32,28 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
-async def get_db() -> AsyncSession:
-    """Dependency to get async database session."""
+async def get_db(request: Request) -> AsyncSession:
+    """Dependency to get async database session (queries bounded by the route's deadline)."""
     async with AsyncSessionLocal() as session:
+        apply_statement_timeout(session, request_deadline(request))
+        token = slow_queries.current_request.set(request)
         try:
             yield session
         finally:
+            slow_queries.current_request.reset(token)
             await session.close()
+
+
+async def warm_up_pool(connections: int) -> None:
+    """Open `connections` pool connections at startup so first requests skip connect/TLS."""
+    async def _open():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Concurrent checkouts, so each one opens its own connection
+    await asyncio.gather(*(_open() for _ in range(connections)))
+
+
+async def dispose_engine() -> None:
+    """Close every pooled connection (shutdown)."""
+    await engine.dispose()
@@ -5,43 +5,42 @@ from fastapi import Depends, FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, TimeoutError as SQLAlchemyTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-# Importar e carregar dotenv para garantir que as variáveis de ambiente sejam carregadas o mais cedo possível
-from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(__file__), '.env')) # Arquivo .env está na raiz do backend
-
-# Importando as configurações para ler as variáveis de ambiente
-# AGORA settings será inicializado DEPOIS que load_dotenv() for chamado
-from app.core.config import settings 
+# app.core.config carrega o .env (uma única vez) antes de construir settings
+from app.core.config import settings
 
 from app.api.v1.endpoints.auth import router as auth_router
+from app.api.v1.endpoints.calendar import router as calendar_router
 from app.api.v1.endpoints.clients import router as clients_router
 from app.api.v1.endpoints.dashboard import router as dashboard_router
+from app.api.v1.endpoints.diagnostics import router as diagnostics_router
+from app.api.v1.endpoints.events import router as events_router
 from app.api.v1.endpoints.expenses import router as expenses_router
 from app.api.v1.endpoints.organizations import router as organizations_router
 from app.api.v1.endpoints.production_crew import router as production_crew_router
 from app.api.v1.endpoints.production_items import router as production_items_router
 from app.api.v1.endpoints.productions import router as productions_router
+from app.api.v1.endpoints.search import router as search_router
 from app.api.v1.endpoints.services import router as services_router
 from app.api.v1.endpoints.users import router as users_router
 from app.api.v1.endpoints.webhooks import router as webhooks_router
+from app.core.admission import AdmissionMiddleware, admission, overloaded_response
+from app.core.deadlines import DeadlineMiddleware, deadline_exceeded, deadline_stats, is_statement_timeout, route_name
+from app.core.lifespan import InFlightMiddleware, lifespan, register_default_resources, registry
 from app.core.logging_config import setup_logging
+from app.core.profiler import ProfilingMiddleware
 from app.db.session import get_db
 
 # Setup logging before creating the app
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="SafeTasks V2 API", version="0.1.0")
-
-from app.core.rate_limit import limiter
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+register_default_resources()
+app = FastAPI(title="SafeTasks V2 API", version="0.1.0", lifespan=lifespan)
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -71,6 +70,24 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         },
     )
 
+@app.exception_handler(SQLAlchemyTimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: SQLAlchemyTimeoutError):
+    """No database connection freed up within DB_POOL_TIMEOUT_SECONDS: shed the request."""
+    admission.rejected["db_pool_timeout"] += 1
+    logger.warning(f"Database pool wait timed out on {request.method} {request.url.path}")
+    return overloaded_response("db_pool_timeout")
+
+@app.exception_handler(DBAPIError)
+async def statement_timeout_handler(request: Request, exc: DBAPIError):
+    """A query outlived the request deadline (statement_timeout): answer 504."""
+    if not is_statement_timeout(exc):
+        raise exc
+    route = route_name(request)
+    deadline_stats.record("statement", route)
+    logger.warning(f"Statement timeout on {route}")
+    error = deadline_exceeded()
+    return JSONResponse(status_code=error.status_code, content={"detail": error.detail})
+
 logger.info("SafeTasks V2 API starting up")
 
 # --- CORREÇÃO INFALÍVEL DE CORS (MANUAL OVERRIDE) ---
@@ -87,6 +104,15 @@ else:
 # Log para confirmar no terminal do Render
 logger.info(f"🔒 MANUAL CORS ORIGINS LOADED: {origins_list}")
 
+# Per-request profiling with "X-Profile: 1" (operators only, see app/core/profiler.py)
+app.add_middleware(ProfilingMiddleware)
+
+# Request deadlines for every route (REQUEST_DEADLINE_SECONDS, or @deadline), see app/core/deadlines.py
+app.add_middleware(DeadlineMiddleware)
+
+# Admission control (inside CORS, so 503 responses still carry CORS headers)
+app.add_middleware(AdmissionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins_list,
@@ -96,6 +122,22 @@ app.add_middleware(
 )
 # ----------------------------------------------------
 
+# Response compression above a size threshold (Brotli with the "brotli" extra, gzip otherwise)
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=settings.response_compression_min_bytes,
+        gzip_fallback=True,
+    )
+    logger.info("Response compression enabled (brotli + gzip fallback)")
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.response_compression_min_bytes)
+    logger.info("Response compression enabled (gzip)")
+
+# Count in-flight requests so shutdown can drain them
+app.add_middleware(InFlightMiddleware)
+
 # Performance monitoring middleware
 @app.middleware("http")
 async def performance_monitoring(request: Request, call_next):
@@ -152,6 +194,7 @@ async def performance_monitoring(request: Request, call_next):
         raise
 
 # Note: Rate limiting is applied via @limiter.limit() decorators on individual endpoints
+# (Redis-backed, keyed by organization/profile and scaled by plan - see app/core/rate_limit.py)
 # This provides fine-grained control per endpoint type
 
 # Include routers
@@ -166,12 +209,23 @@ app.include_router(production_crew_router, prefix="/api/v1", tags=["production-c
 app.include_router(production_items_router, prefix="/api/v1", tags=["production-items"])
 app.include_router(expenses_router, prefix="/api/v1", tags=["expenses"])
 app.include_router(webhooks_router, prefix="/api/v1/webhooks", tags=["webhooks"])
+app.include_router(search_router, prefix="/api/v1/search", tags=["search"])
+app.include_router(calendar_router, prefix="/api/v1/calendar", tags=["calendar"])
+app.include_router(events_router, prefix="/api/v1/events", tags=["events"])
+app.include_router(diagnostics_router, prefix="/api/v1/diagnostics", tags=["diagnostics"])
 
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "SafeTasks V2 API is running"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once startup warm-up finished, 503 while warming up or draining."""
+    status = registry.status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
 @app.get("/health")
 async def health_check(db: AsyncSession = Depends(get_db)):
     """Enhanced health check endpoint with system metrics."""
@@ -3,7 +3,9 @@ from .expense import Expense
 from .production import Production
 from .production_crew import ProductionCrew
 from .production_item import ProductionItem
+from .production_tombstone import ProductionTombstone
 from .service import Service
+from .shooting_session import ShootingSession
 from .user import Organization, User, Profile
 
 __all__ = ["Organization", "User", "Profile", "Client", "Service", "Production", "ProductionStatus", "ProductionItem", "Expense"]
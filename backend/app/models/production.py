@@ -1,5 +1,5 @@
 from enum import Enum
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, JSON  # type: ignore
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, JSON  # type: ignore
 from sqlalchemy.orm import Mapped, mapped_column, relationship  # type: ignore
 from sqlalchemy.sql import func  # type: ignore
 
@@ -46,9 +46,22 @@ class Production(Base):
     # Notes field for additional information
     notes: Mapped[str] = mapped_column(String, nullable=True)  # Additional notes about the production
 
-    # Relationships with eager loading
+    # Relationships are never loaded implicitly: queries that need them must ask
+    # with explicit loader options (selectinload), so a plain select(Production)
+    # is a single statement. Child rows are removed by ON DELETE CASCADE.
     organization = relationship("Organization", back_populates="productions")
-    client = relationship("Client", back_populates="productions", lazy="selectin")
-    items = relationship("ProductionItem", back_populates="production", cascade="all, delete-orphan", lazy="selectin")
-    expenses = relationship("Expense", back_populates="production", cascade="all, delete-orphan", lazy="selectin")
-    crew = relationship("ProductionCrew", back_populates="production", cascade="all, delete-orphan", lazy="selectin")
+    client = relationship("Client", back_populates="productions", lazy="raise_on_sql")
+    items = relationship("ProductionItem", back_populates="production", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    expenses = relationship("Expense", back_populates="production", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    crew = relationship("ProductionCrew", back_populates="production", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+
+    # Composite indexes backing the list filters/sorts (see read_models.production_filter_conditions)
+    __table_args__ = (
+        Index("ix_productions_org_created_at", "organization_id", "created_at"),
+        Index("ix_productions_org_updated_at", "organization_id", "updated_at", "id"),  # Delta sync
+        Index("ix_productions_org_status", "organization_id", "status"),
+        Index("ix_productions_org_payment_status", "organization_id", "payment_status"),
+        Index("ix_productions_org_client", "organization_id", "client_id"),
+        Index("ix_productions_org_deadline", "organization_id", "deadline"),
+        Index("ix_productions_org_due_date", "organization_id", "due_date"),
+    )
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -18,13 +18,14 @@ class ProductionCrew(Base):
 
     # Relationships
     production = relationship("Production", back_populates="crew")
-    user = relationship("Profile", back_populates="crew_assignments", lazy="selectin")
+    user = relationship("Profile", back_populates="crew_assignments", lazy="raise_on_sql")  # Load with selectinload(ProductionCrew.user)
 
     @hybrid_property
     def full_name(self):
-        """Get the full name from the related user."""
+        """Get the full name from the related user (requires the user to be loaded)."""
         return self.user.full_name if self.user else None
 
     __table_args__ = (
+        Index("ix_production_crew_user_production", "user_id", "production_id"),  # Crew-scoped production lists
         {'schema': None}
     )
@@ -0,0 +1,36 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+
+class ProductionTombstone(Base):
+    """
+    Record of a production leaving someone's delta sync (GET
+    /productions/changes), so clients drop their copy.
+
+    With profile_id NULL the production was deleted, for the whole
+    organization. With profile_id set it left that crew member's view: they
+    were removed from its crew, or it was deleted while they were assigned.
+
+    production_id has no foreign key: the production row may no longer exist.
+    """
+    __tablename__ = "production_tombstones"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    production_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    organization_id: Mapped[int] = mapped_column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    profile_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("profiles.id", ondelete="CASCADE"), nullable=True
+    )
+    deleted_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("ix_production_tombstones_org_deleted_at", "organization_id", "deleted_at"),
+        Index("ix_production_tombstones_profile_deleted_at", "profile_id", "deleted_at"),
+    )
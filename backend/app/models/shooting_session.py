@@ -0,0 +1,32 @@
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class ShootingSession(Base):
+    """
+    One shooting session of a production, for calendar range queries.
+
+    Mirrors Production.shooting_sessions (JSON, still returned to clients):
+    rows are rewritten from the JSON whenever it changes, see
+    production_service.sync_shooting_sessions. Sessions without a date only
+    exist in the JSON.
+    """
+    __tablename__ = "shooting_sessions"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    production_id: Mapped[int] = mapped_column(Integer, ForeignKey("productions.id", ondelete="CASCADE"), nullable=False)
+    organization_id: Mapped[int] = mapped_column(Integer, ForeignKey("organizations.id"), nullable=False)  # Denormalized for the range index
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Index in the JSON array
+    starts_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
+    ends_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False)  # Exclusive
+    location: Mapped[str] = mapped_column(String, nullable=True)
+
+    # Range lookups: on PostgreSQL the migration adds a GiST index on
+    # (organization_id, tsrange(starts_at, ends_at)); this btree index covers
+    # the plain comparisons used elsewhere
+    __table_args__ = (
+        Index("ix_shooting_sessions_org_starts_at", "organization_id", "starts_at", "ends_at"),
+        Index("ix_shooting_sessions_production", "production_id"),
+    )
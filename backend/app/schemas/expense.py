@@ -17,3 +17,8 @@ class ExpenseResponse(BaseModel):
     paid_by: str | None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ExpenseBulkCreate(BaseModel):
+    """Several expenses added to a production in one request"""
+    expenses: list[ExpenseCreate] = Field(..., min_length=1, max_length=200)
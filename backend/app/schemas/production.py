@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator  # type: ignore
 
@@ -136,3 +136,44 @@ class ProductionCrewResponse(BaseModel):
     crew: List[ProductionCrewMemberRestricted] = []
 
     model_config = ConfigDict(from_attributes=True)
+
+
+PRODUCTION_SORT_FIELDS = ("created_at", "updated_at", "deadline", "due_date", "title", "total_value")
+
+
+class ProductionFilters(BaseModel):
+    """
+    Server-side filters and sorting for the productions list.
+
+    Date ranges are inclusive calendar days (deadline_to=2024-05-31 includes
+    the whole day).
+    """
+    status: List[ProductionStatus] = []
+    payment_status: List[str] = []
+    priority: List[str] = []
+    client_id: Optional[int] = None
+    deadline_from: Optional[date] = None
+    deadline_to: Optional[date] = None
+    due_date_from: Optional[date] = None
+    due_date_to: Optional[date] = None
+    sort: Literal[PRODUCTION_SORT_FIELDS] = "created_at"  # type: ignore[valid-type]
+    order: Literal["asc", "desc"] = "desc"
+
+    @field_validator('payment_status', 'priority')
+    @classmethod
+    def normalize_values(cls, v: List[str]) -> List[str]:
+        return sorted({value.strip().lower() for value in v if value.strip()})
+
+    @field_validator('status')
+    @classmethod
+    def normalize_status(cls, v: List[ProductionStatus]) -> List[ProductionStatus]:
+        return sorted(set(v), key=lambda status: status.value)
+
+    def cache_key(self) -> str:
+        """Stable key fragment for this filter set ("all" when nothing is filtered or re-sorted)."""
+        parts = []
+        for name, value in self.model_dump(mode="json").items():
+            if value in (None, []) or value == self.model_fields[name].default:
+                continue
+            parts.append(f"{name}={','.join(value) if isinstance(value, list) else value}")
+        return ";".join(parts) or "all"
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -36,3 +38,31 @@ class ProductionCrewMemberRestricted(BaseModel):
     fee: int | None = None  # Only their own fee
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProductionCrewBulkCreate(BaseModel):
+    """Several crew members assigned to a production in one request"""
+    crew: list[ProductionCrewCreate] = Field(..., min_length=1, max_length=200)
+
+
+class CrewConflictCheck(BaseModel):
+    """Crew members to check against a production's shooting sessions"""
+    user_ids: list[str] = Field(..., min_length=1, max_length=200)
+    shooting_sessions: list[dict] | None = None  # Unsaved sessions; defaults to the stored ones
+
+
+class CrewConflict(BaseModel):
+    """A booking on another production overlapping one of the checked sessions"""
+    user_id: str
+    full_name: str | None = None
+    production_id: int
+    title: str
+    starts_at: datetime
+    ends_at: datetime
+    location: str | None = None
+    overlaps_starts_at: datetime
+    overlaps_ends_at: datetime
+
+
+class CrewConflictsResponse(BaseModel):
+    conflicts: list[CrewConflict]
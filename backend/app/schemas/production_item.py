@@ -29,3 +29,8 @@ class ProductionItemCrewResponse(BaseModel):
     # unit_price and total_price explicitly omitted for crew privacy
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProductionItemBulkCreate(BaseModel):
+    """Several items added to a production in one request"""
+    items: list[ProductionItemCreate] = Field(..., min_length=1, max_length=200)
@@ -0,0 +1,16 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    type: Literal["production", "client", "service"]
+    id: int
+    title: str
+    subtitle: Optional[str] = None  # Production status, client email/CNPJ or service unit
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
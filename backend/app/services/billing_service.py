@@ -1,15 +1,18 @@
 from datetime import datetime, timedelta
-from typing import Optional, Set
+from typing import TYPE_CHECKING, Optional, Set, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-import stripe
 import logging
 
 from app.models.user import Organization, Profile
 from app.models.client import Client
+from app.core.stripe_client import get_stripe
 from app.core.billing_config import SubscriptionPlan, SubscriptionStatus, PLAN_LIMITS
 
+if TYPE_CHECKING:
+    import stripe
+
 logger = logging.getLogger("app.services.billing_service")
 
 # In-memory set for idempotency (use Redis in production for distributed systems)
@@ -60,28 +63,41 @@ class BillingService:
     @staticmethod
     async def check_client_limit(org_id: int, db: AsyncSession) -> None:
         """Verify if organization can add more clients based on its plan."""
+        plan, max_clients, current_count = await BillingService.get_client_usage(org_id, db)
+
+        if current_count >= max_clients:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Limite de clientes atingido para o plano {plan.value}. (Máx: {max_clients})")
+
+    @staticmethod
+    async def get_remaining_client_slots(org_id: int, db: AsyncSession) -> int:
+        """
+        How many clients the organization can still add on its plan.
+        Bulk imports use it to enforce the limit once per batch instead of per row.
+        """
+        _, max_clients, current_count = await BillingService.get_client_usage(org_id, db)
+        return max(max_clients - current_count, 0)
+
+    @staticmethod
+    async def get_client_usage(org_id: int, db: AsyncSession) -> Tuple[SubscriptionPlan, int, int]:
+        """Plan, client limit and current client count of the organization."""
         result = await db.execute(select(Organization).where(Organization.id == org_id))
         org = result.scalar_one_or_none()
-        
+
         if not org:
             raise HTTPException(status_code=404, detail="Organization not found")
 
         plan = SubscriptionPlan(org.subscription_plan)
         limits = PLAN_LIMITS.get(plan, PLAN_LIMITS[SubscriptionPlan.FREE])
-        
-        # Count current clients
+
         count_result = await db.execute(
             select(func.count(Client.id)).where(Client.organization_id == org_id)
         )
-        current_count = count_result.scalar_one()
-
-        if current_count >= limits["max_clients"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Limite de clientes atingido para o plano {plan.value}. (Máx: {limits['max_clients']})")
+        return plan, limits["max_clients"], count_result.scalar_one()
 
     @staticmethod
-    async def handle_stripe_webhook_event(event: stripe.Event, db: AsyncSession):
+    async def handle_stripe_webhook_event(event: "stripe.Event", db: AsyncSession):
         """
         Handle Stripe webhook events with security improvements:
         - Idempotency checking
@@ -154,7 +170,7 @@ class BillingService:
             # Fetch subscription details from Stripe to get current_period_end
             try:
                 logger.info(f"Retrieving Stripe subscription: {session.subscription}")
-                stripe_subscription = stripe.Subscription.retrieve(session.subscription)
+                stripe_subscription = get_stripe().Subscription.retrieve(session.subscription)
 
                 if stripe_subscription and hasattr(stripe_subscription, 'current_period_end') and stripe_subscription.current_period_end:
                     organization.subscription_ends_at = datetime.fromtimestamp(stripe_subscription.current_period_end)
@@ -221,7 +237,7 @@ class BillingService:
             
             logger.warning(f"Payment failed for customer {customer_id}")
             logger.warning(f"Invoice ID: {invoice.id}")
-            logger.warning(f"Failure message: {invoice.get("last_finalization_error", {}).get("message", "Unknown error")}")
+            logger.warning(f"Failure message: {invoice.get('last_finalization_error', {}).get('message', 'Unknown error')}")
             
             # Find organization by billing_id and downgrade to FREE
             result = await db.execute(select(Organization).where(Organization.billing_id == customer_id))
@@ -0,0 +1,117 @@
+"""
+Calendar events for a date range: shooting sessions, deadlines and due dates.
+
+Shooting sessions come from the normalized shooting_sessions table. On
+PostgreSQL the overlap test is `tsrange(starts_at, ends_at) && tsrange(from, to)`,
+answered by the GiST index from the add_shooting_sessions migration; other
+databases use the equivalent comparisons. Deadlines and due dates use the
+(organization_id, deadline/due_date) indexes on productions. All three are
+read with a single UNION ALL statement.
+"""
+
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, String, cast, func, literal, null, select, union_all  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.shooting_session import ShootingSession
+
+EVENT_TYPES = ("filming", "deadline", "due_date")
+
+
+def _crew_scope(stmt, crew_profile_id: Optional[uuid.UUID]):
+    """Restrict to productions the crew member is assigned to."""
+    if crew_profile_id is None:
+        return stmt
+    return stmt.where(
+        Production.id.in_(select(ProductionCrew.production_id).where(ProductionCrew.user_id == crew_profile_id))
+    )
+
+
+def _session_overlaps(starts: datetime, ends: datetime, range_index: bool):
+    if range_index:
+        return func.tsrange(ShootingSession.starts_at, ShootingSession.ends_at).op("&&")(func.tsrange(starts, ends))
+    return (ShootingSession.starts_at < ends) & (ShootingSession.ends_at > starts)
+
+
+def build_calendar_query(
+    organization_id: int,
+    starts: datetime,
+    ends: datetime,
+    crew_profile_id: Optional[uuid.UUID] = None,
+    range_index: bool = True,
+):
+    """
+    Events overlapping [starts, ends) as (type, production_id, title, status,
+    starts_at, ends_at, location) rows, ordered by start.
+    """
+    sessions = _crew_scope(
+        select(
+            literal("filming", String).label("type"),
+            Production.id.label("production_id"),
+            Production.title.label("title"),
+            cast(Production.status, String).label("status"),
+            ShootingSession.starts_at.label("starts_at"),
+            ShootingSession.ends_at.label("ends_at"),
+            ShootingSession.location.label("location"),
+        )
+        .join(Production, Production.id == ShootingSession.production_id)
+        .where(
+            ShootingSession.organization_id == organization_id,
+            _session_overlaps(starts, ends, range_index),
+        ),
+        crew_profile_id,
+    )
+
+    branches = [sessions]
+    for event_type, column in (("deadline", Production.deadline), ("due_date", Production.due_date)):
+        branches.append(_crew_scope(
+            select(
+                literal(event_type, String).label("type"),
+                Production.id.label("production_id"),
+                Production.title.label("title"),
+                cast(Production.status, String).label("status"),
+                column.label("starts_at"),
+                cast(null(), DateTime).label("ends_at"),
+                cast(null(), String).label("location"),
+            ).where(
+                Production.organization_id == organization_id,
+                column >= starts,
+                column < ends,
+            ),
+            crew_profile_id,
+        ))
+
+    events = union_all(*branches).subquery("events")
+    return select(events).order_by(events.c.starts_at, events.c.type, events.c.production_id)
+
+
+def range_index_enabled(db: AsyncSession) -> bool:
+    """tsrange overlap (and its GiST index) is only available on PostgreSQL."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def fetch_calendar_events(
+    db: AsyncSession,
+    organization_id: int,
+    starts: datetime,
+    ends: datetime,
+    crew_profile_id: Optional[uuid.UUID] = None,
+) -> List[dict]:
+    """Calendar events overlapping [starts, ends) as dicts."""
+    result = await db.execute(
+        build_calendar_query(organization_id, starts, ends, crew_profile_id, range_index_enabled(db))
+    )
+    return [{
+        "type": row.type,
+        "production_id": row.production_id,
+        "title": row.title,
+        "status": row.status,
+        "starts_at": row.starts_at,
+        "ends_at": row.ends_at,
+        "location": row.location,
+    } for row in result]
@@ -0,0 +1,215 @@
+"""
+Streaming export of an organization's productions with financials.
+
+Rows are read through a server-side cursor (AsyncSession.stream + yield_per)
+and encoded in small chunks, so memory stays constant regardless of how many
+productions the organization has. The stream holds a pooled connection, so
+it runs under EXPORT_DEADLINE_SECONDS: each query gets a statement_timeout
+ending at the deadline, and the export is aborted if a slow reader is still
+consuming it by then.
+"""
+
+import csv
+import io
+import json
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List
+
+from sqlalchemy import func, select  # type: ignore
+from sqlalchemy.sql import Select  # type: ignore
+
+from app.core.config import settings
+from app.core.deadlines import apply_statement_timeout
+from app.db.session import AsyncSessionLocal
+from app.models.client import Client
+from app.models.expense import Expense
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.production_item import ProductionItem
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_YIELD_PER = 500
+
+# Rows encoded per chunk sent to the client
+EXPORT_CHUNK_ROWS = 200
+
+# Leading characters spreadsheets evaluate as a formula (CSV injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+EXPORT_COLUMNS: List[str] = [
+    "id",
+    "title",
+    "status",
+    "priority",
+    "client_id",
+    "client_name",
+    "deadline",
+    "due_date",
+    "payment_method",
+    "payment_status",
+    "created_at",
+    "updated_at",
+    # Financial fields (cents)
+    "subtotal",
+    "discount",
+    "tax_rate",
+    "tax_amount",
+    "total_value",
+    "total_cost",
+    "profit",
+    # Aggregated child totals
+    "items_count",
+    "items_total",
+    "expenses_count",
+    "expenses_total",
+    "crew_count",
+    "crew_total",
+]
+
+
+def build_productions_export_query(org_id: int) -> Select:
+    """
+    Build a flat query of productions joined with client and child aggregates.
+
+    Each child table is aggregated once in a grouped subquery and LEFT JOINed,
+    so the statement returns exactly one row per production without loading
+    any relationship. The aggregates are restricted to the organization's
+    productions so other tenants' rows are never grouped.
+    """
+    org_production_ids = select(Production.id).where(Production.organization_id == org_id)
+
+    items_agg = (
+        select(
+            ProductionItem.production_id.label("production_id"),
+            func.count(ProductionItem.id).label("items_count"),
+            func.coalesce(func.sum(ProductionItem.total_price), 0).label("items_total"),
+        )
+        .where(ProductionItem.production_id.in_(org_production_ids))
+        .group_by(ProductionItem.production_id)
+        .subquery()
+    )
+    expenses_agg = (
+        select(
+            Expense.production_id.label("production_id"),
+            func.count(Expense.id).label("expenses_count"),
+            func.coalesce(func.sum(Expense.value), 0).label("expenses_total"),
+        )
+        .where(Expense.production_id.in_(org_production_ids))
+        .group_by(Expense.production_id)
+        .subquery()
+    )
+    crew_agg = (
+        select(
+            ProductionCrew.production_id.label("production_id"),
+            func.count(ProductionCrew.id).label("crew_count"),
+            func.coalesce(func.sum(ProductionCrew.fee), 0).label("crew_total"),
+        )
+        .where(ProductionCrew.production_id.in_(org_production_ids))
+        .group_by(ProductionCrew.production_id)
+        .subquery()
+    )
+
+    return (
+        select(
+            Production.id,
+            Production.title,
+            Production.status,
+            Production.priority,
+            Production.client_id,
+            Client.full_name.label("client_name"),
+            Production.deadline,
+            Production.due_date,
+            Production.payment_method,
+            Production.payment_status,
+            Production.created_at,
+            Production.updated_at,
+            Production.subtotal,
+            Production.discount,
+            Production.tax_rate,
+            Production.tax_amount,
+            Production.total_value,
+            Production.total_cost,
+            Production.profit,
+            func.coalesce(items_agg.c.items_count, 0).label("items_count"),
+            func.coalesce(items_agg.c.items_total, 0).label("items_total"),
+            func.coalesce(expenses_agg.c.expenses_count, 0).label("expenses_count"),
+            func.coalesce(expenses_agg.c.expenses_total, 0).label("expenses_total"),
+            func.coalesce(crew_agg.c.crew_count, 0).label("crew_count"),
+            func.coalesce(crew_agg.c.crew_total, 0).label("crew_total"),
+        )
+        .select_from(Production)
+        .outerjoin(Client, Production.client_id == Client.id)
+        .outerjoin(items_agg, items_agg.c.production_id == Production.id)
+        .outerjoin(expenses_agg, expenses_agg.c.production_id == Production.id)
+        .outerjoin(crew_agg, crew_agg.c.production_id == Production.id)
+        .where(Production.organization_id == org_id)
+        .order_by(Production.id)
+    )
+
+
+def _export_value(value: Any) -> Any:
+    """Convert a column value into a JSON/CSV friendly value."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def _iter_export_rows(org_id: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield export rows in chunks, reading through a server-side cursor."""
+    stmt = build_productions_export_query(org_id).execution_options(yield_per=EXPORT_YIELD_PER)
+    exported = 0
+    deadline_at = time.monotonic() + settings.export_deadline_seconds
+
+    # Own session: the stream outlives the request handler that started it
+    async with AsyncSessionLocal() as session:
+        apply_statement_timeout(session, deadline_at)
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions(EXPORT_CHUNK_ROWS):
+            if time.monotonic() > deadline_at:
+                logger.warning(
+                    "Productions export aborted: deadline exceeded",
+                    extra={"organization_id": org_id, "rows_exported": exported}
+                )
+                raise TimeoutError(f"Export exceeded {settings.export_deadline_seconds:g} s")
+            rows = [{column: _export_value(row[column]) for column in EXPORT_COLUMNS} for row in partition]
+            exported += len(rows)
+            yield rows
+
+    logger.info(
+        "Productions export finished",
+        extra={"organization_id": org_id, "rows_exported": exported}
+    )
+
+
+async def stream_productions_ndjson(org_id: int) -> AsyncIterator[bytes]:
+    """Stream productions as newline-delimited JSON."""
+    async for rows in _iter_export_rows(org_id):
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+
+
+def _csv_safe(value: Any) -> Any:
+    """Quote text a spreadsheet would run as a formula (=, +, -, @...) with a leading apostrophe."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def stream_productions_csv(org_id: int) -> AsyncIterator[bytes]:
+    """Stream productions as CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+
+    async for rows in _iter_export_rows(org_id):
+        writer.writerows({column: _csv_safe(value) for column, value in row.items()} for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Header only, when the organization has no productions
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
@@ -1,5 +1,8 @@
 import logging
-from sqlalchemy import select  # type: ignore
+from datetime import date, datetime, time, timedelta
+from typing import Any, List, Optional
+
+from sqlalchemy import delete, exists, func, insert, select  # type: ignore
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
 from sqlalchemy.orm import selectinload  # type: ignore
 
@@ -7,6 +10,7 @@ from app.models.expense import Expense
 from app.models.production import Production
 from app.models.production_item import ProductionItem
 from app.models.production_crew import ProductionCrew
+from app.models.shooting_session import ShootingSession
 from app.models.user import Organization
 
 # Configure logger for this module
@@ -18,6 +22,78 @@ class FinancialCalculationError(Exception):
     pass
 
 
+async def production_in_organization(production_id: int, organization_id: int, db: AsyncSession) -> bool:
+    """
+    Check that a production exists and belongs to an organization.
+
+    Runs a single EXISTS query, so ownership checks never load the production
+    (or any of its relationships) into the session.
+    """
+    result = await db.execute(
+        select(
+            exists().where(
+                Production.id == production_id,
+                Production.organization_id == organization_id
+            )
+        )
+    )
+    return bool(result.scalar())
+
+
+def _session_day(value: Any) -> Optional[date]:
+    """Day of a JSON shooting session ("YYYY-MM-DD" or ISO datetime), or None."""
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def shooting_session_rows(production_id: int, organization_id: int, sessions: Optional[List[Any]]) -> List[dict]:
+    """
+    shooting_sessions rows for a production's JSON sessions.
+
+    Each dated session covers its whole day [00:00, next day 00:00); sessions
+    without a valid date are left out (they stay in the JSON only).
+    """
+    rows = []
+    for position, session in enumerate(sessions or []):
+        if not isinstance(session, dict):
+            continue
+        day = _session_day(session.get("date"))
+        if day is None:
+            continue
+        starts_at = datetime.combine(day, time.min)
+        rows.append({
+            "production_id": production_id,
+            "organization_id": organization_id,
+            "position": position,
+            "starts_at": starts_at,
+            "ends_at": starts_at + timedelta(days=1),
+            "location": session.get("location") or None,
+        })
+    return rows
+
+
+async def sync_shooting_sessions(
+    production_id: int,
+    organization_id: int,
+    sessions: Optional[List[Any]],
+    db: AsyncSession
+) -> None:
+    """
+    Rewrite a production's shooting_sessions rows from its JSON sessions.
+
+    Call whenever Production.shooting_sessions is written, in the same
+    transaction; does not commit.
+    """
+    await db.execute(delete(ShootingSession).where(ShootingSession.production_id == production_id))
+    rows = shooting_session_rows(production_id, organization_id, sessions)
+    if rows:
+        await db.execute(insert(ShootingSession), rows)
+
+
 async def calculate_production_totals(production_id: int, db: AsyncSession) -> None:
     """
     Calculate and update production financial totals including costs and profit.
@@ -50,6 +126,9 @@ async def calculate_production_totals(production_id: int, db: AsyncSession) -> N
             selectinload(Production.expenses),
             selectinload(Production.crew)
         )
+        # Reload the collections even if the production is already in the session,
+        # so totals always reflect rows added or removed in this transaction
+        .execution_options(populate_existing=True)
     )
     production = result.scalar_one_or_none()
 
@@ -197,6 +276,8 @@ async def calculate_production_totals(production_id: int, db: AsyncSession) -> N
     production.tax_amount = tax_amount
     production.total_value = total_value
     production.profit = profit
+    # Child rows changed: always bump updated_at so delta sync picks the production up
+    production.updated_at = func.now()
 
     db.add(production)
     # Flush to ensure changes are in the current transaction
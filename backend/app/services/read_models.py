@@ -0,0 +1,538 @@
+"""
+Read models for the list endpoints (productions, clients, users, services).
+
+List queries select plain columns instead of ORM entities, so result rows are
+SQLAlchemy Core rows: nothing is added to the session identity map and no
+attribute instrumentation runs per row. Rows are copied into slotted
+dataclasses, which are cheaper to build and hold than ORM instances, and
+serialized with to_dict().
+
+See scripts/bench_read_models.py for the per-row CPU and memory comparison.
+
+On PostgreSQL the productions list can also be assembled entirely by the
+database (json_build_object/json_agg, see fetch_productions_json), so the
+API only forwards the JSON text it gets back.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, Integer, Text, cast, func, literal, literal_column, select, tuple_  # type: ignore
+from sqlalchemy.dialects.postgresql import aggregate_order_by  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.core.config import settings
+from app.models.client import Client
+from app.models.expense import Expense
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.production_item import ProductionItem
+from app.models.service import Service
+from app.models.user import Profile
+from app.schemas.production import ProductionFilters
+
+
+class _ReadModel:
+    """Base for slotted read models: flat dict of every field."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class ClientRead(_ReadModel):
+    id: int
+    full_name: str
+    email: Optional[str]
+    cnpj: Optional[str]
+    address: Optional[str]
+    phone: Optional[str]
+    organization_id: int
+    created_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class ClientSummaryRead(_ReadModel):
+    """Client fields embedded in production responses."""
+    id: int
+    full_name: str
+    email: Optional[str]
+    cnpj: Optional[str]
+    phone: Optional[str]
+    created_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class ServiceRead(_ReadModel):
+    id: int
+    name: str
+    description: Optional[str]
+    default_price: int  # In cents
+    unit: Optional[str]
+    organization_id: int
+
+    def to_crew_dict(self) -> Dict[str, Any]:
+        """Service without pricing, for crew members."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "unit": self.unit,
+            "organization_id": self.organization_id,
+        }
+
+
+@dataclass(slots=True)
+class ProfileRead(_ReadModel):
+    id: uuid.UUID
+    email: Optional[str]
+    full_name: Optional[str]
+    role: str
+    organization_id: Optional[int]
+    is_active: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = _ReadModel.to_dict(self)
+        data["id"] = str(self.id)  # UUID as string
+        return data
+
+
+@dataclass(slots=True)
+class ProductionItemRead(_ReadModel):
+    id: int
+    production_id: int
+    name: str
+    quantity: float
+    unit_price: int
+    total_price: int
+
+
+@dataclass(slots=True)
+class ExpenseRead(_ReadModel):
+    id: int
+    production_id: int
+    name: str
+    value: int
+    category: Optional[str]
+    paid_by: Optional[str]
+
+
+@dataclass(slots=True)
+class CrewMemberRead(_ReadModel):
+    id: int
+    production_id: int
+    user_id: uuid.UUID
+    role: str
+    fee: int
+    full_name: Optional[str]
+
+
+@dataclass(slots=True)
+class ProductionRead(_ReadModel):
+    id: int
+    title: str
+    organization_id: int
+    client_id: Optional[int]
+    status: str
+    deadline: Optional[datetime]
+    shooting_sessions: Optional[list]
+    notes: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    # Payment fields
+    payment_method: Optional[str]
+    payment_status: Optional[str]
+    due_date: Optional[datetime]
+    # Financial fields (cents)
+    subtotal: int
+    discount: int
+    tax_rate: float
+    tax_amount: int
+    total_value: int
+    total_cost: int
+    profit: int
+    # Related data
+    client: Optional[ClientSummaryRead] = None
+    items: List[ProductionItemRead] = field(default_factory=list)
+    expenses: List[ExpenseRead] = field(default_factory=list)
+    crew: List[CrewMemberRead] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in _PRODUCTION_FIELDS}
+        data["client"] = self.client.to_dict() if self.client else None
+        data["items"] = [item.to_dict() for item in self.items]
+        data["expenses"] = [expense.to_dict() for expense in self.expenses]
+        data["crew"] = [member.to_dict() for member in self.crew]
+        return data
+
+
+# Selected columns, in the same order as the read model fields
+CLIENT_COLUMNS = (
+    Client.id, Client.full_name, Client.email, Client.cnpj, Client.address,
+    Client.phone, Client.organization_id, Client.created_at,
+)
+CLIENT_SUMMARY_COLUMNS = (
+    Client.id, Client.full_name, Client.email, Client.cnpj, Client.phone, Client.created_at,
+)
+SERVICE_COLUMNS = (
+    Service.id, Service.name, Service.description, Service.default_price,
+    Service.unit, Service.organization_id,
+)
+PROFILE_COLUMNS = (
+    Profile.id, Profile.email, Profile.full_name, Profile.role,
+    Profile.organization_id, Profile.is_active,
+)
+PRODUCTION_ITEM_COLUMNS = (
+    ProductionItem.id, ProductionItem.production_id, ProductionItem.name,
+    ProductionItem.quantity, ProductionItem.unit_price, ProductionItem.total_price,
+)
+EXPENSE_COLUMNS = (
+    Expense.id, Expense.production_id, Expense.name, Expense.value,
+    Expense.category, Expense.paid_by,
+)
+CREW_MEMBER_COLUMNS = (
+    ProductionCrew.id, ProductionCrew.production_id, ProductionCrew.user_id,
+    ProductionCrew.role, ProductionCrew.fee, Profile.full_name,
+)
+PRODUCTION_COLUMNS = (
+    Production.id, Production.title, Production.organization_id, Production.client_id,
+    Production.status, Production.deadline, Production.shooting_sessions, Production.notes,
+    Production.created_at, Production.updated_at,
+    Production.payment_method, Production.payment_status, Production.due_date,
+    Production.subtotal, Production.discount, Production.tax_rate, Production.tax_amount,
+    Production.total_value, Production.total_cost, Production.profit,
+)
+
+_PRODUCTION_FIELDS = tuple(column.key for column in PRODUCTION_COLUMNS)
+
+# Sort columns that may be NULL are always ordered last
+_NULLABLE_SORT_FIELDS = {"deadline", "due_date"}
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def production_filter_conditions(filters: Optional[ProductionFilters]) -> List[Any]:
+    """WHERE conditions for a filter set (all covered by the productions indexes)."""
+    if filters is None:
+        return []
+
+    conditions: List[Any] = []
+    if filters.status:
+        conditions.append(Production.status.in_([status.value for status in filters.status]))
+    if filters.payment_status:
+        conditions.append(Production.payment_status.in_(filters.payment_status))
+    if filters.priority:
+        conditions.append(Production.priority.in_(filters.priority))
+    if filters.client_id is not None:
+        conditions.append(Production.client_id == filters.client_id)
+    # Date ranges are inclusive calendar days: [from 00:00, to + 1 day 00:00)
+    if filters.deadline_from:
+        conditions.append(Production.deadline >= _day_start(filters.deadline_from))
+    if filters.deadline_to:
+        conditions.append(Production.deadline < _day_start(filters.deadline_to + timedelta(days=1)))
+    if filters.due_date_from:
+        conditions.append(Production.due_date >= _day_start(filters.due_date_from))
+    if filters.due_date_to:
+        conditions.append(Production.due_date < _day_start(filters.due_date_to + timedelta(days=1)))
+    return conditions
+
+
+def production_order_by(filters: Optional[ProductionFilters], columns: Any = None) -> List[Any]:
+    """
+    ORDER BY for a filter set, with the id as tie-breaker so pages are stable.
+
+    Args:
+        filters: Filter set (None = newest first)
+        columns: Column collection to order by (defaults to the productions
+            table; pass subquery.c to order rows of a subquery)
+    """
+    columns = Production.__table__.c if columns is None else columns
+    sort = filters.sort if filters else "created_at"
+    descending = (filters.order if filters else "desc") == "desc"
+
+    primary = columns[sort].desc() if descending else columns[sort].asc()
+    if sort in _NULLABLE_SORT_FIELDS:
+        primary = primary.nulls_last()
+    tie_breaker = columns["id"].desc() if descending else columns["id"].asc()
+    return [primary, tie_breaker]
+
+
+def _scope_productions(stmt, organization_id: int, filters: Optional[ProductionFilters], crew_profile_id: Optional[uuid.UUID]):
+    """Restrict a productions statement to an organization, a filter set and (for crew) assignments."""
+    stmt = stmt.where(Production.organization_id == organization_id, *production_filter_conditions(filters))
+    if crew_profile_id is not None:
+        stmt = stmt.join(ProductionCrew, Production.id == ProductionCrew.production_id).where(
+            ProductionCrew.user_id == crew_profile_id
+        )
+    return stmt
+
+
+async def count_productions(
+    db: AsyncSession,
+    organization_id: int,
+    filters: Optional[ProductionFilters] = None,
+    crew_profile_id: Optional[uuid.UUID] = None,
+) -> int:
+    """Number of productions matching a filter set (for pagination metadata)."""
+    result = await db.execute(
+        _scope_productions(select(func.count(Production.id)), organization_id, filters, crew_profile_id)
+    )
+    return result.scalar_one()
+
+
+async def fetch_clients(db: AsyncSession, organization_id: int) -> List[ClientRead]:
+    """All clients of an organization."""
+    result = await db.execute(
+        select(*CLIENT_COLUMNS).where(Client.organization_id == organization_id)
+    )
+    return [ClientRead(*row) for row in result]
+
+
+async def fetch_services(db: AsyncSession, organization_id: int) -> List[ServiceRead]:
+    """All services of an organization."""
+    result = await db.execute(
+        select(*SERVICE_COLUMNS).where(Service.organization_id == organization_id)
+    )
+    return [ServiceRead(*row) for row in result]
+
+
+async def fetch_profiles(db: AsyncSession, organization_id: int) -> List[ProfileRead]:
+    """All user profiles of an organization."""
+    result = await db.execute(
+        select(*PROFILE_COLUMNS).where(Profile.organization_id == organization_id)
+    )
+    return [ProfileRead(*row) for row in result]
+
+
+async def fetch_productions(
+    db: AsyncSession,
+    organization_id: int,
+    skip: int,
+    limit: int,
+    crew_profile_id: Optional[uuid.UUID] = None,
+    filters: Optional[ProductionFilters] = None,
+) -> List[ProductionRead]:
+    """
+    A page of productions with client, items, expenses and crew.
+
+    Runs four queries regardless of page size: the page joined with its
+    client, then items, expenses and crew (with profile names) for the
+    page's production ids.
+
+    Args:
+        db: Async database session
+        organization_id: Organization that owns the productions
+        skip: Number of productions to skip (newest first)
+        limit: Maximum number of productions to return
+        crew_profile_id: When set, only productions this profile is assigned
+            to, and only that profile's own crew entry (privacy filter)
+        filters: Server-side filters and sort order (None = newest first)
+    """
+    stmt = _scope_productions(
+        select(*PRODUCTION_COLUMNS, *CLIENT_SUMMARY_COLUMNS).outerjoin(Client, Production.client_id == Client.id),
+        organization_id, filters, crew_profile_id
+    )
+    stmt = stmt.order_by(*production_order_by(filters)).offset(skip).limit(limit)
+    return await _read_productions(db, stmt, crew_profile_id)
+
+
+async def fetch_changed_productions(
+    db: AsyncSession,
+    organization_id: int,
+    after: Tuple[datetime, int],
+    limit: int,
+    crew_profile_id: Optional[uuid.UUID] = None,
+) -> List[ProductionRead]:
+    """
+    Productions updated after a (updated_at, id) keyset position, oldest first.
+
+    Backed by the (organization_id, updated_at, id) index; used by delta sync
+    (app.services.sync_service) with the same children as fetch_productions.
+    """
+    updated_after, id_after = after
+    stmt = _scope_productions(
+        select(*PRODUCTION_COLUMNS, *CLIENT_SUMMARY_COLUMNS).outerjoin(Client, Production.client_id == Client.id),
+        organization_id, None, crew_profile_id
+    )
+    stmt = stmt.where(
+        tuple_(Production.updated_at, Production.id) > tuple_(literal(updated_after, DateTime), literal(id_after, Integer))
+    ).order_by(Production.updated_at, Production.id).limit(limit)
+    return await _read_productions(db, stmt, crew_profile_id)
+
+
+async def _read_productions(db: AsyncSession, stmt, crew_profile_id: Optional[uuid.UUID]) -> List[ProductionRead]:
+    """Run a PRODUCTION_COLUMNS + CLIENT_SUMMARY_COLUMNS statement and attach children."""
+    split = len(PRODUCTION_COLUMNS)
+    productions: Dict[int, ProductionRead] = {}
+    for row in await db.execute(stmt):
+        production = ProductionRead(*row[:split])
+        if row[split] is not None:
+            production.client = ClientSummaryRead(*row[split:])
+        productions[production.id] = production
+
+    if not productions:
+        return []
+
+    await _attach_children(db, productions, crew_profile_id)
+    return list(productions.values())
+
+
+async def _attach_children(
+    db: AsyncSession,
+    productions: Dict[int, ProductionRead],
+    crew_profile_id: Optional[uuid.UUID],
+) -> None:
+    """Load items, expenses and crew for the given productions (one query each)."""
+    production_ids: Sequence[int] = list(productions)
+
+    result = await db.execute(
+        select(*PRODUCTION_ITEM_COLUMNS)
+        .where(ProductionItem.production_id.in_(production_ids))
+        .order_by(ProductionItem.id)
+    )
+    for row in result:
+        item = ProductionItemRead(*row)
+        productions[item.production_id].items.append(item)
+
+    result = await db.execute(
+        select(*EXPENSE_COLUMNS)
+        .where(Expense.production_id.in_(production_ids))
+        .order_by(Expense.id)
+    )
+    for row in result:
+        expense = ExpenseRead(*row)
+        productions[expense.production_id].expenses.append(expense)
+
+    crew_stmt = (
+        select(*CREW_MEMBER_COLUMNS)
+        .outerjoin(Profile, ProductionCrew.user_id == Profile.id)
+        .where(ProductionCrew.production_id.in_(production_ids))
+        .order_by(ProductionCrew.id)
+    )
+    if crew_profile_id is not None:
+        crew_stmt = crew_stmt.where(ProductionCrew.user_id == crew_profile_id)
+    for row in await db.execute(crew_stmt):
+        member = CrewMemberRead(*row)
+        productions[member.production_id].crew.append(member)
+
+
+# --- PostgreSQL JSON assembly -------------------------------------------------
+
+_EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def sql_json_enabled(db: AsyncSession) -> bool:
+    """Whether list payloads should be assembled by the database."""
+    return settings.productions_sql_json and db.get_bind().dialect.name == "postgresql"
+
+
+def _json_object(columns) -> Any:
+    """json_build_object('key', column, ...) with the read model field names as keys."""
+    args: List[Any] = []
+    for column in columns:
+        args.extend((literal_column(f"'{column.key}'"), column))
+    return func.json_build_object(*args)
+
+
+def _json_array(element: Any, *order_by: Any) -> Any:
+    """json_agg(element ORDER BY ...), or [] when there are no rows."""
+    return func.coalesce(func.json_agg(aggregate_order_by(element, *order_by)), _EMPTY_JSON_ARRAY)
+
+
+def build_productions_json_query(
+    organization_id: int,
+    skip: int,
+    limit: int,
+    crew_profile_id: Optional[uuid.UUID] = None,
+    list_key: str = "productionsList",
+    filters: Optional[ProductionFilters] = None,
+):
+    """
+    Single statement returning a whole productions list response as JSON text.
+
+    Produces the same payload as fetch_productions + ProductionRead.to_dict,
+    wrapped in the pagination envelope ({list_key, total, skip, limit,
+    has_more}). Children are aggregated with correlated json_agg subqueries
+    over the page only.
+    """
+    page = (
+        _scope_productions(select(*PRODUCTION_COLUMNS), organization_id, filters, crew_profile_id)
+        .order_by(*production_order_by(filters))
+        .offset(skip)
+        .limit(limit)
+        .subquery("page")
+    )
+    total = _scope_productions(
+        select(func.count(Production.id)), organization_id, filters, crew_profile_id
+    ).scalar_subquery()
+
+    client = (
+        select(_json_object(CLIENT_SUMMARY_COLUMNS))
+        .where(Client.id == page.c.client_id)
+        .scalar_subquery()
+    )
+    items = (
+        select(_json_array(_json_object(PRODUCTION_ITEM_COLUMNS), ProductionItem.id))
+        .where(ProductionItem.production_id == page.c.id)
+        .scalar_subquery()
+    )
+    expenses = (
+        select(_json_array(_json_object(EXPENSE_COLUMNS), Expense.id))
+        .where(Expense.production_id == page.c.id)
+        .scalar_subquery()
+    )
+    crew = (
+        select(_json_array(_json_object(CREW_MEMBER_COLUMNS), ProductionCrew.id))
+        .select_from(ProductionCrew)
+        .outerjoin(Profile, ProductionCrew.user_id == Profile.id)
+        .where(ProductionCrew.production_id == page.c.id)
+    )
+    if crew_profile_id is not None:
+        crew = crew.where(ProductionCrew.user_id == crew_profile_id)
+    crew = crew.scalar_subquery()
+
+    production_args: List[Any] = []
+    for key in _PRODUCTION_FIELDS:
+        production_args.extend((literal_column(f"'{key}'"), page.c[key]))
+    production_args.extend((
+        literal_column("'client'"), client,
+        literal_column("'items'"), items,
+        literal_column("'expenses'"), expenses,
+        literal_column("'crew'"), crew,
+    ))
+    productions = (
+        select(_json_array(func.json_build_object(*production_args), *production_order_by(filters, page.c)))
+        .select_from(page)
+        .scalar_subquery()
+    )
+
+    envelope = func.json_build_object(
+        literal_column(f"'{list_key}'"), productions,
+        literal_column("'total'"), total,
+        literal_column("'skip'"), literal(skip, Integer),
+        literal_column("'limit'"), literal(limit, Integer),
+        literal_column("'has_more'"), literal(skip + limit, Integer) < total,
+    )
+    return select(cast(envelope, Text))
+
+
+async def fetch_productions_json(
+    db: AsyncSession,
+    organization_id: int,
+    skip: int,
+    limit: int,
+    crew_profile_id: Optional[uuid.UUID] = None,
+    list_key: str = "productionsList",
+    filters: Optional[ProductionFilters] = None,
+) -> str:
+    """Run build_productions_json_query and return the response body (JSON text)."""
+    result = await db.execute(
+        build_productions_json_query(organization_id, skip, limit, crew_profile_id, list_key, filters)
+    )
+    return result.scalar_one()
@@ -0,0 +1,167 @@
+"""
+Crew scheduling conflicts: is a crew member already booked on another
+production whose shooting sessions overlap this production's sessions?
+
+Bookings are read in one statement per check, for any number of crew
+members: the production's sessions are merged into disjoint intervals and
+other sessions are matched against them with `tsrange && tsrange` (GiST
+index on shooting_sessions, see the add_shooting_sessions migration) on
+PostgreSQL, or plain comparisons elsewhere. Each booking is then paired with
+the interval it overlaps by binary search over the merged intervals.
+"""
+
+import uuid
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status  # type: ignore
+from fastapi.encoders import jsonable_encoder  # type: ignore
+from sqlalchemy import func, or_, select  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.models.production import Production, ProductionStatus
+from app.models.production_crew import ProductionCrew
+from app.models.shooting_session import ShootingSession
+from app.models.user import Profile
+from app.services.production_service import shooting_session_rows
+
+Interval = Tuple[datetime, datetime]
+
+
+class CrewSchedule:
+    """Disjoint, sorted intervals with O(log n) overlap lookup."""
+
+    def __init__(self, intervals: Sequence[Interval]):
+        merged: List[List[datetime]] = []
+        for starts_at, ends_at in sorted(intervals):
+            if merged and starts_at <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], ends_at)
+            else:
+                merged.append([starts_at, ends_at])
+        self.intervals: List[Interval] = [(starts_at, ends_at) for starts_at, ends_at in merged]
+        self._ends = [ends_at for _, ends_at in self.intervals]
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def overlapping(self, starts_at: datetime, ends_at: datetime) -> Optional[Interval]:
+        """First interval overlapping [starts_at, ends_at), if any."""
+        index = bisect_right(self._ends, starts_at)
+        if index < len(self.intervals) and self.intervals[index][0] < ends_at:
+            return self.intervals[index]
+        return None
+
+
+def session_intervals(sessions: Optional[List[Any]]) -> List[Interval]:
+    """Intervals of JSON shooting sessions (same rules as the shooting_sessions table)."""
+    return [(row["starts_at"], row["ends_at"]) for row in shooting_session_rows(0, 0, sessions)]
+
+
+async def production_intervals(db: AsyncSession, production_id: int) -> List[Interval]:
+    """Stored session intervals of a production."""
+    result = await db.execute(
+        select(ShootingSession.starts_at, ShootingSession.ends_at).where(
+            ShootingSession.production_id == production_id
+        )
+    )
+    return [(row.starts_at, row.ends_at) for row in result]
+
+
+def _overlaps_any(schedule: CrewSchedule, range_index: bool):
+    if range_index:
+        session_range = func.tsrange(ShootingSession.starts_at, ShootingSession.ends_at)
+        return or_(*(
+            session_range.op("&&")(func.tsrange(starts_at, ends_at)) for starts_at, ends_at in schedule.intervals
+        ))
+    return or_(*(
+        (ShootingSession.starts_at < ends_at) & (ShootingSession.ends_at > starts_at)
+        for starts_at, ends_at in schedule.intervals
+    ))
+
+
+async def find_crew_conflicts(
+    db: AsyncSession,
+    organization_id: int,
+    production_id: int,
+    user_ids: Sequence[uuid.UUID],
+    intervals: Optional[Sequence[Interval]] = None,
+) -> List[dict]:
+    """
+    Overlapping bookings of crew members on other (non-canceled) productions.
+
+    Args:
+        production_id: Production being staffed (its own sessions never conflict)
+        user_ids: Profiles to check
+        intervals: Sessions to check against; defaults to the production's
+            stored sessions (pass session_intervals(json) for unsaved changes)
+
+    Returns:
+        One dict per conflicting booking, ordered by crew member and start
+    """
+    if intervals is None:
+        intervals = await production_intervals(db, production_id)
+    schedule = CrewSchedule(intervals)
+    if not schedule or not user_ids:
+        return []
+
+    result = await db.execute(
+        select(
+            ProductionCrew.user_id,
+            Profile.full_name,
+            Production.id.label("production_id"),
+            Production.title,
+            ShootingSession.starts_at,
+            ShootingSession.ends_at,
+            ShootingSession.location,
+        )
+        .select_from(ShootingSession)
+        .join(ProductionCrew, ProductionCrew.production_id == ShootingSession.production_id)
+        .join(Production, Production.id == ShootingSession.production_id)
+        .outerjoin(Profile, Profile.id == ProductionCrew.user_id)
+        .where(
+            ShootingSession.organization_id == organization_id,
+            ShootingSession.production_id != production_id,
+            ProductionCrew.user_id.in_(list(user_ids)),
+            Production.status != ProductionStatus.CANCELED.value,
+            _overlaps_any(schedule, db.get_bind().dialect.name == "postgresql"),
+        )
+        .order_by(ProductionCrew.user_id, ShootingSession.starts_at, Production.id)
+    )
+
+    conflicts = []
+    for row in result:
+        overlap = schedule.overlapping(row.starts_at, row.ends_at)
+        if overlap is None:
+            continue
+        conflicts.append({
+            "user_id": str(row.user_id),
+            "full_name": row.full_name,
+            "production_id": row.production_id,
+            "title": row.title,
+            "starts_at": row.starts_at,
+            "ends_at": row.ends_at,
+            "location": row.location,
+            "overlaps_starts_at": overlap[0],
+            "overlaps_ends_at": overlap[1],
+        })
+    return conflicts
+
+
+async def ensure_no_crew_conflicts(
+    db: AsyncSession,
+    organization_id: int,
+    production_id: int,
+    user_ids: Sequence[uuid.UUID],
+    intervals: Optional[Sequence[Interval]] = None,
+) -> None:
+    """Raise 409 Conflict, listing the overlapping bookings, if any crew member is double-booked."""
+    conflicts = await find_crew_conflicts(db, organization_id, production_id, user_ids, intervals)
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=jsonable_encoder({
+                "message": "Crew member is already booked for overlapping shooting sessions",
+                "conflicts": conflicts,
+            })
+        )
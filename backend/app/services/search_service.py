@@ -0,0 +1,194 @@
+"""
+Organization-scoped search over productions, clients and services.
+
+On PostgreSQL every match is answered from indexes (see the
+add_search_indexes migration):
+- pg_trgm GIN indexes on productions.title, clients.full_name/email/cnpj and
+  services.name, queried with the word-similarity operator (`%>`) and ILIKE;
+- tsvector GIN indexes on productions.notes and services.description,
+  queried with websearch_to_tsquery.
+
+The three entity searches are combined with UNION ALL and ranked in a single
+statement. Other databases (tests, local SQLite) fall back to ILIKE matching
+with a constant rank.
+"""
+
+import uuid
+from typing import Any, List, Optional
+
+from sqlalchemy import Float, String, cast, func, literal, literal_column, or_, select, union_all  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.models.client import Client
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.service import Service
+
+SEARCH_TYPES = ("production", "client", "service")
+
+# Text search configuration used by the tsvector indexes (must match the migration)
+TEXT_SEARCH_CONFIG = "portuguese"
+
+# Rendered inline (not as bind parameters) so the expressions match the indexes
+_TS_CONFIG = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+_EMPTY_TEXT = literal_column("''")
+
+
+def _tsvector(column) -> Any:
+    """to_tsvector(config, coalesce(column, '')), as indexed by the migration."""
+    return func.to_tsvector(_TS_CONFIG, func.coalesce(column, _EMPTY_TEXT))
+
+
+def _escape_like(query: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class _Matcher:
+    """Builds match conditions and ranks for one search query and dialect."""
+
+    def __init__(self, query: str, trigram: bool):
+        self.query = query
+        self.trigram = trigram
+        self.pattern = f"%{_escape_like(query)}%"
+        self.tsquery = func.websearch_to_tsquery(_TS_CONFIG, query) if trigram else None
+
+    def trigram_match(self, column) -> Any:
+        """column contains the query, or a word of it is similar to the query."""
+        condition = column.ilike(self.pattern, escape="\\")
+        if self.trigram:
+            condition = or_(column.op("%>")(self.query), condition)
+        return condition
+
+    def trigram_rank(self, column) -> Any:
+        if self.trigram:
+            return func.word_similarity(self.query, func.coalesce(column, _EMPTY_TEXT))
+        return literal(1.0, Float)
+
+    def text_match(self, column) -> Any:
+        """Full-text match (stemmed) on a long text column."""
+        if self.trigram:
+            return _tsvector(column).op("@@")(self.tsquery)
+        return column.ilike(self.pattern, escape="\\")
+
+    def text_rank(self, column) -> Any:
+        if self.trigram:
+            return func.ts_rank(_tsvector(column), self.tsquery)
+        return literal(1.0, Float)
+
+    def best(self, *ranks) -> Any:
+        """Highest of several ranks (constant without trigram support)."""
+        if not self.trigram:
+            return literal(1.0, Float)
+        return func.greatest(*ranks) if len(ranks) > 1 else ranks[0]
+
+
+def _top(stmt, rank, id_column, limit: int):
+    """Keep a branch's best `limit` rows so the union sort stays small."""
+    return select(*stmt.order_by(rank.desc(), id_column).limit(limit).subquery().c)
+
+
+def _search_productions(matcher: _Matcher, organization_id: int, limit: int, crew_profile_id: Optional[uuid.UUID]):
+    rank = matcher.best(matcher.trigram_rank(Production.title), matcher.text_rank(Production.notes))
+    stmt = select(
+        literal("production", String).label("type"),
+        Production.id.label("id"),
+        Production.title.label("title"),
+        cast(Production.status, String).label("subtitle"),
+        rank.label("rank"),
+    ).where(
+        Production.organization_id == organization_id,
+        or_(matcher.trigram_match(Production.title), matcher.text_match(Production.notes)),
+    )
+    if crew_profile_id is not None:
+        stmt = stmt.where(
+            Production.id.in_(select(ProductionCrew.production_id).where(ProductionCrew.user_id == crew_profile_id))
+        )
+    return _top(stmt, rank, Production.id, limit)
+
+
+def _search_clients(matcher: _Matcher, organization_id: int, limit: int):
+    columns = (Client.full_name, Client.email, Client.cnpj)
+    rank = matcher.best(*(matcher.trigram_rank(column) for column in columns))
+    stmt = select(
+        literal("client", String).label("type"),
+        Client.id.label("id"),
+        Client.full_name.label("title"),
+        func.coalesce(Client.email, Client.cnpj).label("subtitle"),
+        rank.label("rank"),
+    ).where(
+        Client.organization_id == organization_id,
+        or_(*(matcher.trigram_match(column) for column in columns)),
+    )
+    return _top(stmt, rank, Client.id, limit)
+
+
+def _search_services(matcher: _Matcher, organization_id: int, limit: int):
+    rank = matcher.best(matcher.trigram_rank(Service.name), matcher.text_rank(Service.description))
+    stmt = select(
+        literal("service", String).label("type"),
+        Service.id.label("id"),
+        Service.name.label("title"),
+        Service.unit.label("subtitle"),
+        rank.label("rank"),
+    ).where(
+        Service.organization_id == organization_id,
+        or_(matcher.trigram_match(Service.name), matcher.text_match(Service.description)),
+    )
+    return _top(stmt, rank, Service.id, limit)
+
+
+def build_search_query(
+    query: str,
+    organization_id: int,
+    types: Optional[List[str]] = None,
+    limit: int = 20,
+    crew_profile_id: Optional[uuid.UUID] = None,
+    trigram: bool = True,
+):
+    """
+    Single UNION ALL statement returning (type, id, title, subtitle, rank) rows.
+
+    Each branch is limited to its own best `limit` rows before the union is
+    ranked; crew members (crew_profile_id) only see productions they are
+    assigned to.
+    """
+    matcher = _Matcher(query, trigram)
+    types = types or list(SEARCH_TYPES)
+
+    branches = []
+    if "production" in types:
+        branches.append(_search_productions(matcher, organization_id, limit, crew_profile_id))
+    if "client" in types:
+        branches.append(_search_clients(matcher, organization_id, limit))
+    if "service" in types:
+        branches.append(_search_services(matcher, organization_id, limit))
+
+    results = union_all(*branches).subquery("results")
+    return select(results).order_by(results.c.rank.desc(), results.c.type, results.c.id).limit(limit)
+
+
+def trigram_enabled(db: AsyncSession) -> bool:
+    """pg_trgm and full-text search are only available on PostgreSQL."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    organization_id: int,
+    types: Optional[List[str]] = None,
+    limit: int = 20,
+    crew_profile_id: Optional[uuid.UUID] = None,
+) -> List[dict]:
+    """Ranked search results as dicts (type, id, title, subtitle, rank)."""
+    result = await db.execute(
+        build_search_query(query, organization_id, types, limit, crew_profile_id, trigram_enabled(db))
+    )
+    return [{
+        "type": row.type,
+        "id": row.id,
+        "title": row.title,
+        "subtitle": row.subtitle,
+        "rank": round(float(row.rank or 0), 4),
+    } for row in result]
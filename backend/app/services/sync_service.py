@@ -0,0 +1,167 @@
+"""
+Delta sync for productions (GET /productions/changes?since=<token>).
+
+A token is an opaque (updated_at, id) keyset position. Each call returns the
+productions updated after it, oldest first, plus the ids of productions that
+left the caller's view since (from production_tombstones), and the token for
+the next call. For admins that means deleted productions; crew members also
+get the productions they were removed from, and only see deletions of
+productions they were assigned to.
+
+Delivery is at-least-once: once a client has caught up, the next token is
+rewound to CHANGES_SAFETY_WINDOW before the database clock, because
+updated_at is set when a transaction starts, not when it commits. Rows
+written by transactions that were still running are therefore picked up on
+the next call; clients apply changes by id, so repeats are harmless.
+"""
+
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import exists, func, insert, literal, select, union_all  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.production_tombstone import ProductionTombstone
+from app.services import read_models
+
+# How far back a caught-up client is sent to cover transactions still committing
+CHANGES_SAFETY_WINDOW = timedelta(seconds=10)
+
+
+@dataclass(frozen=True)
+class ChangesToken:
+    """Keyset position in the (updated_at, id) order of productions."""
+    updated_at: datetime
+    production_id: int = 0
+
+    def encode(self) -> str:
+        raw = f"{self.updated_at.isoformat()}|{self.production_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ChangesToken":
+        """Parse a token from encode(); raises ValueError when malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            updated_at, production_id = raw.split("|")
+            return cls(datetime.fromisoformat(updated_at), int(production_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid changes token: {token}") from e
+
+
+# Position before every production: a full sync
+INITIAL_TOKEN = ChangesToken(datetime(1970, 1, 1), 0)
+
+
+async def database_now(db: AsyncSession) -> datetime:
+    """
+    Current database time, in the same (naive) form as the updated_at values
+    written by func.now() defaults.
+    """
+    now = func.localtimestamp() if db.get_bind().dialect.name == "postgresql" else func.current_timestamp()
+    result = await db.execute(select(now))
+    return result.scalar_one()
+
+
+async def record_production_deleted(db: AsyncSession, production_id: int, organization_id: int) -> None:
+    """
+    Tombstones for a production about to be deleted: one for the organization
+    and one per assigned crew member.
+
+    Run it before the DELETE, while the crew rows exist (they cascade with the
+    production). It is scoped to the organization, so it writes nothing for
+    another organization's production; the caller's transaction holds both.
+    """
+    owned = (Production.id == production_id, Production.organization_id == organization_id)
+    rows = union_all(
+        select(Production.id, Production.organization_id, literal(None, ProductionTombstone.profile_id.type))
+        .where(*owned),
+        select(Production.id, Production.organization_id, ProductionCrew.user_id)
+        .join(ProductionCrew, ProductionCrew.production_id == Production.id)
+        .where(*owned),
+    ).subquery()  # so the deleted_at default can be added to the SELECT
+    await db.execute(
+        insert(ProductionTombstone).from_select(["production_id", "organization_id", "profile_id"], select(rows))
+    )
+
+
+async def record_crew_removed(
+    db: AsyncSession, production_id: int, organization_id: int, profile_ids: Iterable[uuid.UUID]
+) -> None:
+    """Tombstones telling crew members a production left their view (they were unassigned)."""
+    rows = [
+        {"production_id": production_id, "organization_id": organization_id, "profile_id": profile_id}
+        for profile_id in set(profile_ids)
+    ]
+    if rows:
+        await db.execute(insert(ProductionTombstone), rows)
+
+
+async def production_changes(
+    db: AsyncSession,
+    organization_id: int,
+    since: Optional[ChangesToken],
+    limit: int,
+    crew_profile_id: Optional[uuid.UUID] = None,
+) -> dict:
+    """
+    Productions changed and deleted since a token.
+
+    Args:
+        since: Token from a previous call (None = full sync, no deletions)
+        limit: Maximum number of changed productions to return
+        crew_profile_id: When set, only productions this profile is assigned to,
+            and only deletions/unassignments recorded for this profile
+
+    Returns:
+        {"changes": [...], "deleted": [ids], "next_token": str, "has_more": bool}
+    """
+    position = since or INITIAL_TOKEN
+    now = await database_now(db)
+
+    changed = await read_models.fetch_changed_productions(
+        db, organization_id, (position.updated_at, position.production_id), limit + 1, crew_profile_id
+    )
+    has_more = len(changed) > limit
+    changed = changed[:limit]
+
+    if has_more:
+        last = changed[-1]
+        next_token = ChangesToken(last.updated_at, last.id)
+    else:
+        # Caught up: rewind to cover transactions that were still committing
+        next_token = ChangesToken(now - CHANGES_SAFETY_WINDOW, 0)
+
+    deleted = []
+    if since is not None:
+        stmt = select(ProductionTombstone.production_id).where(
+            ProductionTombstone.organization_id == organization_id,
+            ProductionTombstone.deleted_at >= since.updated_at
+        )
+        if crew_profile_id is None:
+            stmt = stmt.where(ProductionTombstone.profile_id.is_(None))
+        else:
+            # Skip unassignments undone since: the production is in their view again
+            stmt = stmt.where(
+                ProductionTombstone.profile_id == crew_profile_id,
+                ~exists().where(
+                    ProductionCrew.production_id == ProductionTombstone.production_id,
+                    ProductionCrew.user_id == crew_profile_id
+                )
+            )
+        if has_more:
+            stmt = stmt.where(ProductionTombstone.deleted_at <= next_token.updated_at)
+        deleted = sorted(set((await db.execute(stmt)).scalars().all()))
+
+    return {
+        "changes": [production.to_dict() for production in changed],
+        "deleted": deleted,
+        "next_token": next_token.encode(),
+        "has_more": has_more,
+    }
@@ -3,22 +3,64 @@
 
 This script ensures the PORT environment variable is read correctly
 regardless of the deployment platform (Railway, Render, Docker, etc.)
+
+Server settings (all optional, read from the environment):
+    WEB_CONCURRENCY       Worker processes (default: CPUs available to the container)
+    BACKLOG               Pending connections queued by the listening socket (default 2048)
+    KEEPALIVE_TIMEOUT     Seconds an idle keep-alive connection stays open (default 75;
+                          keep it above the load balancer's idle timeout)
+    GRACEFUL_TIMEOUT      Seconds shutdown waits for open requests (default 30)
+    MAX_REQUESTS          Requests after which a worker is recycled (default 0 = never)
+
+Each worker is a separate process with its own database pool, Redis client and
+lifespan (see app.core.lifespan), so the database sees up to
+WEB_CONCURRENCY x (pool_size + max_overflow) connections.
 """
+import math
 import os
+
 import uvicorn
 
 
+def available_cpus() -> int:
+    """CPUs this process may use, honouring affinity and the cgroup v2 CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
 def main() -> None:
     # Railway defines PORT environment variable
     # Render may also use PORT, with fallback to 8000
     port = int(os.environ.get("PORT", "8000"))
     host = os.environ.get("HOST", "0.0.0.0")
+    workers = int(os.environ.get("WEB_CONCURRENCY", "0")) or available_cpus()
+    max_requests = int(os.environ.get("MAX_REQUESTS", "0"))
 
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=False,  # Disable reload in production
+        workers=workers,
+        # uvloop and httptools when installed (uvicorn[standard]), asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
+        backlog=int(os.environ.get("BACKLOG", "2048")),
+        timeout_keep_alive=int(os.environ.get("KEEPALIVE_TIMEOUT", "75")),
+        timeout_graceful_shutdown=int(os.environ.get("GRACEFUL_TIMEOUT", "30")),
+        # Recycling bounds slow memory growth; uvicorn restarts exited workers
+        limit_max_requests=max_requests or None,
     )
 
 
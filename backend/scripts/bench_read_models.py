@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark do caminho de leitura das listagens: ORM vs Core + read models
+
+Compara, por linha, o custo de CPU e de memória de:
+- ORM: select(Client) -> objetos no identity map -> dicts (caminho antigo)
+- Core: select(*CLIENT_COLUMNS) -> ClientRead (slots) -> dicts (app.services.read_models)
+
+Roda em SQLite em memória, então mede só o custo do lado Python
+(materialização e serialização), não a latência do banco.
+
+Uso: cd backend && poetry run python scripts/bench_read_models.py [--rows 100 10000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.base_class import Base  # noqa: E402
+from app.models.client import Client  # noqa: E402
+from app.models.user import Organization  # noqa: E402
+from app.services.read_models import CLIENT_COLUMNS, ClientRead  # noqa: E402
+
+
+def setup_database(rows: int):
+    """Create an in-memory database with `rows` clients in one organization."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Organization.__table__, Client.__table__])
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Organization), [{"id": 1, "name": "Bench"}])
+        conn.execute(insert(Client), [{
+            "full_name": f"Client {i}",
+            "email": f"client{i}@example.com",
+            "cnpj": f"{i:014d}",
+            "address": f"Rua {i}, São Paulo",
+            "phone": "+55 11 99999-0000",
+            "organization_id": 1,
+            "created_at": now,
+        } for i in range(rows)])
+    return engine
+
+
+def load_orm(engine):
+    """Previous path: ORM entities in a session."""
+    with Session(engine) as session:
+        clients = session.execute(select(Client).where(Client.organization_id == 1)).scalars().all()
+        return clients, [{
+            "id": client.id,
+            "full_name": client.full_name,
+            "email": client.email,
+            "cnpj": client.cnpj,
+            "address": client.address,
+            "phone": client.phone,
+            "organization_id": client.organization_id,
+            "created_at": client.created_at
+        } for client in clients]
+
+
+def load_core(engine):
+    """Current path: Core rows into slotted read models."""
+    with engine.connect() as conn:
+        clients = [ClientRead(*row) for row in conn.execute(select(*CLIENT_COLUMNS).where(Client.organization_id == 1))]
+        return clients, [client.to_dict() for client in clients]
+
+
+def measure_cpu(loader, engine, repeat: int) -> float:
+    """Best wall time over `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        loader(engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(loader, engine) -> int:
+    """Bytes still allocated while the loaded objects (before serialization) are alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects, _ = loader(engine)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'path':<5} {'total ms':>10} {'us/row':>9} {'bytes/row':>10}")
+    for rows in args.rows:
+        engine = setup_database(rows)
+        # Warm up compiled statement caches for both paths
+        load_orm(engine)
+        load_core(engine)
+
+        results = {}
+        for name, loader in (("orm", load_orm), ("core", load_core)):
+            seconds = measure_cpu(loader, engine, args.repeat)
+            memory = measure_memory(loader, engine)
+            results[name] = (seconds, memory)
+            print(f"{rows:>7} {name:<5} {seconds * 1000:>10.2f} {seconds / rows * 1e6:>9.2f} {memory / rows:>10.0f}")
+
+        (orm_s, orm_mem), (core_s, core_mem) = results["orm"], results["core"]
+        print(f"{rows:>7} {'gain':<5} {orm_s / core_s:>9.1f}x {'':>9} {orm_mem / max(core_mem, 1):>9.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
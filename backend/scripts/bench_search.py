@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Benchmark da busca (app.services.search_service) com 100k linhas por tabela
+
+Cria um schema temporário no PostgreSQL de --database-url (padrão: DATABASE_URL)
+com as tabelas e os índices da migration add_search_indexes, e popula --rows
+produções, clientes e serviços numa organização. Para cada termo de QUERIES:
+- roda EXPLAIN e confere que productions, clients e services não são lidas por Seq Scan
+- roda a busca --repeat vezes (como o endpoint: todos os tipos, limit 20) e mede a mediana
+
+Se algum plano ler uma tabela inteira, ou se a mediana de algum termo passar de
+--max-ms (padrão: SEARCH_LATENCY_BUDGET_MS do endpoint), o script sai com
+código 1 (para rodar no CI). O schema é removido no final.
+
+Uso: cd backend && poetry run python scripts/bench_search.py [--rows 100000] [--repeat 20] [--max-ms 20]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import random
+import re
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from alembic.migration import MigrationContext  # noqa: E402
+from alembic.operations import Operations  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from app.api.v1.endpoints.search import SEARCH_LATENCY_BUDGET_MS  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models.client import Client  # noqa: E402
+from app.models.production import Production  # noqa: E402
+from app.models.production_crew import ProductionCrew  # noqa: E402
+from app.models.service import Service  # noqa: E402
+from app.models.user import Organization, Profile  # noqa: E402
+from app.services import search_service  # noqa: E402
+
+SEARCH_MIGRATION = BACKEND_DIR / "alembic" / "versions" / "c8f4a61e3b27_add_search_indexes.py"
+TABLES = [Organization, Profile, Client, Production, ProductionCrew, Service]
+SEARCHED_TABLES = ("productions", "clients", "services")
+
+ORGANIZATION_ID = 1
+CREW_PROFILE_ID = uuid.UUID(int=1)
+BATCH_SIZE = 5000
+
+# ~1% dos títulos tem cada palavra, como num acervo real
+WORDS = [
+    "documentário", "campanha", "institucional", "casamento", "evento", "clipe", "comercial",
+    "entrevista", "making", "teaser", "podcast", "palestra", "treinamento", "lançamento",
+    "festival", "aniversário", "formatura", "show", "desfile", "curta", "série", "episódio",
+    "vinheta", "animação", "drone", "aéreo", "estúdio", "externa", "noturna", "verão",
+    "inverno", "natal", "carnaval", "junina", "corporativo", "produto", "moda", "gastronomia",
+    "esporte", "futebol", "corrida", "turismo", "hotel", "imobiliário", "fazenda", "praia",
+    "montanha", "cidade", "igreja", "escola", "hospital", "clínica", "academia", "banco",
+    "varejo", "indústria", "startup", "tecnologia", "música", "teatro", "dança", "arte",
+    "exposição", "feira", "congresso", "webinar", "live", "reels", "tutorial", "depoimento",
+]
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Isabela", "João",
+               "Karina", "Lucas", "Marina", "Nicolas", "Olívia", "Pedro", "Rafaela", "Samuel", "Tatiana", "Vitor"]
+LAST_NAMES = ["Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes",
+              "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa"]
+NOTES = [
+    "gravação externa com equipe reduzida", "cliente pediu cortes para redes sociais",
+    "entrega do bruto em até cinco dias", "locação confirmada pela produtora",
+    "aprovar roteiro antes da diária", "trilha licenciada pelo cliente",
+]
+
+# (descrição, termo, perfil de equipe ou None para admin)
+QUERIES = [
+    ("title word", "documentário", None),
+    ("title typo", "documentaro", None),
+    ("client name", "Rafaela Barbosa", None),
+    ("client email", "souza4521", None),
+    ("client cnpj", "00000004521", None),
+    ("notes (full text)", "gravações externas", None),
+    ("crew member", "campanha", CREW_PROFILE_ID),
+]
+
+
+def _title(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {i}"
+
+
+def _rows(rows: int):
+    """Seeded rows for every table, deterministic across runs."""
+    rng = random.Random(42)
+    clients = []
+    for i in range(rows):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        clients.append({
+            "full_name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+            "cnpj": f"{i:014d}",
+            "organization_id": ORGANIZATION_ID,
+        })
+    productions = [{
+        "title": _title(rng, i),
+        "notes": rng.choice(NOTES) if i % 3 == 0 else None,
+        "status": "draft",
+        "organization_id": ORGANIZATION_ID,
+    } for i in range(rows)]
+    services = [{
+        "name": _title(rng, i),
+        "description": rng.choice(NOTES),
+        "default_price": 10000,
+        "unit": "diária",
+        "organization_id": ORGANIZATION_ID,
+    } for i in range(rows)]
+    return clients, productions, services
+
+
+def _create_search_indexes(sync_conn) -> None:
+    """Run the add_search_indexes migration against the benchmark schema."""
+    spec = importlib.util.spec_from_file_location("add_search_indexes", SEARCH_MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with Operations.context(MigrationContext.configure(sync_conn)):
+        migration.upgrade()
+
+
+async def setup_database(engine, rows: int) -> None:
+    """Tables, search indexes and `rows` rows per searched table, then ANALYZE."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[model.__table__ for model in TABLES])
+        await conn.run_sync(_create_search_indexes)
+
+        await conn.execute(insert(Organization), [{"id": ORGANIZATION_ID, "name": "Bench"}])
+        await conn.execute(insert(Profile), [{
+            "id": CREW_PROFILE_ID, "full_name": "Crew", "organization_id": ORGANIZATION_ID, "role": "user"
+        }])
+        for model, values in zip((Client, Production, Service), _rows(rows)):
+            for start in range(0, rows, BATCH_SIZE):
+                await conn.execute(insert(model), values[start:start + BATCH_SIZE])
+
+        # The crew member is assigned to every 10th production
+        await conn.execute(text(
+            "INSERT INTO production_crew (production_id, user_id, role, fee) "
+            "SELECT id, :user_id, 'camera', 10000 FROM productions WHERE id % 10 = 0"
+        ), {"user_id": CREW_PROFILE_ID})
+        await conn.execute(text(f"ANALYZE {', '.join(model.__tablename__ for model in TABLES)}"))
+
+
+async def explain(engine, query: str, crew_profile_id) -> list:
+    """Tables read by a sequential scan in the search plan."""
+    stmt = search_service.build_search_query(query, ORGANIZATION_ID, crew_profile_id=crew_profile_id)
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    async with engine.connect() as conn:
+        plan = "\n".join(row[0] for row in await conn.exec_driver_sql(f"EXPLAIN {sql}"))
+    return sorted(set(re.findall(rf"Seq Scan on ({'|'.join(SEARCHED_TABLES)})\b", plan)))
+
+
+async def measure(engine, query: str, crew_profile_id, repeat: int) -> list:
+    """Wall time of each search, in milliseconds (after one warm-up run)."""
+    timings = []
+    async with AsyncSession(engine) as session:
+        for run in range(repeat + 1):
+            start = time.perf_counter()
+            await search_service.search(session, query, ORGANIZATION_ID, crew_profile_id=crew_profile_id)
+            if run:
+                timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(args) -> list:
+    schema = f"bench_search_{os.getpid()}"
+    admin = create_async_engine(args.database_url)
+    async with admin.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            sys.exit("The search benchmark needs PostgreSQL (pg_trgm and full-text indexes)")
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    # Unqualified tables resolve to the benchmark schema; pg_trgm stays reachable in public
+    engine = create_async_engine(
+        args.database_url, connect_args={"server_settings": {"search_path": f"{schema}, public"}}
+    )
+    failures = []
+    try:
+        start = time.perf_counter()
+        await setup_database(engine, args.rows)
+        print(f"Seeded {args.rows} productions, clients and services in {time.perf_counter() - start:.1f} s")
+        print(f"{'query':<20} {'term':<18} {'median ms':>10} {'p95 ms':>8}  seq scans")
+
+        for name, query, crew_profile_id in QUERIES:
+            seq_scans = await explain(engine, query, crew_profile_id)
+            timings = await measure(engine, query, crew_profile_id, args.repeat)
+            median = statistics.median(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+            print(f"{name:<20} {query:<18} {median:>10.2f} {p95:>8.2f}  {', '.join(seq_scans) or 'none'}")
+
+            if seq_scans:
+                failures.append(f"{name}: sequential scan on {', '.join(seq_scans)}")
+            if median > args.max_ms:
+                failures.append(f"{name}: median {median:.1f} ms (max {args.max_ms:.0f} ms)")
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin.dispose()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index-backed search over seeded tables")
+    parser.add_argument("--database-url", default=settings.async_database_url, help="PostgreSQL URL (asyncpg)")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per searched table")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed searches per term")
+    parser.add_argument("--max-ms", type=float, default=SEARCH_LATENCY_BUDGET_MS,
+                        help="Fail if the median search of any term is slower")
+    args = parser.parse_args()
+
+    failures = asyncio.run(run(args))
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
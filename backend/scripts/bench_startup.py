@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark de cold start: tempo de import do app e da primeira requisição
+
+Cada rodada sobe um interpretador novo (como um container reiniciando) que:
+- importa app.main (mede o tempo do import)
+- faz a primeira requisição via ASGI, sem rede e sem lifespan (mede a latência)
+- lista quais módulos pesados (stripe, supabase, redis, ...) foram importados
+
+Esses módulos devem ser carregados só no primeiro uso; se algum aparecer no
+import do app, ou se a mediana passar de --max-import-ms / --max-request-ms,
+o script sai com código 1 (para rodar no CI).
+
+Uso: cd backend && poetry run python scripts/bench_startup.py [--repeat 5] [--max-import-ms 1500] [--max-request-ms 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Carregados sob demanda (app.core.stripe_client, supabase_client, cache, security)
+LAZY_MODULES = ["stripe", "supabase", "supabase_auth", "redis", "jose", "passlib"]
+
+CHILD = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+import app.main
+import_ms = (time.perf_counter() - start) * 1000
+
+import httpx
+
+async def first_request(path):
+    transport = httpx.ASGITransport(app=app.main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        response = await client.get(path)
+        return (time.perf_counter() - start) * 1000, response.status_code
+
+request_ms, status_code = asyncio.run(first_request(sys.argv[1]))
+print(json.dumps({
+    "import_ms": import_ms,
+    "request_ms": request_ms,
+    "status_code": status_code,
+    "loaded": [name for name in json.loads(sys.argv[2]) if name in sys.modules],
+}))
+"""
+
+
+def run_once(path: str) -> dict:
+    """Import the app and serve one request in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=str(BACKEND_DIR))
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, path, json.dumps(LAZY_MODULES)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Benchmark run failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app import and first-request time")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--path", default="/", help="Path of the first request")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="Fail if the median import time is higher")
+    parser.add_argument("--max-request-ms", type=float, default=None, help="Fail if the median first request is higher")
+    args = parser.parse_args()
+
+    runs = [run_once(args.path) for _ in range(args.repeat)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    request_ms = statistics.median(run["request_ms"] for run in runs)
+    loaded = sorted({name for run in runs for name in run["loaded"]})
+
+    print(f"Runs: {args.repeat}")
+    print(f"Import app.main:     median {import_ms:8.1f} ms  (min {min(r['import_ms'] for r in runs):.1f} ms)")
+    print(f"First GET {args.path:<10} median {request_ms:8.1f} ms  (status {runs[0]['status_code']})")
+    print(f"Heavy modules loaded at import: {', '.join(loaded) or 'none'}")
+
+    failures = []
+    if loaded:
+        failures.append(f"modules that should load lazily were imported: {', '.join(loaded)}")
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import took {import_ms:.1f} ms (max {args.max_import_ms:.0f} ms)")
+    if args.max_request_ms is not None and request_ms > args.max_request_ms:
+        failures.append(f"first request took {request_ms:.1f} ms (max {args.max_request_ms:.0f} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
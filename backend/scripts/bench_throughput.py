@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput do servidor (run.py) com 1 ou mais workers
+
+Para cada valor de --workers, sobe `python run.py` numa porta local com
+WEB_CONCURRENCY=<n>, espera o servidor responder e dispara requisições
+concorrentes contra --path por --duration segundos. Reporta req/s e
+latências p50/p99, para comparar o ganho de rodar um worker por core.
+
+A carga é gerada por --load-processes processos (cada um com seu event loop),
+para que o cliente não seja o gargalo. Use um path que não dependa do banco
+(o padrão "/") para medir só o servidor.
+
+Uso: cd backend && poetry run python scripts/bench_throughput.py [--workers 1 4] [--concurrency 64] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(os.environ, PORT=str(port), HOST="127.0.0.1", WEB_CONCURRENCY=str(workers))
+    return subprocess.Popen(
+        [sys.executable, "run.py"], cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_until_up(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    sys.exit(f"Server did not answer {url} within {timeout:.0f} s")
+
+
+async def _load(url: str, concurrency: int, duration: float) -> list:
+    latencies = []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        async def worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.get(url)
+                if response.status_code < 500:
+                    latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def load_process(args) -> list:
+    """Load generator process: returns the latency of each successful request."""
+    url, concurrency, duration = args
+    return asyncio.run(_load(url, concurrency, duration))
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def bench(workers: int, args) -> None:
+    server = start_server(workers, args.port)
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    try:
+        wait_until_up(url)
+        per_process = max(1, args.concurrency // args.load_processes)
+        with multiprocessing.Pool(args.load_processes) as pool:
+            results = pool.map(load_process, [(url, per_process, args.duration)] * args.load_processes)
+        latencies = sorted(latency for result in results for latency in result)
+    finally:
+        server.send_signal(signal.SIGINT)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    if not latencies:
+        print(f"{workers:>7}  no successful requests")
+        return
+    print(
+        f"{workers:>7}  {len(latencies) / args.duration:>10.0f}"
+        f"  {percentile(latencies, 0.50) * 1000:>8.1f}  {percentile(latencies, 0.99) * 1000:>8.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark server throughput per worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--path", default="/", help="Path requested by the load generator")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent requests in flight")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per run")
+    parser.add_argument("--load-processes", type=int, default=2, help="Load generator processes")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"GET {args.path}, concurrency {args.concurrency}, {args.duration:.0f} s per run")
+    print(f"{'workers':>7}  {'req/s':>10}  {'p50 ms':>8}  {'p99 ms':>8}")
+    for workers in args.workers:
+        bench(workers, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Shared fixtures: an in-memory SQLite database seeded with one organization,
+admin, client and production, plus a counter of the statements each test sends.
+"""
+
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.base_class import Base
+from app.models.client import Client
+from app.models.expense import Expense
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.production_item import ProductionItem
+from app.models.production_tombstone import ProductionTombstone
+from app.models.service import Service
+from app.models.shooting_session import ShootingSession
+from app.models.user import Organization, Profile, User
+
+
+class StatementCounter:
+    """Collects the SQL statements sent to the database."""
+
+    def __init__(self, engine):
+        self.statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith("PRAGMA"):
+            self.statements.append(statement)
+
+    def reset(self):
+        self.statements.clear()
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest_asyncio.fixture
+async def db_setup():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    tables = [model.__table__ for model in (
+        Organization, Profile, User, Client, Service, Production, ProductionItem, Expense, ProductionCrew,
+        ShootingSession, ProductionTombstone
+    )]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(name="Org", default_tax_rate=0.0)
+        session.add(organization)
+        await session.flush()
+
+        admin = Profile(full_name="Admin", organization_id=organization.id, role="admin")
+        client = Client(full_name="Client", organization_id=organization.id)
+        session.add_all([admin, client])
+        await session.flush()
+
+        production = Production(title="Shoot", organization_id=organization.id, client_id=client.id)
+        session.add(production)
+        await session.flush()
+
+        session.add_all([
+            ProductionItem(production_id=production.id, name="Edit", quantity=1, unit_price=1000, total_price=1000),
+            Expense(production_id=production.id, name="Fuel", value=500, category="transport"),
+            ProductionCrew(production_id=production.id, user_id=admin.id, role="director", fee=300),
+        ])
+        await session.commit()
+
+        production_id = production.id
+
+    counter = StatementCounter(engine)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        admin = (await session.execute(select(Profile))).scalar_one()
+        counter.reset()
+        yield session, counter, admin, production_id
+
+    await engine.dispose()
@@ -0,0 +1,58 @@
+"""
+Tests for admission control (app.core.admission).
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.admission import AdmissionController, remember_tenant, tenant_key
+
+
+@pytest.mark.asyncio
+async def test_tenant_at_its_cap_waits_without_blocking_others():
+    controller = AdmissionController(max_in_flight=3, max_per_tenant=1, max_queue=10, max_wait_seconds=1)
+
+    assert await controller.acquire("org:1") is None
+    queued = asyncio.create_task(controller.acquire("org:1"))
+    await asyncio.sleep(0)
+    assert controller.stats()["queue_depth"] == 1
+
+    # Another organization is admitted right away
+    assert await controller.acquire("org:2") is None
+
+    controller.release("org:1")
+    assert await queued is None
+    assert controller.stats()["queue_depth"] == 0
+    assert controller.tenant_in_flight == {"org:1": 1, "org:2": 1}
+
+
+@pytest.mark.asyncio
+async def test_sheds_when_queue_is_full_or_wait_times_out():
+    controller = AdmissionController(max_in_flight=1, max_per_tenant=1, max_queue=1, max_wait_seconds=0.01)
+
+    assert await controller.acquire("org:1") is None
+    waiting = asyncio.create_task(controller.acquire("org:2"))
+    await asyncio.sleep(0)
+    assert await controller.acquire("org:3") == "queue_full"
+    assert await waiting == "wait_timeout"
+
+    stats = controller.stats()
+    assert stats["rejected"]["queue_full"] == 1
+    assert stats["rejected"]["wait_timeout"] == 1
+    assert stats["in_flight"] == 1 and stats["queue_depth"] == 0
+
+
+def _scope(token: str) -> dict:
+    return {"headers": [(b"authorization", f"Bearer {token}".encode())], "client": ("10.0.0.1", 1)}
+
+
+def test_tenant_key_uses_organization_of_verified_tokens_only():
+    # Not verified yet: the client's IP bucket, whatever the token claims
+    assert tenant_key(_scope("header.payload.signature")) == "ip:10.0.0.1"
+    remember_tenant("header.payload.signature", 42)
+    assert tenant_key(_scope("header.payload.signature")) == "org:42"
+
+    # Same claims, different signature: not the verified token
+    assert tenant_key(_scope("header.payload.forged")) == "ip:10.0.0.1"
+    assert tenant_key({"headers": [], "client": ("10.0.0.1", 1)}) == "ip:10.0.0.1"
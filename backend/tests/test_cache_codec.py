@@ -0,0 +1,75 @@
+"""
+Unit tests for cache_codec.py
+Tests framing, compression and legacy compatibility of cached values
+"""
+
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.core.cache_codec import (
+    FORMAT_VERSION,
+    CacheCodecError,
+    CacheSerializer,
+    JsonCodec,
+    ZlibCompressor,
+)
+
+
+class TestCacheSerializer:
+    """Test cases for encoding and decoding cached values"""
+
+    def test_round_trip_with_datetimes_and_uuids(self):
+        """Datetimes and UUIDs no longer need to be pre-stringified"""
+        serializer = CacheSerializer(codec="json", compression="none")
+        user_id = uuid.uuid4()
+        value = {"created_at": datetime(2026, 1, 8, 11, 29, 49), "user_id": user_id, "items": [1, 2, 3]}
+
+        decoded = serializer.decode(serializer.encode(value))
+
+        assert decoded == {"created_at": "2026-01-08T11:29:49", "user_id": str(user_id), "items": [1, 2, 3]}
+
+    def test_header_records_codec_and_compression(self):
+        """Large payloads are compressed and the header says so"""
+        serializer = CacheSerializer(codec="json", compression="zlib", compression_min_bytes=100)
+        value = {"productionsList": [{"title": "Production", "total_value": 10000}] * 200}
+
+        encoded = serializer.encode(value)
+
+        assert encoded[0] == FORMAT_VERSION
+        assert encoded[1] == JsonCodec.codec_id
+        assert encoded[2] == ZlibCompressor.compression_id
+        assert len(encoded) < len(json.dumps(value))
+        assert serializer.decode(encoded) == value
+
+    def test_small_payloads_are_not_compressed(self):
+        """Values under the threshold skip compression"""
+        serializer = CacheSerializer(codec="json", compression="zlib", compression_min_bytes=1024)
+
+        encoded = serializer.encode({"total_revenue": 0})
+
+        assert encoded[2] == 0
+
+    def test_legacy_json_values_still_decode(self):
+        """Keys written before framing (plain json.dumps text) stay readable"""
+        serializer = CacheSerializer()
+        legacy = json.dumps({"total_revenue": 1500, "total_productions": 3}).encode("utf-8")
+
+        assert serializer.decode(legacy) == {"total_revenue": 1500, "total_productions": 3}
+
+    def test_values_written_with_another_codec_decode(self):
+        """Changing the configured codec does not break existing keys"""
+        old = CacheSerializer(codec="json", compression="zlib", compression_min_bytes=0)
+        new = CacheSerializer(codec="orjson", compression="none")
+        value = {"status": "draft", "count": 2}
+
+        assert new.decode(old.encode(value)) == value
+
+    def test_unknown_format_raises(self):
+        """Unknown codec ids are reported instead of silently returning garbage"""
+        serializer = CacheSerializer()
+
+        with pytest.raises(CacheCodecError):
+            serializer.decode(bytes((FORMAT_VERSION, 99, 0)) + b"{}")
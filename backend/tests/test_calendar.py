@@ -0,0 +1,29 @@
+"""
+Tests for the calendar service (app.services.calendar_service).
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.services.calendar_service import fetch_calendar_events
+from app.services.production_service import sync_shooting_sessions
+
+
+@pytest.mark.asyncio
+async def test_calendar_reads_sessions_in_range(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    await sync_shooting_sessions(production_id, admin.organization_id, [
+        {"date": "2026-03-10", "location": "Studio"},
+        {"date": None, "location": "TBD"},
+        {"date": "2026-04-02", "location": None},
+    ], db)
+    counter.reset()
+
+    events = await fetch_calendar_events(db, admin.organization_id, datetime(2026, 3, 1), datetime(2026, 4, 1))
+
+    assert counter.count == 1
+    assert [(event["type"], event["starts_at"], event["location"]) for event in events] == [
+        ("filming", datetime(2026, 3, 10), "Studio")
+    ]
@@ -0,0 +1,78 @@
+"""
+Tests for request deadlines (app.core.deadlines).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.deadlines import DeadlineMiddleware, deadline, deadline_stats
+
+
+@pytest.mark.asyncio
+async def test_handler_past_its_deadline_gets_504():
+    @deadline(0.01)
+    async def slow_endpoint():
+        await asyncio.sleep(1)
+
+    before = deadline_stats.handler_timeouts
+    with pytest.raises(HTTPException) as error:
+        await slow_endpoint()
+
+    assert error.value.status_code == 504
+    assert deadline_stats.handler_timeouts == before + 1
+    assert slow_endpoint.deadline_seconds == 0.01
+
+
+@pytest.mark.asyncio
+async def test_timeouts_raised_by_the_handler_itself_pass_through():
+    @deadline(5)
+    async def endpoint():
+        await asyncio.wait_for(asyncio.sleep(1), timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        await endpoint()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/stuck")
+    async def stuck():
+        await asyncio.sleep(1)  # e.g. a third-party call that never answers
+
+    @app.get("/override")
+    @deadline(1)
+    async def override(request: Request):
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"start"
+            await asyncio.sleep(0.1)
+            yield b"end"
+        return StreamingResponse(body())
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_every_route_gets_the_default_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "request_deadline_seconds", 0.05)
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        before = deadline_stats.by_route.get("GET /stuck", 0)
+        response = await client.get("/stuck")
+        assert response.status_code == 504
+        assert deadline_stats.by_route["GET /stuck"] == before + 1
+
+        # @deadline overrides the default, and started responses are not cut
+        assert (await client.get("/override")).json() == {"ok": True}
+        assert (await client.get("/stream")).content == b"startend"
@@ -0,0 +1,93 @@
+"""
+Tests for the per-worker change event fan-out (app.core.events) and the
+event stream endpoint.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app.api import deps
+from app.api.v1.endpoints.events import router, stream_events
+from app.core.events import RESYNC_EVENT, SUBSCRIBER_QUEUE_SIZE, EventHub
+from app.db.base_class import Base
+from app.db.session import get_db
+from app.models.user import Organization, Profile
+
+
+@pytest.mark.asyncio
+async def test_events_are_delivered_to_the_organization_only():
+    hub = EventHub()
+    event = {"resource": "production", "action": "updated", "production_id": 7}
+
+    async with hub.subscribe(1) as queue, hub.subscribe(2) as other:
+        hub._deliver(1, event)
+
+        assert queue.get_nowait() == event
+        assert other.empty()
+
+    assert hub._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_a_single_resync():
+    hub = EventHub()
+
+    async with hub.subscribe(1) as queue:
+        for production_id in range(SUBSCRIBER_QUEUE_SIZE + 5):
+            hub._deliver(1, {"resource": "production", "action": "updated", "production_id": production_id})
+
+        assert queue.get_nowait() == RESYNC_EVENT
+        assert queue.qsize() == 4
+
+
+def _dependency_calls(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependency_calls(dependency)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_does_not_hold_a_pool_connection(tmp_path, monkeypatch):
+    # The route must not depend on get_db, whose session lives as long as the response
+    stream_route = next(route for route in router.routes if route.endpoint is stream_events)
+    assert get_db not in set(_dependency_calls(stream_route.dependant))
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Organization.__table__, Profile.__table__])
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with sessions() as session:
+        organization = Organization(name="Org")
+        session.add(organization)
+        await session.flush()
+        profile = Profile(full_name="Crew", organization_id=organization.id, role="user", is_active=True)
+        session.add(profile)
+        await session.commit()
+
+    async def get_user(token):
+        return SimpleNamespace(user=SimpleNamespace(id=profile.id))
+
+    async def get_supabase_client():
+        return SimpleNamespace(auth=SimpleNamespace(get_user=get_user))
+
+    monkeypatch.setattr(deps, "AsyncSessionLocal", sessions)
+    monkeypatch.setattr(deps, "SUPABASE_AVAILABLE", True)
+    monkeypatch.setattr(deps, "get_supabase_client", get_supabase_client)
+
+    request = Request({"type": "http", "method": "GET", "path": "/api/v1/events/", "headers": [], "query_string": b""})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    current_profile = await deps.get_streaming_supabase_user(request, credentials)
+    assert current_profile.id == profile.id
+    assert engine.pool.checkedout() == 0
+
+    response = await stream_events(request, current_profile)
+    try:
+        assert (await response.body_iterator.__anext__()).startswith("retry:")
+        assert engine.pool.checkedout() == 0
+    finally:
+        await response.body_iterator.aclose()
+        await engine.dispose()
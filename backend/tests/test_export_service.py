@@ -0,0 +1,39 @@
+"""
+Tests for the streaming productions export (app.services.export_service).
+"""
+
+import csv
+import io
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.client import Client
+from app.services import export_service
+
+
+@pytest.mark.asyncio
+async def test_csv_export_neutralizes_formulas(db_setup, monkeypatch):
+    db, counter, admin, production_id = db_setup
+    await db.execute(update(Client).values(full_name='=HYPERLINK("http://evil","x")'))
+    await db.commit()
+    monkeypatch.setattr(export_service, "AsyncSessionLocal", async_sessionmaker(db.bind, class_=AsyncSession))
+
+    body = b"".join([chunk async for chunk in export_service.stream_productions_csv(admin.organization_id)])
+    [row] = list(csv.DictReader(io.StringIO(body.decode("utf-8"))))
+
+    assert row["id"] == str(production_id)
+    assert row["client_name"] == '\'=HYPERLINK("http://evil","x")'
+    assert row["title"] == "Shoot"
+
+
+@pytest.mark.asyncio
+async def test_export_stops_at_its_deadline(db_setup, monkeypatch):
+    db, counter, admin, production_id = db_setup
+    monkeypatch.setattr(export_service, "AsyncSessionLocal", async_sessionmaker(db.bind, class_=AsyncSession))
+    monkeypatch.setattr(export_service.settings, "export_deadline_seconds", -1)
+
+    with pytest.raises(TimeoutError):
+        async for chunk in export_service.stream_productions_ndjson(admin.organization_id):
+            pass
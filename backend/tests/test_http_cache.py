@@ -0,0 +1,28 @@
+"""
+Tests for the ETag helpers (app.core.http_cache) and version-scoped cache keys.
+"""
+
+from starlette.requests import Request
+
+from app.core.cache import CacheKeys
+from app.core.http_cache import is_not_modified, make_etag, version_etag
+
+
+def _request(if_none_match: str) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+def test_etags_are_weak_and_match_either_form():
+    etag = make_etag("productions", 1, "v1")
+    assert etag.startswith('W/"')
+
+    assert is_not_modified(_request(etag), etag)
+    assert is_not_modified(_request(etag.removeprefix("W/")), etag)  # Proxies may strip W/
+    assert not is_not_modified(_request(make_etag("productions", 1, "v2")), etag)
+    assert version_etag(None, 1, "productions") is None
+
+
+def test_list_cache_keys_change_with_the_org_version():
+    before = CacheKeys.productions_list(1, "v1", "admin")
+    assert before != CacheKeys.productions_list(1, "v2", "admin")
+    assert before.startswith("productions:list:1:v1:")
@@ -0,0 +1,102 @@
+"""
+Tests for bulk imports (app.services.import_service) and the client plan limit.
+"""
+
+import io
+import json
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import select
+
+from app.models.client import Client
+from app.schemas.client import ClientCreate
+from app.services import import_service
+from app.services.billing_service import BillingService
+from app.services.import_service import IMPORT_MAX_ROWS, import_records, iter_upload_records
+
+
+def make_upload(content: str, filename: str) -> UploadFile:
+    return UploadFile(io.BytesIO(content.encode("utf-8")), filename=filename)
+
+
+def test_csv_rows_are_stripped_and_empty_cells_become_none():
+    upload = make_upload("﻿full_name, email ,phone\n Ana ,ana@example.com,\nBruno,,123\n", "clients.csv")
+
+    records = [record for _, record in iter_upload_records(upload, "csv")]
+
+    assert records == [
+        {"full_name": "Ana", "email": "ana@example.com", "phone": None},
+        {"full_name": "Bruno", "email": None, "phone": "123"},
+    ]
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps([{"full_name": "Ana"}, {"full_name": "Bruno"}], indent=2),
+    '{"full_name": "Ana"}\n\n{"full_name": "Bruno"}\n',
+])
+def test_json_arrays_and_ndjson_yield_the_same_records(content):
+    upload = make_upload(content, "clients.json")
+
+    assert list(iter_upload_records(upload, "json")) == [(1, {"full_name": "Ana"}), (2, {"full_name": "Bruno"})]
+
+
+def test_uploads_over_the_row_cap_are_rejected():
+    upload = make_upload("".join('{"full_name": "C"}\n' for _ in range(IMPORT_MAX_ROWS + 1)), "clients.ndjson")
+
+    with pytest.raises(HTTPException) as exc_info:
+        for _ in iter_upload_records(upload, "json"):
+            pass
+    assert exc_info.value.status_code == 413
+
+
+def test_unparseable_uploads_answer_400():
+    with pytest.raises(HTTPException) as exc_info:
+        list(iter_upload_records(make_upload('{"full_name": ', "clients.json"), "json"))
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_reports_invalid_rows_and_truncates_at_capacity(db_setup, monkeypatch):
+    db, counter, admin, production_id = db_setup
+    monkeypatch.setattr(import_service, "IMPORT_CHUNK_ROWS", 2)
+    upload = make_upload(
+        "full_name,email\nAna,ana@example.com\n,missing@example.com\nBruno,not-an-email\n"
+        "Carla,\nDiego,\nElisa,\n",
+        "clients.csv"
+    )
+
+    report = await import_records(
+        upload, "csv", ClientCreate, Client, admin.organization_id, db,
+        capacity=3, capacity_error="Plan limit reached"
+    )
+    await db.commit()
+
+    result = report.as_dict()
+    assert result["created"] == 3
+    assert result["failed"] == 3
+    assert [error["row"] for error in result["errors"]] == [2, 3, 6]
+    assert result["errors"][-1]["errors"][0]["type"] == "plan_limit"
+    names = (await db.execute(
+        select(Client.full_name).where(Client.organization_id == admin.organization_id).order_by(Client.id)
+    )).scalars().all()
+    assert names == ["Client", "Ana", "Carla", "Diego"]
+    assert len([s for s in counter.statements if s.lstrip().upper().startswith("INSERT")]) == 2  # One per chunk
+
+
+@pytest.mark.asyncio
+async def test_check_client_limit_matches_the_remaining_slots(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    # Free plan: 5 clients, the fixture already has one
+    assert await BillingService.get_remaining_client_slots(admin.organization_id, db) == 4
+    await BillingService.check_client_limit(admin.organization_id, db)
+
+    db.add_all([Client(full_name=f"Client {n}", organization_id=admin.organization_id) for n in range(4)])
+    await db.commit()
+
+    assert await BillingService.get_remaining_client_slots(admin.organization_id, db) == 0
+    with pytest.raises(HTTPException) as exc_info:
+        await BillingService.check_client_limit(admin.organization_id, db)
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Limite de clientes atingido para o plano free. (Máx: 5)"
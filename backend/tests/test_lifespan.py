@@ -0,0 +1,75 @@
+"""
+Tests for the lifespan resource registry (app.core.lifespan).
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.lifespan import ResourceRegistry
+
+
+@pytest.mark.asyncio
+async def test_startup_order_readiness_and_reverse_shutdown():
+    registry = ResourceRegistry()
+    calls = []
+
+    def hook(name):
+        async def _hook():
+            calls.append(name)
+        return _hook
+
+    registry.register("database", hook("start database"), hook("close database"))
+    registry.register("cache", hook("start cache"), hook("close cache"), critical=False)
+    assert registry.ready is False
+
+    await registry.startup()
+    assert registry.ready is True
+
+    await registry.shutdown()
+    assert registry.ready is False
+    assert calls == ["start database", "start cache", "close cache", "close database"]
+
+
+@pytest.mark.asyncio
+async def test_failed_critical_resource_keeps_app_unready():
+    registry = ResourceRegistry()
+
+    async def fail():
+        raise ConnectionError("unreachable")
+
+    async def ok():
+        pass
+
+    registry.register("database", fail)
+    registry.register("cache", fail, critical=False)
+    registry.register("stripe", ok)
+    await registry.startup()
+
+    assert registry.ready is False
+    assert registry.status()["resources"] == {
+        "database": "ConnectionError: unreachable",
+        "cache": "ConnectionError: unreachable",
+        "stripe": "ok",
+    }
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_in_flight_requests():
+    registry = ResourceRegistry()
+    closed = []
+
+    async def close():
+        closed.append(registry.in_flight)
+
+    registry.register("database", None, close)
+    await registry.startup()
+
+    registry.request_started()
+    shutdown = asyncio.create_task(registry.shutdown())
+    await asyncio.sleep(0.01)
+    assert registry.draining is True and closed == []
+
+    registry.request_finished()
+    await shutdown
+    assert closed == [0]
@@ -0,0 +1,40 @@
+"""
+Tests for the event-loop lag monitor (app.core.loop_monitor).
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopLagMonitor
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_reported_with_its_route_and_stack(caplog):
+    monitor = LoopLagMonitor(interval_seconds=0.01, threshold_seconds=0.05)
+
+    async def endpoint():
+        time.sleep(0.3)  # Blocks the loop
+
+    async def app(scope):
+        await endpoint()
+
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+            await app({"type": "http", "method": "GET", "path": "/api/v1/slow"})
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert monitor.blocked_reports == 1
+    message = caplog.records[0].getMessage()
+    assert "GET /api/v1/slow" in message
+    assert "time.sleep(0.3)" in message
+
+    stats = monitor.stats()
+    assert stats["max_ms"] >= 200
+    assert stats["histogram"]["le_250ms"] + stats["histogram"]["le_500ms"] >= 1
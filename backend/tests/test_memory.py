@@ -0,0 +1,78 @@
+"""
+Tests for the memory diagnostics (app.core.memory).
+"""
+
+import threading
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import diagnostics
+from app.core.memory import MemoryTracer, NoBaseline, memory_stats
+
+
+def test_memory_stats_report_rss_gc_and_state():
+    stats = memory_stats()
+    assert stats["peak_rss_mb"] > 0
+    assert len(stats["gc"]["collections"]) == 3
+    assert set(stats["state"]) == {"rate_limit_buckets", "processed_checkout_sessions", "slow_queries"}
+
+
+def test_diff_points_at_allocations_made_after_the_baseline():
+    tracer = MemoryTracer()
+    tracer.start(frames=5)
+    try:
+        leaked = [bytearray(1024) for _ in range(2000)]  # ~2 MB
+        [top] = tracer.diff("lineno", limit=1)
+    finally:
+        tracer.stop()
+    assert top["size_diff_kb"] > 1500
+    assert "test_memory.py" in top["traceback"][0]
+    assert leaked
+
+
+@pytest.mark.asyncio
+async def test_worker_stats_and_snapshots_are_for_operators_off_the_loop(monkeypatch):
+    monkeypatch.setattr(diagnostics.settings, "diagnostics_token", "operator-secret")
+    monkeypatch.setattr(diagnostics.settings, "memory_diagnostics_enabled", True)
+    snapshot_threads = []
+
+    def top(group_by, limit):
+        snapshot_threads.append(threading.get_ident())
+        return []
+
+    monkeypatch.setattr(diagnostics.memory_tracer, "baseline", object())
+    monkeypatch.setattr(diagnostics.memory_tracer, "top", top)
+
+    app = FastAPI()
+    app.include_router(diagnostics.router, prefix="/api/v1/diagnostics")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/api/v1/diagnostics/stats")).status_code == 403
+
+        headers = {"X-Diagnostics-Token": "operator-secret"}
+        response = await client.get("/api/v1/diagnostics/stats", headers=headers)
+        assert set(response.json()) == {"admission", "deadlines", "event_loop", "memory"}
+
+        response = await client.get("/api/v1/diagnostics/memory/top", headers=headers)
+        assert response.json() == {"stats": []}
+        assert snapshot_threads and snapshot_threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_diff_after_a_concurrent_stop_is_a_409(monkeypatch):
+    monkeypatch.setattr(diagnostics.settings, "diagnostics_token", "operator-secret")
+    monkeypatch.setattr(diagnostics.settings, "memory_diagnostics_enabled", True)
+    tracer = MemoryTracer()
+    tracer.start(frames=1)
+    tracer.stop()  # As if DELETE /memory/baseline ran between the check and the diff
+    with pytest.raises(NoBaseline):
+        tracer.diff("lineno", limit=1)
+
+    app = FastAPI()
+    app.include_router(diagnostics.router, prefix="/api/v1/diagnostics")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/diagnostics/memory/diff", headers={"X-Diagnostics-Token": "operator-secret"})
+    assert response.status_code == 409
@@ -0,0 +1,91 @@
+"""
+Tests for the sampling profiler (app.core.profiler).
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from app.api.v1.endpoints.diagnostics import require_operator
+from app.core import profiler
+from app.core.profiler import ProfilingMiddleware, profile_worker
+
+
+@pytest.fixture(autouse=True)
+def operator_token(monkeypatch):
+    monkeypatch.setattr(profiler.settings, "profiling_enabled", True)
+    monkeypatch.setattr(profiler.settings, "diagnostics_token", "operator-secret")
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+
+    @app.get("/slow")
+    async def slow_endpoint():
+        await asyncio.sleep(0.05)  # Awaiting I/O
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:  # On CPU
+            pass
+        return {"ok": True}
+
+    return app
+
+
+def frame_names(document: dict) -> set:
+    return {frame["name"] for frame in document["shared"]["frames"]}
+
+
+@pytest.mark.asyncio
+async def test_profile_header_returns_the_request_profile_to_operators(monkeypatch):
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/slow", headers={"X-Profile": "1", "X-Diagnostics-Token": "operator-secret"})
+        assert response.headers["x-profiled-status"] == "200"
+        document = response.json()
+        assert document["profiles"][0]["name"] == "GET /slow -> 200"
+        assert "build_app.<locals>.slow_endpoint" in frame_names(document)
+        assert sum(document["profiles"][0]["weights"]) >= 0.08
+
+        # Without the operator token the sampler never starts
+        def fail(self, collect):
+            raise AssertionError("sampler started")
+
+        monkeypatch.setattr(profiler.SamplingProfiler, "start", fail)
+        for token in (None, "wrong"):
+            headers = {"X-Profile": "1"} if token is None else {"X-Profile": "1", "X-Diagnostics-Token": token}
+            response = await client.get("/slow", headers=headers)
+            assert response.json() == {"ok": True}
+            assert "x-profiled-status" not in response.headers
+
+
+def test_diagnostics_need_the_operator_token(monkeypatch):
+    require_operator("operator-secret")
+    for token in (None, "wrong"):
+        with pytest.raises(HTTPException) as error:
+            require_operator(token)
+        assert error.value.status_code == 403
+
+    # No token configured: nobody gets in
+    monkeypatch.setattr(profiler.settings, "diagnostics_token", "")
+    with pytest.raises(HTTPException):
+        require_operator("")
+
+
+@pytest.mark.asyncio
+async def test_worker_profile_samples_the_event_loop():
+    async def busy():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+    profiling = asyncio.create_task(profile_worker(0.1, 0.002))
+    await asyncio.sleep(0)
+    await busy()
+    document = await profiling
+
+    assert document["profiles"][0]["type"] == "sampled"
+    assert "test_worker_profile_samples_the_event_loop.<locals>.busy" in frame_names(document)
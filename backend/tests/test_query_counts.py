@@ -0,0 +1,231 @@
+"""
+Statement-count tests for production endpoints.
+
+Relationships on Production/ProductionCrew are never loaded implicitly, so
+ownership checks must stay a single EXISTS and endpoints must only load the
+parts of the graph they actually return. Runs against in-memory SQLite
+(db_setup in conftest.py).
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.v1.endpoints.expenses import create_expense, create_expenses_bulk
+from app.api.v1.endpoints.production_crew import add_crew_members_bulk
+from app.api.v1.endpoints.production_items import create_production_item, create_production_items_bulk
+from app.api.v1.endpoints.productions import delete_production, get_production
+from app.models.production import Production
+from app.models.production_item import ProductionItem
+from app.models.user import Profile
+from app.schemas.expense import ExpenseBulkCreate, ExpenseCreate
+from app.schemas.production_crew import ProductionCrewBulkCreate, ProductionCrewCreate
+from app.schemas.production_item import ProductionItemBulkCreate, ProductionItemCreate
+from app.services import read_models
+from app.services.production_service import production_in_organization
+
+
+@pytest.mark.asyncio
+async def test_plain_select_loads_no_relationships(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    production = (await db.execute(select(Production).where(Production.id == production_id))).scalar_one()
+
+    assert counter.count == 1
+    with pytest.raises(InvalidRequestError):
+        production.items
+
+
+@pytest.mark.asyncio
+async def test_ownership_check_is_a_single_exists(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    assert await production_in_organization(production_id, admin.organization_id, db) is True
+    assert await production_in_organization(production_id, admin.organization_id + 1, db) is False
+
+    assert counter.count == 2
+    assert all("EXISTS" in statement.upper() for statement in counter.statements)
+    assert db.identity_map.keys() == {db.identity_key(Profile, admin.id)}
+
+
+@pytest.mark.asyncio
+async def test_create_expense_statement_count(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    await create_expense(production_id, ExpenseCreate(name="Lunch", value=200, category="food"), admin, db)
+
+    # EXISTS, INSERT, refresh, totals (production + organization/items/expenses/crew), UPDATE
+    assert counter.count == 9
+
+
+@pytest.mark.asyncio
+async def test_create_item_statement_count(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    await create_production_item(
+        production_id, ProductionItemCreate(name="Color", quantity=1, unit_price=700), admin, db
+    )
+
+    # EXISTS, INSERT, refresh, totals (production + organization/items/expenses/crew), UPDATE
+    assert counter.count == 9
+
+
+@pytest.mark.asyncio
+async def test_get_production_statement_count(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    production = await get_production(production_id, admin, db)
+
+    # production, items, expenses, crew, crew users, client
+    assert counter.count == 6
+    assert production["client"]["full_name"] == "Client"
+
+
+@pytest.mark.asyncio
+async def test_delete_production_statement_count(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    await delete_production(production_id, admin, db)
+
+    # Tombstone INSERT ... SELECT (org + crew), DELETE ... RETURNING
+    assert counter.count == 2
+    remaining = (await db.execute(select(ProductionItem.id))).all()
+    assert remaining == []
+
+
+@pytest.mark.asyncio
+async def test_list_productions_reads_core_rows(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    productions = await read_models.fetch_productions(db, admin.organization_id, skip=0, limit=50)
+
+    # page + client, items, expenses, crew (with profile names)
+    assert counter.count == 4
+    assert db.identity_map.keys() == {db.identity_key(Profile, admin.id)}
+
+    production = productions[0].to_dict()
+    assert production["client"]["full_name"] == "Client"
+    assert [item["total_price"] for item in production["items"]] == [1000]
+    assert [expense["value"] for expense in production["expenses"]] == [500]
+    assert [member["full_name"] for member in production["crew"]] == ["Admin"]
+
+
+def _count_commits(db):
+    commits = []
+    event.listen(db.sync_session, "after_commit", lambda session: commits.append(session))
+    return commits
+
+
+def _statements_starting(counter, prefix):
+    return [statement for statement in counter.statements if statement.lstrip().upper().startswith(prefix)]
+
+
+def _ordered_insert_statements(db, rows):
+    """
+    INSERTs sent by a multi-row INSERT ... RETURNING with sort_by_parameter_order:
+    one on Postgres (the autoincrement key sorts the returned rows), one per row
+    on SQLite, which has no sentinel support.
+    """
+    return 1 if db.bind.dialect.name == "postgresql" else rows
+
+
+@pytest.mark.asyncio
+async def test_bulk_expenses_insert_in_order_and_commit_once(db_setup):
+    db, counter, admin, production_id = db_setup
+    commits = _count_commits(db)
+
+    expenses = await create_expenses_bulk(production_id, ExpenseBulkCreate(expenses=[
+        ExpenseCreate(name="Lunch", value=200, category="food"),
+        ExpenseCreate(name="Taxi", value=300, category="transport"),
+        ExpenseCreate(name="Props", value=400, category="other"),
+    ]), admin, db)
+
+    assert [expense.name for expense in expenses] == ["Lunch", "Taxi", "Props"]
+    # EXISTS, the INSERT, totals (production + organization/items/expenses/crew), one UPDATE
+    inserts = _ordered_insert_statements(db, 3)
+    assert len(_statements_starting(counter, "INSERT")) == inserts
+    assert len(_statements_starting(counter, "UPDATE")) == 1
+    assert counter.count == 7 + inserts
+    assert len(commits) == 1
+
+    production = (await db.execute(select(Production).where(Production.id == production_id))).scalar_one()
+    assert production.total_cost == 500 + 200 + 300 + 400 + 300  # expenses + crew fee
+
+
+@pytest.mark.asyncio
+async def test_bulk_items_insert_in_order_and_commit_once(db_setup):
+    db, counter, admin, production_id = db_setup
+    commits = _count_commits(db)
+
+    items = await create_production_items_bulk(production_id, ProductionItemBulkCreate(items=[
+        ProductionItemCreate(name="Color", quantity=2, unit_price=700),
+        ProductionItemCreate(name="Sound", quantity=1, unit_price=300),
+    ]), admin, db)
+
+    assert [item.total_price for item in items] == [1400, 300]
+    assert len(_statements_starting(counter, "INSERT")) == _ordered_insert_statements(db, 2)
+    assert len(_statements_starting(counter, "UPDATE")) == 1
+    assert len(commits) == 1
+
+    production = (await db.execute(select(Production).where(Production.id == production_id))).scalar_one()
+    assert production.subtotal == 1000 + 1400 + 300
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoints_reject_other_organizations_production(db_setup):
+    db, counter, admin, production_id = db_setup
+    outsider = Profile(full_name="Outsider", organization_id=admin.organization_id + 1, role="admin")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await create_expenses_bulk(production_id, ExpenseBulkCreate(expenses=[
+            ExpenseCreate(name="Lunch", value=200, category="food")
+        ]), outsider, db)
+    assert exc_info.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc_info:
+        await create_production_items_bulk(production_id, ProductionItemBulkCreate(items=[
+            ProductionItemCreate(name="Color", quantity=1, unit_price=700)
+        ]), outsider, db)
+    assert exc_info.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc_info:
+        await add_crew_members_bulk(production_id, ProductionCrewBulkCreate(crew=[
+            ProductionCrewCreate(user_id=str(admin.id), role="camera", fee=100)
+        ]), False, outsider, db)
+    assert exc_info.value.status_code == 404
+
+    assert _statements_starting(counter, "INSERT") == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_crew_inserts_in_order_and_rejects_duplicates(db_setup):
+    db, counter, admin, production_id = db_setup
+    camera = Profile(full_name="Camera", organization_id=admin.organization_id, role="user")
+    sound = Profile(full_name="Sound", organization_id=admin.organization_id, role="user")
+    db.add_all([camera, sound])
+    await db.commit()
+    counter.reset()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await add_crew_members_bulk(production_id, ProductionCrewBulkCreate(crew=[
+            ProductionCrewCreate(user_id=str(camera.id), role="camera", fee=100),
+            ProductionCrewCreate(user_id=str(camera.id), role="drone", fee=100),
+        ]), False, admin, db)
+    assert exc_info.value.status_code == 400
+    assert counter.count == 1  # Only the ownership EXISTS ran
+
+    counter.reset()
+    commits = _count_commits(db)
+    crew = await add_crew_members_bulk(production_id, ProductionCrewBulkCreate(crew=[
+        ProductionCrewCreate(user_id=str(camera.id), role="camera", fee=100),
+        ProductionCrewCreate(user_id=str(sound.id), role="sound", fee=200),
+    ]), False, admin, db)
+
+    assert [member["full_name"] for member in crew] == ["Camera", "Sound"]
+    assert len(_statements_starting(counter, "INSERT")) == _ordered_insert_statements(db, 2)
+    assert len(_statements_starting(counter, "UPDATE")) == 1
+    assert len(commits) == 1
+
+    production = (await db.execute(select(Production).where(Production.id == production_id))).scalar_one()
+    assert production.total_cost == 500 + 300 + 100 + 200  # expense + crew fees
@@ -0,0 +1,138 @@
+"""
+Tests for the rate limiter (app.core.rate_limit).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core import rate_limit
+from app.core.cache import cache
+from app.core.rate_limit import RateLimiter
+
+
+class FakeRedis:
+    """The few Redis commands the limiter uses, counting round trips."""
+
+    def __init__(self, fail: bool = False):
+        self.values = {}
+        self.round_trips = 0
+        self.fail = fail
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    async def decrby(self, key, amount):
+        self.round_trips += 1
+        self.values[key] = self.values.get(key, 0) - amount
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    def incrby(self, key, amount):
+        self.commands.append(("incrby", key, amount))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def get(self, key):
+        self.commands.append(("get", key, None))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        if self.redis.fail:
+            raise ConnectionError("Redis is down")
+        results = []
+        for command, key, amount in self.commands:
+            if command == "incrby":
+                self.redis.values[key] = self.redis.values.get(key, 0) + amount
+                results.append(self.redis.values[key])
+            elif command == "get":
+                results.append(self.redis.values.get(key))
+            else:
+                results.append(True)
+        return results
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [999_960.0]  # Start of a minute window
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "enabled", True)
+    monkeypatch.setattr(cache, "_client", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_leased_tokens_are_spent_locally(clock, redis):
+    limiter = RateLimiter()  # Lease of 10 for a limit of 100
+
+    for _ in range(10):
+        assert await limiter.hit("scope:key", 100, 60) == (True, 0.0)
+    assert redis.round_trips == 1
+
+    assert (await limiter.hit("scope:key", 100, 60))[0] is True
+    assert redis.round_trips == 2
+    assert redis.values["ratelimit:scope:key:16666"] == 20
+
+
+@pytest.mark.asyncio
+async def test_key_over_its_limit_gets_429_with_retry_after(clock, redis):
+    limiter = RateLimiter()
+    request = Request({"type": "http", "method": "POST", "path": "/", "headers": [], "client": ("10.0.0.1", 1),
+                       "state": {}})
+
+    await limiter.check(request, "clients.create", "2/minute")
+    await limiter.check(request, "clients.create", "2/minute")
+    clock[0] += 15
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.check(request, "clients.create", "2/minute")
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "45"  # The window started 15 s ago
+
+    # Blocked locally until the window ends, without asking Redis
+    round_trips = redis.round_trips
+    with pytest.raises(HTTPException):
+        await limiter.check(request, "clients.create", "2/minute")
+    assert redis.round_trips == round_trips
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_a_local_window_when_redis_is_down(clock, monkeypatch):
+    monkeypatch.setattr(cache, "enabled", True)
+    monkeypatch.setattr(cache, "_client", FakeRedis(fail=True))
+    limiter = RateLimiter()
+
+    assert [(await limiter.hit("scope:key", 3, 60))[0] for _ in range(4)] == [True, True, True, False]
+
+    clock[0] += 60  # Next window
+    assert (await limiter.hit("scope:key", 3, 60))[0] is True
+
+
+@pytest.mark.asyncio
+async def test_buckets_of_past_windows_are_pruned(clock, redis):
+    limiter = RateLimiter(max_local_keys=4)
+
+    for n in range(4):
+        await limiter.hit(f"scope:old{n}", 100, 60)  # Each leaves 9 unspent tokens
+    clock[0] += 60
+    await limiter.hit("scope:new", 100, 60)
+
+    assert list(limiter._buckets) == ["scope:new"]
+
+    # Live buckets over the cap: the oldest leases go, down to half the cap
+    for n in range(5):
+        await limiter.hit(f"scope:live{n}", 100, 60)
+    assert len(limiter._buckets) <= 4
+    assert "scope:live4" in limiter._buckets
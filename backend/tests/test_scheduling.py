@@ -0,0 +1,64 @@
+"""
+Tests for crew double-booking detection (app.services.scheduling_service).
+"""
+
+import inspect
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.production_crew import add_crew_member, add_crew_members_bulk
+from app.api.v1.endpoints.productions import update_production
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.schemas.production import ProductionUpdate
+from app.services.production_service import sync_shooting_sessions
+from app.services.scheduling_service import find_crew_conflicts
+
+
+@pytest.mark.asyncio
+async def test_crew_conflicts_are_found_in_one_statement(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    other = Production(title="Wedding", organization_id=admin.organization_id)
+    db.add(other)
+    await db.flush()
+    db.add(ProductionCrew(production_id=other.id, user_id=admin.id, role="camera", fee=100))
+    await sync_shooting_sessions(production_id, admin.organization_id, [{"date": "2026-05-01"}], db)
+    await sync_shooting_sessions(other.id, admin.organization_id, [
+        {"date": "2026-05-01", "location": "Church"}, {"date": "2026-05-03"}
+    ], db)
+    await db.flush()
+    counter.reset()
+
+    conflicts = await find_crew_conflicts(db, admin.organization_id, production_id, [admin.id])
+
+    # stored sessions of the production, then every member's overlapping bookings
+    assert counter.count == 2
+    assert [(c["production_id"], c["location"], c["starts_at"]) for c in conflicts] == [
+        (other.id, "Church", datetime(2026, 5, 1))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crew_assignments_reject_double_booking_by_default(db_setup):
+    db, counter, admin, production_id = db_setup
+    for endpoint in (update_production, add_crew_member, add_crew_members_bulk):
+        assert inspect.signature(endpoint).parameters["reject_conflicts"].default.default is True
+
+    other = Production(title="Wedding", organization_id=admin.organization_id)
+    db.add(other)
+    await db.flush()
+    db.add(ProductionCrew(production_id=other.id, user_id=admin.id, role="camera", fee=100))
+    await sync_shooting_sessions(other.id, admin.organization_id, [{"date": "2026-05-01"}], db)
+    await db.commit()
+
+    # Full update whose crew is booked elsewhere on the same day
+    update = ProductionUpdate(
+        shooting_sessions=[{"date": "2026-05-01"}],
+        crew=[{"user_id": str(admin.id), "role": "director", "fee": 300}]
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await update_production(production_id, update, True, admin, db, {})
+    assert exc_info.value.status_code == 409
@@ -0,0 +1,19 @@
+"""
+Tests for the search service (app.services.search_service).
+"""
+
+import pytest
+
+from app.services import search_service
+
+
+@pytest.mark.asyncio
+async def test_search_is_a_single_statement(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    results = await search_service.search(db, "shoo", admin.organization_id)
+    assert counter.count == 1
+    assert [(result["type"], result["id"]) for result in results] == [("production", production_id)]
+
+    assert await search_service.search(db, "shoo", admin.organization_id + 1) == []
+    assert [result["type"] for result in await search_service.search(db, "clie", admin.organization_id)] == ["client"]
@@ -0,0 +1,74 @@
+"""
+Tests for the slow query log (app.core.slow_queries).
+"""
+
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from starlette.requests import Request
+
+from app.core import slow_queries
+from app.core.config import settings
+
+
+def test_slow_statements_are_recorded_with_request_context_and_parameter_shapes(monkeypatch):
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+    engine = create_engine("sqlite://")
+    slow_queries.install(engine)
+    slow_queries.clear()
+
+    request = Request({
+        "type": "http", "method": "GET", "path": "/api/v1/dashboard/", "headers": [],
+        "route": SimpleNamespace(path="/api/v1/dashboard/"),
+        "state": {"profile": SimpleNamespace(organization_id=42)},
+    })
+    token = slow_queries.current_request.set(request)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :name AS name, :amount AS amount"), {"name": "secret", "amount": 10})
+    finally:
+        slow_queries.current_request.reset(token)
+
+    [entry] = slow_queries.recent(10)
+    assert entry["route"] == "GET /api/v1/dashboard/"
+    assert entry["organization_id"] == 42
+    assert entry["parameters"] == ["str", "int"]
+    assert "secret" not in str(entry)
+    assert entry["explain"] is None  # EXPLAIN only runs on Postgres
+
+
+def test_only_read_only_statements_are_explained():
+    assert slow_queries._is_read_only("SELECT * FROM services WHERE organization_id = $1")
+    assert slow_queries._is_read_only("WITH t AS (SELECT 1) SELECT * FROM t")
+    assert not slow_queries._is_read_only("WITH t AS (DELETE FROM services RETURNING id) SELECT * FROM t")
+    assert not slow_queries._is_read_only("UPDATE services SET value = $1")
+
+
+def test_explain_uses_the_generic_plan_without_parameter_values():
+    executed = []
+
+    class Cursor:
+        def execute(self, statement, parameters=None):
+            assert parameters is None
+            executed.append(statement)
+
+        def fetchall(self):
+            return [("Index Scan using ix_services_org on services",), ("  Index Cond: (organization_id = $1)",)]
+
+        def close(self):
+            pass
+
+    connection = SimpleNamespace(connection=SimpleNamespace(cursor=Cursor))
+    statement = "SELECT * FROM services WHERE organization_id = $1 AND name = $2"
+    plan = slow_queries._explain(connection, statement)
+
+    assert plan.endswith("Index Cond: (organization_id = $1)")
+    assert executed == [
+        "SAVEPOINT slow_query_explain",
+        "SET LOCAL plan_cache_mode = force_generic_plan",
+        f"PREPARE slow_query_explain AS {statement}",
+        "EXPLAIN EXECUTE slow_query_explain(NULL, NULL)",
+        "ROLLBACK TO SAVEPOINT slow_query_explain",
+        "RELEASE SAVEPOINT slow_query_explain",
+        "DEALLOCATE slow_query_explain",
+    ]
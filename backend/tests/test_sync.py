@@ -0,0 +1,83 @@
+"""
+Tests for the productions delta sync (app.services.sync_service).
+"""
+
+import pytest
+
+from app.api.v1.endpoints.production_crew import remove_crew_member
+from app.api.v1.endpoints.productions import delete_production
+from app.models.production import Production
+from app.models.production_crew import ProductionCrew
+from app.models.user import Profile
+from app.services.sync_service import ChangesToken, production_changes
+
+
+@pytest.mark.asyncio
+async def test_production_changes_since_token(db_setup):
+    db, counter, admin, production_id = db_setup
+
+    full = await production_changes(db, admin.organization_id, None, limit=50)
+    assert [production["id"] for production in full["changes"]] == [production_id]
+    assert full["deleted"] == [] and full["has_more"] is False
+
+    since = ChangesToken.decode(full["next_token"])
+    await delete_production(production_id, admin, db)
+
+    delta = await production_changes(db, admin.organization_id, since, limit=50)
+    assert delta["changes"] == []
+    assert delta["deleted"] == [production_id]
+
+
+async def _add_crew_member(db, admin, production_id):
+    crew = Profile(full_name="Crew", organization_id=admin.organization_id, role="user")
+    db.add(crew)
+    await db.flush()
+    db.add(ProductionCrew(production_id=production_id, user_id=crew.id, role="camera", fee=200))
+    await db.commit()
+    return crew
+
+
+@pytest.mark.asyncio
+async def test_removed_crew_member_gets_production_as_deleted(db_setup):
+    db, counter, admin, production_id = db_setup
+    crew = await _add_crew_member(db, admin, production_id)
+
+    full = await production_changes(db, admin.organization_id, None, limit=50, crew_profile_id=crew.id)
+    assert [production["id"] for production in full["changes"]] == [production_id]
+    since = ChangesToken.decode(full["next_token"])
+
+    await remove_crew_member(production_id, crew.id, admin, db)
+
+    delta = await production_changes(db, admin.organization_id, since, limit=50, crew_profile_id=crew.id)
+    assert delta["deleted"] == [production_id]
+    # The production still exists for the organization
+    admin_delta = await production_changes(db, admin.organization_id, since, limit=50)
+    assert admin_delta["deleted"] == []
+
+    # Assigned again: no longer reported as deleted
+    db.add(ProductionCrew(production_id=production_id, user_id=crew.id, role="camera", fee=200))
+    await db.commit()
+    delta = await production_changes(db, admin.organization_id, since, limit=50, crew_profile_id=crew.id)
+    assert delta["deleted"] == []
+
+
+@pytest.mark.asyncio
+async def test_crew_member_only_gets_deletions_of_assigned_productions(db_setup):
+    db, counter, admin, production_id = db_setup
+    crew = await _add_crew_member(db, admin, production_id)
+    other = Production(title="Other", organization_id=admin.organization_id)
+    db.add(other)
+    await db.commit()
+
+    full = await production_changes(db, admin.organization_id, None, limit=50, crew_profile_id=crew.id)
+    since = ChangesToken.decode(full["next_token"])
+
+    await delete_production(other.id, admin, db)
+    delta = await production_changes(db, admin.organization_id, since, limit=50, crew_profile_id=crew.id)
+    assert delta["deleted"] == []
+    admin_delta = await production_changes(db, admin.organization_id, since, limit=50)
+    assert admin_delta["deleted"] == [other.id]
+
+    await delete_production(production_id, admin, db)
+    delta = await production_changes(db, admin.organization_id, since, limit=50, crew_profile_id=crew.id)
+    assert delta["deleted"] == [production_id]